@@ -0,0 +1,143 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+from pathlib import Path
+
+import yaml
+
+from pynyaa import Category, NyaaRelease, Submitter, TorrentFile
+from pynyaa._utils import make_magnet
+
+CASSETTES = Path(__file__).parent.parent / "tests" / "cassettes" / "test_sync"
+
+TRACKERS = (
+    "http://nyaa.tracker.wf:7777/announce",
+    "udp://open.stealth.si:80/announce",
+    "udp://tracker.opentrackr.org:1337/announce",
+    "udp://exodus.desync.com:6969/announce",
+    "udp://tracker.torrent.eu.org:451/announce",
+)
+
+
+def make_releases(count: int, *, with_data: bool = True) -> list[NyaaRelease]:
+    submitters = [
+        Submitter(name=f"user{i}", url=f"https://nyaa.si/user/user{i}", is_trusted=i % 2 == 0, is_banned=False)
+        for i in range(100)
+    ]
+    data = b"d4:infod6:lengthi1e4:name1:a12:piece lengthi16384e6:pieces20:" + bytes(20) + b"ee" if with_data else None
+    return [
+        NyaaRelease(
+            id=id,
+            url=f"https://nyaa.si/view/{id}",
+            title=f"[Group] Some Show - {id:05} (1080p) [ABCDEF12].mkv",
+            category=Category.ANIME_ENGLISH_TRANSLATED,
+            submitter=submitters[id % 100],
+            datetime=dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc) + dt.timedelta(minutes=id),
+            information="https://example.com",
+            seeders=id % 500,
+            leechers=id % 50,
+            completed=id * 3,
+            is_trusted=False,
+            is_remake=False,
+            torrent=TorrentFile(
+                name=f"{id}.torrent",
+                data=data,
+                size=1_000_000 + id,
+                infohash=f"{id:040x}",
+                url=f"https://nyaa.si/download/{id}.torrent",
+                magnet=make_magnet(f"{id:040x}", f"[Group] Some Show - {id:05} (1080p) [ABCDEF12].mkv", TRACKERS),
+            ),
+            description=f"Release notes for {id}.\n" * 5,
+        )
+        for id in range(count)
+    ]
+
+
+def load_page(cassette: str, url: str) -> str:
+    """Return the decoded body recorded for `url` in one of the test cassettes."""
+    interactions = yaml.safe_load((CASSETTES / cassette).read_text(encoding="utf-8"))["interactions"]
+    for interaction in interactions:
+        if interaction["request"]["uri"] == url:
+            response = interaction["response"]
+            body: bytes = response["body"]["string"]
+            if "gzip" in response["headers"].get("Content-Encoding", ()):
+                body = gzip.decompress(body)
+            return body.decode()
+    msg = f"{url!r} is not recorded in {cassette!r}"
+    raise LookupError(msg)
+
+
+SEARCH_ROW = """\
+<tr class="{status}">
+	<td>
+		<a href="/?c=1_2" title="Anime - English-translated">
+			<img src="/static/img/icons/nyaa/1_2.png" alt="Anime - English-translated" class="category-icon">
+		</a>
+	</td>
+	<td colspan="2">
+		<a href="/view/{id}#comments" class="comments" title="{comments} comments">
+			<i class="fa fa-comments-o"></i>{comments}</a>
+		<a href="/view/{id}" title="{title}">{title}</a>
+	</td>
+	<td class="text-center">
+		<a href="/download/{id}.torrent"><i class="fa fa-fw fa-download"></i></a>
+		<a href="{magnet}"><i class="fa fa-fw fa-magnet"></i></a>
+	</td>
+	<td class="text-center">{size}</td>
+	<td class="text-center" data-timestamp="{timestamp}">{date}</td>
+	<td class="text-center">{seeders}</td>
+	<td class="text-center">{leechers}</td>
+	<td class="text-center">{completed}</td>
+</tr>
+"""
+
+
+def make_search_page(
+    rows: int, *, first_id: int = 1_000_000, page: int = 1, pages: int = 1, minified: bool = False
+) -> bytes:
+    """Build a search result page in Nyaa's markup, newest release first."""
+    body = []
+    for offset in range(rows):
+        id = first_id - offset
+        title = f"[Group] Some Show - {id:05} (1080p) [ABCDEF12].mkv"
+        timestamp = 1_700_000_000 + id
+        body.append(
+            SEARCH_ROW.format(
+                status=("default", "success", "danger")[id % 3],
+                id=id,
+                comments=id % 7,
+                title=title,
+                magnet=make_magnet(f"{id:040x}", title, TRACKERS).replace("&", "&amp;"),
+                size=f"{id % 1000}.{id % 10} MiB",
+                timestamp=timestamp,
+                date=dt.datetime.fromtimestamp(timestamp, tz=dt.timezone.utc).strftime("%Y-%m-%d %H:%M"),
+                seeders=id % 500,
+                leechers=id % 50,
+                completed=id % 5000,
+            )
+        )
+    pagination = "".join(
+        f'<li class="active"><a>{number}</a></li>\n'
+        if number == page
+        else f'<li><a href="/?p={number}">{number}</a></li>\n'
+        for number in range(1, pages + 1)
+    )
+    if page < pages:
+        pagination += f'<li class="next"><a href="/?p={page + 1}">&raquo;</a></li>\n'
+
+    html = (
+        '<!DOCTYPE html>\n<html lang="en">\n<head><title>Browse :: Nyaa</title></head>\n<body>\n'
+        '<div class="container">\n<div class="table-responsive">\n'
+        '<table class="table table-bordered table-hover table-striped torrent-list">\n'
+        "<thead>\n<tr>\n<th>Category</th>\n<th>Name</th>\n<th>Link</th>\n<th>Size</th>\n<th>Date</th>\n"
+        "<th>Seeders</th>\n<th>Leechers</th>\n<th>Completed</th>\n</tr>\n</thead>\n<tbody>\n"
+        f"{''.join(body)}</tbody>\n</table>\n</div>\n"
+        f'<div class="center"><nav><ul class="pagination">\n{pagination}</ul></nav></div>\n'
+        "</div>\n</body>\n</html>\n"
+    )
+    if minified:
+        html = "".join(line.strip() for line in html.splitlines())
+    return html.encode()
@@ -0,0 +1,93 @@
+"""
+Compare refreshing the counters of releases from a local HTTP server with httpx's default connection pool
+against the pool `AsyncNyaa` builds from `max_connections` and `keepalive_expiry`.
+
+The server runs in its own process and delays each new connection by `HANDSHAKE` seconds
+and each response by `LATENCY` seconds, standing in for the TCP and TLS handshakes
+and the round trip to a remote host. It is HTTP/1.1 only, so `http2=True` is not measured here.
+With httpx's defaults, only 20 idle connections are kept, so a concurrent batch larger than that
+reopens connections every time. Far above that, with many connections open at once, bookkeeping in httpx's
+connection pool rather than the network becomes the bottleneck, and `http2=True` is the better option.
+
+Usage: python benchmarks/connection_pool.py [releases] [concurrency]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+from _common import load_page, make_releases
+
+from pynyaa import AsyncNyaa, NyaaRelease
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from multiprocessing.connection import Connection
+    from multiprocessing.sharedctypes import Synchronized
+
+HANDSHAKE = 0.15
+LATENCY = 0.1
+
+
+def serve(address: Connection, connections: Synchronized[int]) -> None:
+    release_page = load_page("test_nyaa_default.yaml", "https://nyaa.si/view/1755409").encode()
+    response = b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(release_page), release_page)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        connections.value += 1
+        await asyncio.sleep(HANDSHAKE)
+        # Requests on a kept-alive connection are answered until the client closes it.
+        while True:
+            try:
+                await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, ConnectionError):
+                break
+            await asyncio.sleep(LATENCY)
+            writer.write(response)
+            await writer.drain()
+        writer.close()
+
+    async def main() -> None:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        address.send(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def refresh(nyaa: AsyncNyaa, releases: list[NyaaRelease], concurrency: int) -> float:
+    start = time.perf_counter()
+    async with nyaa:
+        async for _ in nyaa.refresh(releases, concurrency=concurrency):
+            pass
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    releases = make_releases(int(sys.argv[1]) if len(sys.argv) > 1 else 1000, with_data=False)
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32  # noqa: PLR2004
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    connections = multiprocessing.Value("i", 0, lock=False)
+    server = multiprocessing.Process(target=serve, args=(sender, connections), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{receiver.recv()}/"
+    print(f"Refreshing {len(releases):,} releases from {base_url} with concurrency={concurrency}\n")
+
+    clients: dict[str, Callable[[], AsyncNyaa]] = {
+        "httpx defaults": lambda: AsyncNyaa(base_url=base_url, client=httpx.AsyncClient()),
+        f"max_connections={concurrency}": lambda: AsyncNyaa(base_url=base_url, max_connections=concurrency),
+    }
+    for label, make in clients.items():
+        connections.value = 0
+        elapsed = asyncio.run(refresh(make(), releases, concurrency))
+        print(f"{label:<24} {len(releases) / elapsed:8.1f} releases/s  {connections.value:6,} connections opened")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compare the parse cost of an eager `NyaaRelease` against a `LazyRelease`
+when only the title and magnet link are read.
+
+Usage: python benchmarks/lazy.py [count]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from _common import load_page
+
+from pynyaa import LazyRelease
+from pynyaa._models import TorrentSource
+from pynyaa._parser import TorrentFragmentParser, TorrentPageParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+BASE_URL = "https://nyaa.si/"
+URL = "https://nyaa.si/view/1755409"
+
+
+def eager(html: str) -> tuple[str, str]:
+    # Everything `Nyaa.get` parses for a regular release.
+    parsed = TorrentPageParser(html=html, base_url=BASE_URL)
+    panel = parsed.panel
+    panel.category(), panel.datetime(), panel.submitter(), panel.information()
+    panel.seeders(), panel.leechers(), panel.completed(), panel.size(), panel.infohash()
+    parsed.is_trusted(), parsed.is_remake(), parsed.description(), parsed.file_list()
+    return panel.title(), panel.magnet()
+
+
+def lazy_release(html: str) -> LazyRelease:
+    return LazyRelease(
+        id=1755409,
+        url=URL,
+        page=TorrentFragmentParser(html=html, base_url=BASE_URL),
+        torrent=TorrentSource(name="1755409.torrent", data=None, url=f"{BASE_URL}download/1755409.torrent"),
+    )
+
+
+def lazy(html: str) -> tuple[str, str]:
+    release = lazy_release(html)
+    return release.title, release.torrent.magnet
+
+
+def lazy_all(html: str) -> object:
+    return lazy_release(html).to_release()
+
+
+def measure(label: str, func: Callable[[str], object], html: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func(html)
+    elapsed = (time.perf_counter() - start) / count
+    print(f"{label:<40} {elapsed * 1e3:8.3f} ms/release")
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    html = load_page("test_nyaa_default.yaml", URL)
+    print(f"Parsing a {len(html):,} character release page {count:,} times\n")
+
+    baseline = measure("eager (every field)", eager, html, count)
+    for label, func in (("lazy (title + magnet)", lazy), ("lazy (every field)", lazy_all)):
+        elapsed = measure(label, func, html, count)
+        print(f"{'':<40} {1 - elapsed / baseline:8.1%} less CPU")
+
+
+if __name__ == "__main__":
+    main()
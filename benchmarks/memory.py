@@ -0,0 +1,45 @@
+"""
+Measure the memory held per cached release with `tracemalloc`,
+comparing `NyaaRelease` against `CompactRelease`.
+
+Usage: python benchmarks/memory.py [count]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+
+from _common import make_releases
+
+from pynyaa import CompactRelease
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Caching {count:,} releases (torrent data excluded)\n")
+
+    tracemalloc.start()
+
+    before = tracemalloc.get_traced_memory()[0]
+    releases = {release.id: release for release in make_releases(count, with_data=False)}
+    full = tracemalloc.get_traced_memory()[0] - before
+
+    compact = {
+        id: CompactRelease.from_release(release, base_url="https://nyaa.si/") for id, release in releases.items()
+    }
+    del releases
+    gc.collect()
+    compacted = tracemalloc.get_traced_memory()[0] - before
+
+    tracemalloc.stop()
+
+    print(f"{'NyaaRelease':<20} {full / count:8.0f} bytes/release {full / 2**20:10.1f} MiB")
+    print(f"{'CompactRelease':<20} {compacted / count:8.0f} bytes/release {compacted / 2**20:10.1f} MiB")
+    print(f"{'':<20} {1 - compacted / full:8.1%} smaller")
+    assert len(compact) == count
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure release page parsing throughput and event loop stalls when parsing inline
+versus in a `ProcessPoolExecutor`, as done by `AsyncNyaa(parse_executor=...)`.
+
+Usage: python benchmarks/parse_pool.py [pages]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from _common import load_page
+
+from pynyaa._parser import parse_torrent_page
+
+BASE_URL = "https://nyaa.si/"
+
+
+async def heartbeat(stop: asyncio.Event) -> float:
+    """Return the longest time the event loop went without running this task."""
+    worst = 0.0
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        worst = max(worst, now - last)
+        last = now
+    return worst
+
+
+async def crawl(html: str, pages: int, executor: Executor | None) -> tuple[float, float]:
+    async def parse() -> None:
+        if executor is None:
+            parse_torrent_page(html, BASE_URL)
+        else:
+            await asyncio.wrap_future(executor.submit(parse_torrent_page, html, BASE_URL))
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(heartbeat(stop))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await asyncio.gather(*(parse() for _ in range(pages)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    return pages / elapsed, await monitor
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    html = load_page("test_nyaa_default.yaml", "https://nyaa.si/view/1755409")
+    print(f"Parsing {pages:,} release pages\n")
+
+    throughput, stall = asyncio.run(crawl(html, pages, None))
+    print(f"{'inline':<20} {throughput:8.1f} pages/s   worst loop stall {stall * 1e3:8.1f} ms")
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            asyncio.run(crawl(html, workers, executor))  # Warm up the worker processes
+            throughput, stall = asyncio.run(crawl(html, pages, executor))
+        label = f"{workers} process(es)"
+        print(f"{label:<20} {throughput:8.1f} pages/s   worst loop stall {stall * 1e3:8.1f} ms")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Measure the memory held while iterating a 100-page search, served from a local
+mock transport with 75 results per page.
+
+Usage: python benchmarks/search_memory.py [pages]
+"""
+
+from __future__ import annotations
+
+import sys
+import tracemalloc
+
+import httpx
+from _common import load_page, make_search_page
+
+from pynyaa import Nyaa
+
+ROWS = 75
+
+
+def transport(pages: int) -> httpx.MockTransport:
+    release_page = load_page("test_nyaa_default.yaml", "https://nyaa.si/view/1755409").encode()
+    headers = {"Content-Disposition": "inline; filename*=UTF-8''release.torrent"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/view/"):
+            return httpx.Response(200, content=release_page)
+        if path.startswith("/download/"):
+            return httpx.Response(200, content=b"d4:infod4:name1:aee", headers=headers)
+        page = int(request.url.params.get("p", 1))
+        return httpx.Response(
+            200, content=make_search_page(ROWS, first_id=1_000_000 - page * ROWS, page=page, pages=pages)
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"Iterating a {pages}-page search ({pages * ROWS:,} results, lazy releases)\n")
+
+    with Nyaa(client=httpx.Client(transport=transport(pages))) as nyaa:
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        held = []
+        count = 0
+        for _ in nyaa.search("query", lazy=True):
+            count += 1
+            if count % ROWS == 0:
+                held.append(tracemalloc.get_traced_memory()[0] - baseline)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        tracemalloc.stop()
+
+    assert count == pages * ROWS, count
+    print(f"{'held between releases (mean)':<32} {sum(held) / len(held) / 2**20:8.2f} MiB")
+    print(f"{'held between releases (max)':<32} {max(held) / 2**20:8.2f} MiB")
+    print(f"{'peak':<32} {peak / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
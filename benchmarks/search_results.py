@@ -0,0 +1,54 @@
+"""
+Compare result ID extraction in `SearchPageParser` against the previous
+unanchored regex, on a regular 75-row page and a synthetic 10,000-row page,
+each both as served and minified.
+
+The two are timed in alternating rounds, and the best round of each is reported,
+so that noise from other processes affects both alike.
+
+Usage: python benchmarks/search_results.py
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import timeit
+
+from _common import make_search_page
+
+from pynyaa._parser import _result_ids
+
+ROUNDS = 20
+
+
+def previous(html: bytes) -> tuple[int, ...]:
+    return tuple(int(id) for id in re.findall(rb"<a href=\"(?:/view/(\d+))\" title=\".*\">.*</a>", html))
+
+
+def current(html: bytes) -> tuple[int, ...]:
+    return _result_ids(html)
+
+
+def measure(label: str, html: bytes, number: int) -> None:
+    print(label)
+    funcs = {"previous regex": previous, "SearchPageParser": current}
+    best = dict.fromkeys(funcs, math.inf)
+    for _ in range(ROUNDS):
+        for name, func in funcs.items():
+            elapsed = min(timeit.repeat(lambda func=func: func(html), number=number, repeat=3)) / number  # type: ignore[misc]
+            best[name] = min(best[name], elapsed)
+    baseline = best["previous regex"]
+    for name, func in funcs.items():
+        print(f"  {name:<20} {best[name] * 1e3:8.3f} ms  {len(func(html)):6,} IDs  {baseline / best[name]:5.2f}x")
+
+
+def main() -> None:
+    for rows, number in ((75, 500), (10_000, 5)):
+        for minified in (False, True):
+            html = make_search_page(rows, minified=minified)
+            measure(f"{rows:,} rows{' (minified)' if minified else ''}, {len(html):,} bytes", html, number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare filtering search results after fetching them against filtering with `where`,
+on a 10-page search served from a local mock transport with 75 results per page.
+
+Usage: python benchmarks/search_where.py [pages]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import httpx
+from _common import load_page, make_search_page
+
+from pynyaa import Nyaa, SearchResult
+
+ROWS = 75
+MIN_SEEDERS = 450
+
+
+def transport(pages: int, requests: list[str]) -> httpx.MockTransport:
+    release_page = load_page("test_nyaa_default.yaml", "https://nyaa.si/view/1755409").encode()
+    headers = {"Content-Disposition": "inline; filename*=UTF-8''release.torrent"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        requests.append(path)
+        if path.startswith("/view/"):
+            return httpx.Response(200, content=release_page)
+        if path.startswith("/download/"):
+            return httpx.Response(200, content=b"d4:infod4:name1:aee", headers=headers)
+        page = int(request.url.params.get("p", 1))
+        return httpx.Response(
+            200, content=make_search_page(ROWS, first_id=1_000_000 - page * ROWS, page=page, pages=pages)
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def well_seeded(result: SearchResult) -> bool:
+    return result.seeders >= MIN_SEEDERS
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"Searching {pages} pages of {ROWS} results for releases with at least {MIN_SEEDERS} seeders\n")
+
+    # The mock release page is the same for every release, so the seeder count the listing
+    # shows for each ID (`id % 500`, see `make_search_page`) stands in for the fetched one.
+    def after(nyaa: Nyaa) -> list[int]:
+        return [release.id for release in nyaa.search("query") if release.id % 500 >= MIN_SEEDERS]
+
+    def pushed_down(nyaa: Nyaa) -> list[int]:
+        return [release.id for release in nyaa.search("query", where=well_seeded)]
+
+    for label, run in (("filter after get()", after), ("where=", pushed_down)):
+        requests: list[str] = []
+        with Nyaa(client=httpx.Client(transport=transport(pages, requests))) as nyaa:
+            start = time.perf_counter()
+            kept = run(nyaa)
+            elapsed = time.perf_counter() - start
+        details = sum(path.startswith("/view/") for path in requests)
+        print(f"{label:<20} {elapsed:7.3f}s  {details:5,} release pages fetched  {len(kept):5,} releases")
+
+
+if __name__ == "__main__":
+    main()
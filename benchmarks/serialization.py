@@ -0,0 +1,64 @@
+"""
+Compare `NyaaRelease.to_dict()` + `json` against `dataclasses.asdict()` + `json.dumps()`.
+
+Usage: python benchmarks/serialization.py [count]
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import datetime as dt
+import io
+import json
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from _common import make_releases
+
+from pynyaa import Category, NyaaRelease, dump_jsonl, load_jsonl
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def baseline_default(obj: object) -> Any:
+    if isinstance(obj, dt.datetime):
+        return obj.isoformat()
+    if isinstance(obj, Category):
+        return obj.id
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError(obj)  # pragma: no cover
+
+
+def measure(label: str, func: Callable[..., object], *args: Any, **kwargs: Any) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s")
+    return elapsed
+
+
+def asdict_json(releases: list[NyaaRelease]) -> list[str]:
+    return [json.dumps(dataclasses.asdict(release), default=baseline_default) for release in releases]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    releases = make_releases(count)
+    print(f"Serializing {count:,} releases\n")
+
+    baseline = measure("asdict + json.dumps", asdict_json, releases)
+    for mode in ("base64", "exclude"):
+        buffer = io.StringIO()
+        elapsed = measure(f"dump_jsonl (torrent_data={mode!r})", dump_jsonl, releases, buffer, torrent_data=mode)
+        print(f"{'':<40} {baseline / elapsed:8.1f}x faster")
+
+    buffer.seek(0)
+    measure("load_jsonl", lambda: list(load_jsonl(buffer)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measure `Nyaa.get_many` throughput with a growing thread pool, with and without the GIL.
+
+Pages are served from a local mock transport, so the run is bound by parsing, which only
+spreads across cores on a free-threaded build of CPython (3.13t and later). On such a build,
+the script runs once with the GIL disabled and once with it re-enabled through `PYTHON_GIL=1`.
+Elsewhere, it runs once, with the GIL.
+
+Usage: python benchmarks/threads.py [releases]
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import sysconfig
+import time
+
+import httpx
+from _common import load_page
+
+from pynyaa import Nyaa
+
+
+def transport() -> httpx.MockTransport:
+    release_page = load_page("test_nyaa_default.yaml", "https://nyaa.si/view/1755409").encode()
+    headers = {"Content-Disposition": "inline; filename*=UTF-8''release.torrent"}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/download/"):
+            return httpx.Response(200, content=b"d4:infod4:name1:aee", headers=headers)
+        return httpx.Response(200, content=release_page)
+
+    return httpx.MockTransport(handler)
+
+
+def run(releases: int) -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+    threads = 1
+    while threads <= (os.cpu_count() or 1) * 2:
+        with Nyaa(client=httpx.Client(transport=transport())) as nyaa:
+            start = time.perf_counter()
+            for _ in nyaa.get_many(range(1, releases + 1), concurrency=threads):
+                pass
+            elapsed = time.perf_counter() - start
+        print(f"{threads:>3} thread(s) {releases / elapsed:10.1f} releases/s")
+        threads *= 2
+
+
+def main() -> None:
+    releases = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    print(f"Fetching and parsing {releases:,} releases\n")
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        run(releases)
+        return
+    for gil in ("0", "1"):
+        subprocess.run(
+            (sys.executable, __file__, "--run", str(releases)), env={**os.environ, "PYTHON_GIL": gil}, check=True
+        )
+        print()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run(int(sys.argv[2]))
+    else:
+        main()
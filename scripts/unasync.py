@@ -9,14 +9,26 @@ SUBS = {
     "https://www.python-httpx.org/api/#asyncclient": "https://www.python-httpx.org/api/#client",
     "AsyncClient": "Client",
     "AsyncIterator": "Iterator",
+    "AsyncGenerator": "Generator",
     "async def": "def",
     "async with": "with",
     "async for": "for",
+    "await asyncio.wrap_future(future)": "future.result()",
+    "await asyncio.gather(*": "tuple(",
+    "await agather(*": "tuple(",
     "await ": "",
     "aclose()": "close()",
+    "aclosing": "closing",
+    "StopAsyncIteration": "StopIteration",
+    "anext(": "next(",
+    "aiter_bytes": "iter_bytes",
     "__aenter__": "__enter__",
     "__aexit__": "__exit__",
     "asyncio.gather": "",
+    "import asyncio": "import threading",
+    "asyncio.Semaphore": "threading.Semaphore",
+    "amap_ordered": "map_ordered",
+    "arun_blocking": "run_blocking",
 }
 
 
@@ -6,9 +6,27 @@ from typing import TYPE_CHECKING, Final
 
 from ._aclient import AsyncNyaa
 from ._client import Nyaa
+from ._columnar import ReleaseCollector
 from ._enums import Category, Filter, Order, ParentCategory, SortBy
-from ._errors import ParsingError, PyNyaaError, ReleaseNotFoundError
-from ._models import NyaaRelease, Submitter, TorrentFile
+from ._errors import ParsingError, PyNyaaError, ReleaseNotFoundError, UserNotFoundError
+from ._models import (
+    CompactRelease,
+    FileEntry,
+    Folder,
+    LazyRelease,
+    NyaaRelease,
+    ReleaseMagnet,
+    ReleaseStats,
+    SearchResult,
+    SearchStats,
+    Submitter,
+    TorrentDataFormat,
+    TorrentFile,
+    TransferStats,
+)
+from ._serialization import dump_jsonl, dump_msgpack, load_jsonl, load_msgpack
+from ._store import TorrentStore
+from ._utils import make_magnet
 from ._version import __version__
 
 if TYPE_CHECKING:
@@ -43,18 +61,36 @@ def search(
 __all__: Final = (
     "AsyncNyaa",
     "Category",
+    "CompactRelease",
+    "FileEntry",
     "Filter",
+    "Folder",
+    "LazyRelease",
     "Nyaa",
     "NyaaRelease",
     "Order",
     "ParentCategory",
     "ParsingError",
     "PyNyaaError",
+    "ReleaseCollector",
+    "ReleaseMagnet",
     "ReleaseNotFoundError",
+    "ReleaseStats",
+    "SearchResult",
+    "SearchStats",
     "SortBy",
     "Submitter",
+    "TorrentDataFormat",
     "TorrentFile",
+    "TorrentStore",
+    "TransferStats",
+    "UserNotFoundError",
     "__version__",
+    "dump_jsonl",
+    "dump_msgpack",
     "get",
+    "load_jsonl",
+    "load_msgpack",
+    "make_magnet",
     "search",
 )
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import mmap
+from typing import TypeAlias
+
+from ._errors import ParsingError
+
+BencodeValue: TypeAlias = int | memoryview | list["BencodeValue"] | dict[bytes, "BencodeValue"]
+"""
+A decoded bencode value.
+
+Byte strings are returned as `memoryview` slices of the input so that
+large values (such as `pieces`) are never copied. Dictionary keys are
+the only strings materialized as `bytes`, since they must be hashable.
+"""
+
+Buffer: TypeAlias = bytes | bytearray | memoryview | mmap.mmap
+"""Any object that can be decoded without copying."""
+
+_INT = ord("i")
+_LIST = ord("l")
+_DICT = ord("d")
+_END = ord("e")
+_COLON = ord(":")
+_MINUS = ord("-")
+_ZERO = ord("0")
+_NINE = ord("9")
+# Real torrents nest a few levels deep; the limit keeps hostile input from exhausting the stack.
+_MAX_DEPTH = 100
+
+
+class _Decoder:
+    """Single-pass bencode decoder operating on a `memoryview`."""
+
+    __slots__ = ("_buf", "_depth", "_end", "info")
+
+    def __init__(self, data: Buffer) -> None:
+        buf = memoryview(data)
+        if buf.ndim != 1 or buf.format != "B":  # pragma: no cover
+            buf = buf.cast("B")
+        self._buf = buf
+        self._end = len(buf)
+        self._depth = 0
+        self.info: memoryview | None = None
+
+    def _error(self, pos: int, reason: str) -> ParsingError:
+        return ParsingError(f"Invalid bencode data at offset {pos}: {reason}")
+
+    def _enter(self, pos: int) -> None:
+        self._depth += 1
+        if self._depth > _MAX_DEPTH:
+            raise self._error(pos, "nesting too deep")
+
+    def _read_int(self, pos: int, terminator: int) -> tuple[int, int]:
+        buf = self._buf
+        end = self._end
+        negative = pos < end and buf[pos] == _MINUS
+        if negative:
+            pos += 1
+
+        start = pos
+        value = 0
+        while pos < end and _ZERO <= (char := buf[pos]) <= _NINE:
+            value = value * 10 + (char - _ZERO)
+            pos += 1
+
+        if pos == start or pos >= end or buf[pos] != terminator:
+            raise self._error(pos, "malformed integer")
+        if buf[start] == _ZERO and (pos - start > 1 or negative):
+            raise self._error(start, "integer with leading zero")
+
+        return (-value if negative else value), pos + 1
+
+    def _read_bytes(self, pos: int) -> tuple[memoryview, int]:
+        length, pos = self._read_int(pos, _COLON)
+        stop = pos + length
+        if length < 0 or stop > self._end:
+            raise self._error(pos, "string length out of bounds")
+        return self._buf[pos:stop], stop
+
+    def decode(self, pos: int) -> tuple[BencodeValue, int]:
+        if pos >= self._end:
+            raise self._error(pos, "unexpected end of data")
+
+        token = self._buf[pos]
+
+        if _ZERO <= token <= _NINE:
+            return self._read_bytes(pos)
+
+        if token == _INT:
+            return self._read_int(pos + 1, _END)
+
+        if token == _LIST:
+            self._enter(pos)
+            items: list[BencodeValue] = []
+            pos += 1
+            while pos < self._end and self._buf[pos] != _END:
+                item, pos = self.decode(pos)
+                items.append(item)
+            if pos >= self._end:
+                raise self._error(pos, "unterminated list")
+            self._depth -= 1
+            return items, pos + 1
+
+        if token == _DICT:
+            self._enter(pos)
+            mapping: dict[bytes, BencodeValue] = {}
+            pos += 1
+            while pos < self._end and self._buf[pos] != _END:
+                if not (_ZERO <= self._buf[pos] <= _NINE):
+                    raise self._error(pos, "dictionary key is not a string")
+                raw_key, pos = self._read_bytes(pos)
+                key = raw_key.tobytes()
+                start = pos
+                mapping[key], pos = self.decode(pos)
+                if key == b"info" and self._depth == 1:
+                    self.info = self._buf[start:pos]
+            if pos >= self._end:
+                raise self._error(pos, "unterminated dictionary")
+            self._depth -= 1
+            return mapping, pos + 1
+
+        raise self._error(pos, f"unexpected token {chr(token)!r}")
+
+    def decode_all(self) -> BencodeValue:
+        value, pos = self.decode(0)
+        if pos != self._end:
+            raise self._error(pos, "trailing data after value")
+        return value
+
+
+def bdecode(data: Buffer) -> BencodeValue:
+    """
+    Decode a complete bencoded value.
+
+    Raises
+    ------
+    ParsingError
+        If `data` is not valid bencode, nests too deeply or has trailing bytes.
+
+    """
+    return _Decoder(data).decode_all()
+
+
+def bdecode_torrent(data: Buffer) -> tuple[dict[bytes, BencodeValue], memoryview]:
+    """
+    Decode a `.torrent` file, returning the metainfo dictionary along with
+    the raw, still-encoded bytes of its `info` dictionary (used to compute the infohash).
+
+    Raises
+    ------
+    ParsingError
+        If `data` is not valid bencode or lacks a top-level `info` dictionary.
+
+    """
+    decoder = _Decoder(data)
+    metainfo = decoder.decode_all()
+    if not isinstance(metainfo, dict) or decoder.info is None:
+        msg = "Torrent metainfo is missing the 'info' dictionary."
+        raise ParsingError(msg)
+    return metainfo, decoder.info
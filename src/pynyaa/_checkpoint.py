@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import contextlib
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Magic bytes, then the start, stop and step of the range the bitmaps cover.
+_HEADER = struct.Struct("<8sqqq")
+_MAGIC = b"PYNYAACP"
+
+
+class Checkpoint:
+    """
+    Compact on-disk record of the IDs in a range that a crawl is done with.
+
+    Each ID takes two bits: one set once its release has been handled, and one set once
+    the release turned out not to exist. A range of a million IDs takes 250 KB.
+    The file is rewritten atomically, so a crash never leaves a partial checkpoint behind.
+    """
+
+    __slots__ = ("_done", "_ids", "_missing", "_path")
+
+    def __init__(self, path: str | os.PathLike[str], ids: range) -> None:
+        self._path = Path(path)
+        self._ids = ids
+        size = (len(ids) + 7) // 8
+        try:
+            data = self._path.read_bytes()
+        except FileNotFoundError:
+            self._done = bytearray(size)
+            self._missing = bytearray(size)
+            return
+
+        if not data.startswith(_MAGIC) or len(data) < _HEADER.size:
+            msg = f"{self._path} is not a crawl checkpoint."
+            raise ValueError(msg)
+        _, start, stop, step = _HEADER.unpack_from(data)
+        if range(start, stop, step) != ids:
+            msg = f"{self._path} is a checkpoint for {range(start, stop, step)}, not {ids}."
+            raise ValueError(msg)
+        if len(data) != _HEADER.size + 2 * size:  # pragma: no cover
+            msg = f"{self._path} is truncated."
+            raise ValueError(msg)
+        self._done = bytearray(data[_HEADER.size : _HEADER.size + size])
+        self._missing = bytearray(data[_HEADER.size + size :])
+
+    def __contains__(self, id: object) -> bool:
+        if not isinstance(id, int) or id not in self._ids:
+            return False
+        index = self._ids.index(id)
+        return bool(self._done[index >> 3] >> (index & 7) & 1)
+
+    def pending(self) -> Iterator[int]:
+        """IDs in the range that are not done yet, in order."""
+        done = self._done
+        for index, id in enumerate(self._ids):
+            if not done[index >> 3] >> (index & 7) & 1:
+                yield id
+
+    def add(self, id: int, *, missing: bool = False) -> None:
+        """Record `id` as done, and as a release that does not exist if `missing` is `True`."""
+        index = self._ids.index(id)
+        self._done[index >> 3] |= 1 << (index & 7)
+        if missing:
+            self._missing[index >> 3] |= 1 << (index & 7)
+
+    def missing(self) -> Iterator[int]:
+        """IDs in the range that are recorded as not existing, in order."""
+        missing = self._missing
+        for index, id in enumerate(self._ids):
+            if missing[index >> 3] >> (index & 7) & 1:
+                yield id
+
+    def save(self) -> None:
+        """Write the checkpoint to its file, replacing the previous one atomically."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=self._path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(_HEADER.pack(_MAGIC, self._ids.start, self._ids.stop, self._ids.step))
+                file.write(self._done)
+                file.write(self._missing)
+            os.replace(temporary, self._path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(temporary)
+            raise
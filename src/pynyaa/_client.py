@@ -2,41 +2,164 @@
 # Do not edit it by hand.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-from urllib.parse import urljoin
+import dataclasses
+import heapq
+import threading
+import time
+from contextlib import closing
+from itertools import islice
+from operator import attrgetter
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Literal, TypeVar, overload
+from urllib.parse import quote, urljoin
 
 import httpx
 
+from ._checkpoint import Checkpoint
+from ._concurrency import map_ordered, run_blocking
 from ._enums import Category, Filter, Order, ParentCategory, SortBy
-from ._errors import ReleaseNotFoundError
-from ._models import NyaaRelease, TorrentFile
-from ._parser import SearchPageParser, TorrentPageParser, parse_torrent_filename
-from ._utils import assert_type
+from ._errors import ReleaseNotFoundError, UserNotFoundError
+from ._mirrors import MirrorPool
+from ._models import (
+    CompactRelease,
+    LazyRelease,
+    NyaaRelease,
+    ReleaseMagnet,
+    ReleaseStats,
+    SearchResult,
+    SearchStats,
+    Submitter,
+    TorrentSource,
+    TransferStats,
+)
+from ._parser import (
+    MAX_RESULT_PAGES,
+    MAX_RESULTS,
+    RESULTS_PER_PAGE,
+    FileListParser,
+    ReleasePageReader,
+    SearchPageParser,
+    TorrentFragmentParser,
+    TorrentID,
+    parse_release_magnet,
+    parse_release_stats,
+    parse_torrent_filename,
+    parse_torrent_page,
+)
+from ._store import PendingTorrent
+from ._utils import accept_encoding, assert_positive, assert_type, client_options, subcategories
 from ._version import __version__
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    import os
+    from collections.abc import Callable, Generator, Iterable, Iterator, Sequence
+    from concurrent.futures import Executor
 
     from typing_extensions import Self
 
+    from ._parser import PageFields
+    from ._store import TorrentStore
+
+_R = TypeVar("_R", bound=NyaaRelease | CompactRelease | SearchResult)
+
+# Number of IDs recorded between two writes of a crawl checkpoint.
+_CHECKPOINT_INTERVAL = 1000
+
 
 class Nyaa:
-    def __init__(self, *, base_url: str = "https://nyaa.si/", client: httpx.Client | None = None) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        base_url: str = "https://nyaa.si/",
+        mirrors: Sequence[str] = (),
+        client: httpx.Client | None = None,
+        torrent_store: TorrentStore | None = None,
+        parse_executor: Executor | None = None,
+        max_connections: int = 100,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+        timeout: float | httpx.Timeout | None = 5.0,
+        stream_pages: bool = False,
+    ) -> None:
         """
         Client for interacting with Nyaa.
 
+        The sync client can be shared between threads, including on free-threaded builds of CPython.
+        The async client must only be used from the thread running its event loop.
+
         Parameters
         ----------
         base_url : str, optional
             Base URL of Nyaa.
             Used to construct full URLs from relative URLs.
+        mirrors : Sequence[str], optional
+            Additional base URLs serving the same content as `base_url`, such as mirrors or local caches.
+            Each request is routed to the healthy base URL with the lowest average response time
+            relative to its current load, and is retried on the next one if a base URL fails
+            (connection error, timeout, or a 5xx or 429 response).
+            URLs in returned objects always use `base_url`, whichever base URL served them.
+            A trailing slash is added to any base URL that lacks one, so a mirror at a subpath
+            such as `https://example.com/nyaa` serves `https://example.com/nyaa/view/1`.
         client : httpx.Client, optional
             Custom [`httpx.Client`](https://www.python-httpx.org/api/#client) instance.
+        torrent_store : TorrentStore, optional
+            If given, `.torrent` files are streamed straight into this store instead of being held in memory,
+            and torrents already present in the store are not downloaded again.
+            The resulting `TorrentFile.data` is `None` and `TorrentFile.path` points into the store.
+        parse_executor : concurrent.futures.Executor, optional
+            If given, release pages are parsed in this executor instead of the calling thread.
+            With a [`ProcessPoolExecutor`][concurrent.futures.ProcessPoolExecutor] (or a
+            [`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor] on free-threaded builds),
+            the async client keeps fetching pages while earlier ones are parsed on other cores.
+            The sync client waits for each page it hands over, so the executor only pays off when
+            several threads share the client, as `get_many` does; otherwise it only adds the cost
+            of sending each page to the executor.
+            The executor is not shut down by the client. Lazy releases are always parsed on access.
+        max_connections : int, optional
+            Maximum number of open connections. All of them are kept alive between requests,
+            so `concurrency` up to this many requests never waits on, or reopens, a connection.
+            Ignored if `client` is given.
+        keepalive_expiry : float or None, optional
+            Seconds an idle connection is kept open for. `None` keeps idle connections open indefinitely.
+            Ignored if `client` is given.
+        http2 : bool, optional
+            If `True`, use HTTP/2, which multiplexes concurrent requests over a single connection per host.
+            Requires the `http2` extra (`pip install pynyaa[http2]`). Ignored if `client` is given.
+        timeout : float, httpx.Timeout or None, optional
+            Timeout in seconds. A number applies to connecting, reading and writing,
+            while waiting for a free connection in the pool never times out.
+            Pass an [`httpx.Timeout`](https://www.python-httpx.org/advanced/timeouts/) to set each phase separately,
+            or `None` to disable timeouts. Ignored if `client` is given.
+        stream_pages : bool, optional
+            If `True`, release pages are streamed and only read until everything parsed from them has been received,
+            so comments and the rest of the page are never downloaded. This saves bandwidth and time on pages with
+            long comment threads, but over HTTP/1.1 the connection a page was cut short on cannot be reused.
+
+        Raises
+        ------
+        ImportError
+            If `http2` is `True` but the `http2` extra is not installed.
 
         """
         self._base_url = base_url
+        self._mirrors = MirrorPool((base_url, *mirrors))
+        self._torrent_store = torrent_store
+        self._parse_executor = parse_executor
+        self._stream_pages = stream_pages
+        # Identical submitters are shared by every release this client returns.
+        self._submitters: dict[Submitter, Submitter] = {}
+        self._transfer_stats = TransferStats()
+        self._transfer_stats_lock = Lock()
         self._client = (
-            httpx.Client(headers={"User-Agent": f"pynyaa/{__version__} (https://pypi.org/project/pynyaa/)"})
+            httpx.Client(
+                headers={
+                    "User-Agent": f"pynyaa/{__version__} (https://pypi.org/project/pynyaa/)",
+                    "Accept-Encoding": accept_encoding(),
+                },
+                **client_options(
+                    max_connections=max_connections, keepalive_expiry=keepalive_expiry, http2=http2, timeout=timeout
+                ),
+            )
             if client is None
             else client
         )
@@ -48,6 +171,20 @@ class Nyaa:
         """
         return self._base_url
 
+    @property
+    def transfer_stats(self) -> TransferStats:
+        """
+        Sizes of the response bodies received so far, before and after decompression.
+        """
+        return self._transfer_stats
+
+    @property
+    def mirrors(self) -> tuple[str, ...]:
+        """
+        Every base URL requests are routed to, starting with `base_url`.
+        """
+        return self._mirrors.mirrors
+
     def __enter__(self) -> Self:
         return self
 
@@ -60,7 +197,16 @@ class Nyaa:
         """
         self._client.close()
 
-    def get(self, page: int | str, /) -> NyaaRelease:
+    @overload
+    def get(self, page: int | str, /, *, lazy: Literal[False] = ...) -> NyaaRelease: ...
+
+    @overload
+    def get(self, page: int | str, /, *, lazy: Literal[True]) -> LazyRelease: ...
+
+    @overload
+    def get(self, page: int | str, /, *, lazy: bool) -> NyaaRelease | LazyRelease: ...
+
+    def get(self, page: int | str, /, *, lazy: bool = False) -> NyaaRelease | LazyRelease:
         """
         Fetch metadata for a specific Nyaa release.
 
@@ -68,6 +214,9 @@ class Nyaa:
         ----------
         page : int or str
             Release ID or full URL (e.g., `123456` or `https://nyaa.si/view/123456`).
+        lazy : bool, optional
+            If `True`, return a `LazyRelease` that parses each field on first access
+            instead of parsing the whole page up front.
 
         Raises
         ------
@@ -80,62 +229,357 @@ class Nyaa:
 
         Returns
         -------
-        NyaaRelease
+        NyaaRelease or LazyRelease
             Parsed release metadata.
 
         """
-        match page:
-            case int():
-                id = page
-            case str():
-                try:
-                    id = int(page.rstrip("/").split("/")[-1])
-                except ValueError:
-                    msg = f"Invalid format for 'page'. Expected a valid URL or numeric ID, but got {page!r}."
-                    raise ValueError(msg) from None
-            case _:
-                msg = f"Parameter 'page' expected 'int' or 'str', but got {type(page).__name__!r}."
-                raise TypeError(msg)
-
+        id = _release_id(page)
         torrent_page_url = urljoin(self._base_url, f"/view/{id}")
         torrent_file_url = urljoin(self._base_url, f"/download/{id}.torrent")
 
+        if self._torrent_store is not None:
+            return self._get_stored(id, torrent_page_url, torrent_file_url, self._torrent_store, lazy=lazy)
+
         torrent_page, torrent_file = (
-            self._client.get(torrent_page_url),
-            self._client.get(torrent_file_url),
+            self._release_page(id),
+            self._request(f"download/{id}.torrent"),
         )
 
-        if httpx.codes.NOT_FOUND in (torrent_page.status_code, torrent_file.status_code):
+        if torrent_file.status_code == httpx.codes.NOT_FOUND:
             raise ReleaseNotFoundError(torrent_page_url)
-        torrent_page.raise_for_status()
         torrent_file.raise_for_status()
 
-        parsed = TorrentPageParser(html=torrent_page.text, base_url=self.base_url)
+        source = TorrentSource(
+            name=parse_torrent_filename(torrent_file.headers["Content-Disposition"]),
+            data=torrent_file.content,
+            url=torrent_file_url,
+        )
+        return self._release(id, torrent_page_url, self._parse(torrent_page, lazy=lazy), source)
+
+    def get_stats(self, page: int | str, /) -> ReleaseStats:
+        """
+        Fetch the current seeders, leechers and completed counts of a release.
+
+        Much cheaper than `get`: the `.torrent` file is not downloaded,
+        and only the three counters are read from the release page.
+
+        Parameters
+        ----------
+        page : int or str
+            Release ID or full URL (e.g., `123456` or `https://nyaa.si/view/123456`).
+
+        Raises
+        ------
+        ReleaseNotFoundError
+            If the release does not exist (HTTP 404).
+        TypeError
+            If `page` is not an `int` or `str`.
+        ValueError
+            If `page` is a string but not a valid release URL.
+
+        Returns
+        -------
+        ReleaseStats
+            The release's current counters.
+
+        """
+        id = _release_id(page)
+        return parse_release_stats(self._release_page(id, panel_only=True), id)
+
+    def get_magnet(self, page: int | str, /) -> ReleaseMagnet:
+        """
+        Fetch the infohash and magnet link of a release.
+
+        Much cheaper than `get`: the `.torrent` file is not downloaded,
+        and only the infohash and magnet link are read from the release page.
+        To get them for many releases at once, use `search_listing`, which reads them from the result listing.
+
+        Parameters
+        ----------
+        page : int or str
+            Release ID or full URL (e.g., `123456` or `https://nyaa.si/view/123456`).
+
+        Raises
+        ------
+        ReleaseNotFoundError
+            If the release does not exist (HTTP 404).
+        TypeError
+            If `page` is not an `int` or `str`.
+        ValueError
+            If `page` is a string but not a valid release URL.
+
+        Returns
+        -------
+        ReleaseMagnet
+            The release's infohash and magnet link.
+
+        """
+        id = _release_id(page)
+        return parse_release_magnet(self._release_page(id, panel_only=True), id)
+
+    def _release_page(self, id: int, *, panel_only: bool = False) -> bytes:
+        """
+        Fetch the page of a release. With `stream_pages`, only as much of it as is parsed,
+        or only its metadata panel if `panel_only` is `True`.
+        """
+        url = urljoin(self._base_url, f"/view/{id}")
+        response = self._request(f"view/{id}", stream=self._stream_pages)
+        reader = ReleasePageReader(panel_only=panel_only)
+        try:
+            if response.status_code == httpx.codes.NOT_FOUND:
+                raise ReleaseNotFoundError(url)
+            response.raise_for_status()
+            if not self._stream_pages:
+                return response.content
+            for chunk in response.iter_bytes():
+                if reader.feed(chunk):
+                    break
+        finally:
+            if self._stream_pages:
+                # Closing the response before its end drops the connection instead of reading the rest.
+                response.close()
+                self._count(response, len(reader))
+        return reader.html()
+
+    @overload
+    def get_many(
+        self, pages: Iterable[int | str], /, *, concurrency: int = ..., lazy: Literal[False] = ...
+    ) -> Generator[NyaaRelease]: ...
+
+    @overload
+    def get_many(
+        self, pages: Iterable[int | str], /, *, concurrency: int = ..., lazy: Literal[True]
+    ) -> Generator[LazyRelease]: ...
+
+    @overload
+    def get_many(
+        self, pages: Iterable[int | str], /, *, concurrency: int = ..., lazy: bool
+    ) -> Generator[NyaaRelease | LazyRelease]: ...
+
+    def get_many(
+        self, pages: Iterable[int | str], /, *, concurrency: int = 8, lazy: bool = False
+    ) -> Generator[NyaaRelease | LazyRelease]:
+        """
+        Fetch metadata for many releases, yielding them in the given order.
+
+        Up to `concurrency` releases are fetched at once, and a new one is started as soon as
+        the oldest one has been yielded. The async client fetches them on the event loop.
+        The sync client fetches and parses them in a pool of `concurrency` threads,
+        so on free-threaded builds of CPython (3.13t and later) parsing runs in parallel across cores.
+        Releases that do not exist are skipped.
+
+        Parameters
+        ----------
+        pages : Iterable[int | str]
+            Release IDs or full URLs (e.g., `123456` or `https://nyaa.si/view/123456`).
+        concurrency : int, optional
+            Number of releases fetched at once.
+        lazy : bool, optional
+            If `True`, yield `LazyRelease` objects that parse each field on first access.
+
+        Yields
+        ------
+        NyaaRelease or LazyRelease
+            Parsed release metadata for each release that exists.
+
+        """
+        assert_positive(concurrency, "concurrency")
+
+        def fetch(page: int | str) -> NyaaRelease | LazyRelease | None:
+            try:
+                return self.get(page, lazy=lazy)
+            except ReleaseNotFoundError:
+                return None
+
+        with closing(map_ordered(fetch, pages, concurrency)) as releases:
+            for release in releases:
+                if release is not None:
+                    yield release
+
+    def refresh(self, releases: Iterable[_R], /, *, concurrency: int = 8) -> Generator[_R]:
+        """
+        Yield copies of `releases` with up-to-date seeders, leechers and completed counts.
+
+        Each copy is made with [`dataclasses.replace`][dataclasses.replace] and keeps every other
+        field, including the `file_tree` of a `NyaaRelease`. Only the counters are fetched,
+        using `get_stats`. Releases that no longer exist are skipped.
+        Releases are refreshed in batches of `concurrency`. The async client fetches each batch
+        concurrently; the sync client fetches them one at a time.
+
+        Parameters
+        ----------
+        releases : Iterable[NyaaRelease | CompactRelease | SearchResult]
+            Releases to refresh.
+        concurrency : int, optional
+            Number of releases the async client refreshes at once.
+
+        Yields
+        ------
+        NyaaRelease, CompactRelease or SearchResult
+            An updated copy of each release that still exists, in the given order.
+
+        """
+        assert_positive(concurrency, "concurrency")
+
+        def fetch(id: int) -> ReleaseStats | None:
+            try:
+                return self.get_stats(id)
+            except ReleaseNotFoundError:
+                return None
+
+        releases = iter(releases)
+        while batch := tuple(islice(releases, concurrency)):
+            updates = tuple(fetch(release.id) for release in batch)
+            for release, stats in zip(batch, updates, strict=True):
+                if stats is None:
+                    continue
+                updated = dataclasses.replace(
+                    release, seeders=stats.seeders, leechers=stats.leechers, completed=stats.completed
+                )
+                if isinstance(release, NyaaRelease):
+                    # The file list is not a constructor argument, so `replace` leaves it unset.
+                    object.__setattr__(updated, "_file_list", release._file_list)
+                yield updated
+
+    def _get_stored(
+        self, id: int, torrent_page_url: str, torrent_file_url: str, store: TorrentStore, *, lazy: bool
+    ) -> NyaaRelease | LazyRelease:
+        # The page is needed first, since its infohash is the key used to deduplicate downloads.
+        parsed = self._parse(self._release_page(id), lazy=lazy)
+        infohash = parsed.panel.infohash() if isinstance(parsed, TorrentFragmentParser) else parsed["infohash"]
+
+        torrent_file = self._request(f"download/{id}.torrent", stream=True)
+        decoded_bytes = 0
+        try:
+            if torrent_file.status_code == httpx.codes.NOT_FOUND:
+                raise ReleaseNotFoundError(torrent_page_url)
+            torrent_file.raise_for_status()
+            # Already stored torrents only cost the response headers, which carry the file name.
+            if infohash not in store:
+                # The async client writes to disk from a worker thread.
+                pending = run_blocking(PendingTorrent, store, infohash)
+                try:
+                    for chunk in torrent_file.iter_bytes():
+                        run_blocking(pending.write, chunk)
+                        decoded_bytes += len(chunk)
+                    run_blocking(pending.commit)
+                except BaseException:
+                    pending.discard()
+                    raise
+        finally:
+            torrent_file.close()
+            self._count(torrent_file, decoded_bytes)
 
-        return NyaaRelease(
+        source = TorrentSource(
+            name=parse_torrent_filename(torrent_file.headers["Content-Disposition"]),
+            data=None,
+            url=torrent_file_url,
+            path=store.path(infohash),
+        )
+        return self._release(id, torrent_page_url, parsed, source)
+
+    def _request(self, path: str, *, params: dict[str, Any] | None = None, stream: bool = False) -> httpx.Response:
+        """
+        Send a GET request for `path`, relative to the best mirror, failing over to the others.
+
+        The response of the last mirror tried is returned as is, whatever its status.
+        """
+        *fallbacks, last = self._mirrors.ranked()
+        for mirror in fallbacks:
+            try:
+                response = self._send(mirror, path, params=params, stream=stream)
+            except httpx.TransportError:
+                continue
+            if not _unavailable(response):
+                return response
+            response.close()
+        return self._send(last, path, params=params, stream=stream)
+
+    def _send(self, mirror: str, path: str, *, params: dict[str, Any] | None, stream: bool) -> httpx.Response:
+        request = self._client.build_request("GET", urljoin(mirror, path), params=params)
+        self._mirrors.begin(mirror)
+        start = time.perf_counter()
+        try:
+            response = self._client.send(request, stream=stream)
+        except httpx.TransportError:
+            self._mirrors.end(mirror, None)
+            raise
+        except BaseException:
+            # Cancellation, interrupts and bugs say nothing about the mirror's health.
+            self._mirrors.abandon(mirror)
+            raise
+        self._mirrors.end(mirror, None if _unavailable(response) else time.perf_counter() - start)
+        if not stream:
+            self._count(response, len(response.content))
+        return response
+
+    def _count(self, response: httpx.Response, decoded_bytes: int) -> None:
+        """Add a response whose body has been read to `transfer_stats`."""
+        stats = self._transfer_stats
+        with self._transfer_stats_lock:
+            stats.responses += 1
+            if response.headers.get("Content-Encoding", "identity") != "identity":
+                stats.compressed += 1
+            stats.received_bytes += response.num_bytes_downloaded
+            stats.decoded_bytes += decoded_bytes
+
+    def _parse(self, html: bytes, *, lazy: bool) -> PageFields | TorrentFragmentParser:
+        if lazy:
+            return TorrentFragmentParser(html=html, base_url=self._base_url)
+        if self._parse_executor is None:
+            return parse_torrent_page(html, self._base_url)
+        future = self._parse_executor.submit(parse_torrent_page, html, self._base_url)
+        return future.result()
+
+    def _release(
+        self, id: int, url: str, parsed: PageFields | TorrentFragmentParser, torrent: TorrentSource
+    ) -> NyaaRelease | LazyRelease:
+        if isinstance(parsed, TorrentFragmentParser):
+            return LazyRelease(id=id, url=url, page=parsed, torrent=torrent, submitters=self._submitters)
+
+        submitter = None
+        if parsed["submitter"] is not None:
+            submitter = Submitter.from_dict(parsed["submitter"])
+            submitter = self._submitters.setdefault(submitter, submitter)
+
+        release = NyaaRelease(
             id=id,
-            url=torrent_page_url,
-            title=parsed.panel.title(),
-            category=parsed.panel.category(),
-            datetime=parsed.panel.datetime(),
-            submitter=parsed.panel.submitter(),
-            information=parsed.panel.information(),
-            seeders=parsed.panel.seeders(),
-            leechers=parsed.panel.leechers(),
-            completed=parsed.panel.completed(),
-            is_trusted=parsed.is_trusted(),
-            is_remake=parsed.is_remake(),
-            torrent=TorrentFile(
-                name=parse_torrent_filename(torrent_file.headers["Content-Disposition"]),
-                data=torrent_file.content,
-                size=parsed.panel.size(),
-                infohash=parsed.panel.infohash(),
-                url=torrent_file_url,
-                magnet=parsed.panel.magnet(),
-            ),
-            description=parsed.description(),
+            url=url,
+            title=parsed["title"],
+            category=parsed["category"],
+            datetime=parsed["datetime"],
+            submitter=submitter,
+            information=parsed["information"],
+            seeders=parsed["seeders"],
+            leechers=parsed["leechers"],
+            completed=parsed["completed"],
+            is_trusted=parsed["is_trusted"],
+            is_remake=parsed["is_remake"],
+            torrent=torrent.to_file(size=parsed["size"], infohash=parsed["infohash"], magnet=parsed["magnet"]),
+            description=parsed["description"],
         )
+        # Not a constructor argument, so the parser stays out of the public signature.
+        object.__setattr__(release, "_file_list", FileListParser(parsed["file_list"]))
+        return release
+
+    @overload
+    def search(
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: Literal[False] = ...,
+        limit: int | None = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease]: ...
 
+    @overload
     def search(
         self,
         query: str,
@@ -145,7 +589,45 @@ class Nyaa:
         filter: Filter = Filter.NO_FILTER,
         sort_by: SortBy = SortBy.DATETIME,
         order: Order = Order.DESCENDING,
-    ) -> Iterator[NyaaRelease]:
+        lazy: Literal[True],
+        limit: int | None = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[LazyRelease]: ...
+
+    @overload
+    def search(
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: bool,
+        limit: int | None = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease | LazyRelease]: ...
+
+    def search(  # noqa: PLR0913
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: bool = False,
+        limit: int | None = None,
+        max_pages: int | None = None,
+        where: Callable[[SearchResult], bool] | None = None,
+        stats: SearchStats | None = None,
+    ) -> Generator[NyaaRelease | LazyRelease]:
         """
         Search for releases on Nyaa.
 
@@ -161,40 +643,899 @@ class Nyaa:
             Field used to sort the results.
         order : Order, optional
             Order of the results.
+        lazy : bool, optional
+            If `True`, yield `LazyRelease` objects that parse each field on first access.
+        limit : int, optional
+            Stop after yielding this many releases.
+        max_pages : int, optional
+            Stop after fetching this many result pages.
+        where : Callable[[SearchResult], bool], optional
+            Predicate evaluated against each result as listed on the results page.
+            Only results for which it returns `True` are fetched, so filters on size, seeders,
+            date, category or trust status cost no release page or `.torrent` download.
+        stats : SearchStats, optional
+            If given, updated with the number of pages fetched, results yielded,
+            and results skipped as duplicates or by `where` as the search runs.
 
         Yields
         ------
-        NyaaRelease
+        NyaaRelease or LazyRelease
             Parsed release metadata for each search result.
 
         """
-        assert_type(query, str, "query")
+        params = _checked_search_params(query, category=category, filter=filter, sort_by=sort_by, order=order)
+        assert_positive(limit, "limit")
+        assert_positive(max_pages, "max_pages")
+
+        stats = SearchStats() if stats is None else stats
+        ids = self._search_ids(params, stats, user=None, max_pages=max_pages, where=where)
+        return self._releases(ids, stats, lazy=lazy, limit=limit)
+
+    def _releases(
+        self, ids: Generator[TorrentID], stats: SearchStats, *, lazy: bool, limit: int | None
+    ) -> Generator[NyaaRelease | LazyRelease]:
+        count = 0
+        # Closed explicitly, so that closing this iterator early also stops the listing fetches at once
+        # instead of whenever the garbage collector finalizes the inner generator.
+        with closing(ids):
+            for id in ids:
+                yield self.get(id, lazy=lazy)
+                stats.results += 1
+                count += 1
+                if count == limit:  # Checked before asking for another ID, which may fetch another page
+                    return
+
+    def _search_ids(
+        self,
+        params: dict[str, Any],
+        stats: SearchStats,
+        *,
+        user: str | None,
+        max_pages: int | None,
+        where: Callable[[SearchResult], bool] | None,
+    ) -> Generator[TorrentID]:
+        # Pagination is offset based, so a release can show up again on a later page if newer
+        # ones were uploaded in the meantime. Those are skipped before their details are fetched.
+        seen: set[TorrentID] = set()
+
+        # Each page is reduced to its result IDs (or rows) and page numbers before any release
+        # is fetched, so no response body or tree stays alive while the results are being yielded.
+        rows = where is not None
+        first = self._search_page(params, stats, rows=rows, user=user)
+        for id in _unique(_matching(first, where, stats), seen, stats):
+            yield id
+
+        pages = first.pages() if max_pages is None else islice(first.pages(), max_pages - 1)
+        for page in pages:  # Second page onwards
+            params["p"] = page
+            parsed = self._search_page(params, stats, rows=rows, user=user)
+            for id in _unique(_matching(parsed, where, stats), seen, stats):
+                yield id
+
+    def _search_page(
+        self, params: dict[str, Any], stats: SearchStats, *, rows: bool, user: str | None = None
+    ) -> SearchPageParser:
+        # A user's uploads are listed and paginated exactly like search results.
+        path = "" if user is None else f"user/{quote(user, safe='')}"
+        url = urljoin(self._base_url, path)
+        response = self._request(path, params=params)
+        if user is not None and response.status_code == httpx.codes.NOT_FOUND:
+            raise UserNotFoundError(url)
+        response.raise_for_status()
+        stats.pages += 1
+        # Rows are only read when a predicate needs them; the IDs alone are much cheaper to extract.
+        return SearchPageParser(response.content, base_url=self._base_url if rows else None)
+
+    def search_listing(  # noqa: PLR0913
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        limit: int | None = None,
+        max_pages: int | None = None,
+        where: Callable[[SearchResult], bool] | None = None,
+        stats: SearchStats | None = None,
+    ) -> Generator[SearchResult]:
+        """
+        Search for releases on Nyaa, yielding them as listed on the result pages.
+
+        Unlike `search`, no release page or `.torrent` file is fetched: one request returns up to 75 results,
+        each with its infohash, magnet link, size, date and counters.
+
+        Parameters
+        ----------
+        query : str
+            Search query string.
+        category : ParentCategory | Category, optional
+            Category or subcategory used to filter results.
+        filter : Filter, optional
+            Filter applied to the search results.
+        sort_by : SortBy, optional
+            Field used to sort the results.
+        order : Order, optional
+            Order of the results.
+        limit : int, optional
+            Stop after yielding this many results.
+        max_pages : int, optional
+            Stop after fetching this many result pages.
+        where : Callable[[SearchResult], bool], optional
+            Only yield results for which this predicate returns `True`.
+        stats : SearchStats, optional
+            If given, updated with the number of pages fetched, results yielded,
+            and results skipped as duplicates or by `where` as the search runs.
+
+        Yields
+        ------
+        SearchResult
+            Each search result as listed.
+
+        """
+        params = _checked_search_params(query, category=category, filter=filter, sort_by=sort_by, order=order)
+        assert_positive(limit, "limit")
+        assert_positive(max_pages, "max_pages")
+
+        stats = SearchStats() if stats is None else stats
+        # A single listing only ever has one request in flight.
+        rows = self._search_rows(params, stats, user=None, max_pages=max_pages, limiter=threading.Semaphore())
+        return self._listing(rows, stats, where=where, limit=limit)
+
+    @staticmethod
+    def _listing(
+        rows: Generator[SearchResult],
+        stats: SearchStats,
+        *,
+        where: Callable[[SearchResult], bool] | None,
+        limit: int | None,
+    ) -> Generator[SearchResult]:
+        seen: set[int] = set()
+        count = 0
+        with closing(rows):
+            for row in rows:
+                if row.id in seen:
+                    stats.duplicates += 1
+                    continue
+                seen.add(row.id)
+                if where is not None and not where(row):
+                    stats.filtered += 1
+                    continue
+                yield row
+                stats.results += 1
+                count += 1
+                if count == limit:
+                    return
+
+    @overload
+    def user_uploads(
+        self,
+        name: str,
+        /,
+        *,
+        query: str = ...,
+        category: ParentCategory | Category = ...,
+        filter: Filter = ...,
+        sort_by: SortBy = ...,
+        order: Order = ...,
+        lazy: Literal[False] = ...,
+        limit: int | None = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease]: ...
+
+    @overload
+    def user_uploads(
+        self,
+        name: str,
+        /,
+        *,
+        query: str = ...,
+        category: ParentCategory | Category = ...,
+        filter: Filter = ...,
+        sort_by: SortBy = ...,
+        order: Order = ...,
+        lazy: Literal[True],
+        limit: int | None = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[LazyRelease]: ...
+
+    @overload
+    def user_uploads(
+        self,
+        name: str,
+        /,
+        *,
+        query: str = ...,
+        category: ParentCategory | Category = ...,
+        filter: Filter = ...,
+        sort_by: SortBy = ...,
+        order: Order = ...,
+        lazy: bool,
+        limit: int | None = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease | LazyRelease]: ...
+
+    def user_uploads(  # noqa: PLR0913
+        self,
+        name: str,
+        /,
+        *,
+        query: str = "",
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: bool = False,
+        limit: int | None = None,
+        max_pages: int | None = None,
+        where: Callable[[SearchResult], bool] | None = None,
+        stats: SearchStats | None = None,
+    ) -> Generator[NyaaRelease | LazyRelease]:
+        """
+        Fetch the releases uploaded by a user, as listed on their profile page.
+
+        The profile page (`Submitter.url`) is paged through like search results,
+        so every option of `search` applies to it as well.
+
+        Parameters
+        ----------
+        name : str
+            Name of the user, e.g. `Submitter.name`.
+        query : str, optional
+            Only list the user's uploads matching this search query.
+        category : ParentCategory | Category, optional
+            Category or subcategory used to filter results.
+        filter : Filter, optional
+            Filter applied to the results.
+        sort_by : SortBy, optional
+            Field used to sort the results.
+        order : Order, optional
+            Order of the results.
+        lazy : bool, optional
+            If `True`, yield `LazyRelease` objects that parse each field on first access.
+        limit : int, optional
+            Stop after yielding this many releases.
+        max_pages : int, optional
+            Stop after fetching this many result pages.
+        where : Callable[[SearchResult], bool], optional
+            Predicate evaluated against each upload as listed on the profile page.
+            Only uploads for which it returns `True` are fetched.
+        stats : SearchStats, optional
+            If given, updated with the number of pages fetched, results yielded,
+            and results skipped as duplicates or by `where` as the listing is paged through.
+
+        Raises
+        ------
+        UserNotFoundError
+            If the user does not exist (HTTP 404), when the first page is fetched.
+
+        Yields
+        ------
+        NyaaRelease or LazyRelease
+            Parsed release metadata for each upload.
+
+        """
+        assert_type(name, str, "name")
+        params = _checked_search_params(query, category=category, filter=filter, sort_by=sort_by, order=order)
+        assert_positive(limit, "limit")
+        assert_positive(max_pages, "max_pages")
+
+        stats = SearchStats() if stats is None else stats
+        ids = self._search_ids(params, stats, user=name, max_pages=max_pages, where=where)
+        return self._releases(ids, stats, lazy=lazy, limit=limit)
+
+    def user_listing(  # noqa: PLR0913
+        self,
+        name: str,
+        /,
+        *,
+        query: str = "",
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        limit: int | None = None,
+        max_pages: int | None = None,
+        where: Callable[[SearchResult], bool] | None = None,
+        stats: SearchStats | None = None,
+    ) -> Generator[SearchResult]:
+        """
+        List the releases uploaded by a user, as shown on their profile page.
+
+        Like `search_listing`, no release page or `.torrent` file is fetched.
+        The parameters are the same as for `user_uploads`, except for `lazy`.
+
+        Raises
+        ------
+        UserNotFoundError
+            If the user does not exist (HTTP 404), when the first page is fetched.
+
+        Yields
+        ------
+        SearchResult
+            Each upload as listed.
+
+        """
+        assert_type(name, str, "name")
+        params = _checked_search_params(query, category=category, filter=filter, sort_by=sort_by, order=order)
+        assert_positive(limit, "limit")
+        assert_positive(max_pages, "max_pages")
+
+        stats = SearchStats() if stats is None else stats
+        rows = self._search_rows(params, stats, user=name, max_pages=max_pages, limiter=threading.Semaphore())
+        return self._listing(rows, stats, where=where, limit=limit)
+
+    @overload
+    def search_many(
+        self,
+        queries: Iterable[str],
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: Literal[False] = ...,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        concurrency: int = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease]: ...
+
+    @overload
+    def search_many(
+        self,
+        queries: Iterable[str],
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: Literal[True],
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        concurrency: int = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[LazyRelease]: ...
+
+    @overload
+    def search_many(
+        self,
+        queries: Iterable[str],
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: bool,
+        max_pages: int | None = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        concurrency: int = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease | LazyRelease]: ...
+
+    def search_many(  # noqa: PLR0913
+        self,
+        queries: Iterable[str],
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        sort_by: SortBy = SortBy.DATETIME,
+        order: Order = Order.DESCENDING,
+        lazy: bool = False,
+        max_pages: int | None = None,
+        where: Callable[[SearchResult], bool] | None = None,
+        concurrency: int = 8,
+        stats: SearchStats | None = None,
+    ) -> Generator[NyaaRelease | LazyRelease]:
+        """
+        Run several searches and yield their results as a single stream, sorted as requested.
+
+        The result listings of all queries are merged as they are paged through, so only one
+        page per query is held at a time. A release listed by several queries is yielded once.
+        The async client fetches the first page of every query concurrently, and releases in
+        concurrent batches, with at most `concurrency` listing pages and releases being fetched
+        at a time overall; the sync client fetches them one at a time. Fetching a release takes
+        up to two requests, for its page and its `.torrent` file.
+
+        Parameters
+        ----------
+        queries : Iterable[str]
+            Search query strings.
+        category : ParentCategory | Category, optional
+            Category or subcategory used to filter results.
+        filter : Filter, optional
+            Filter applied to the search results.
+        sort_by : SortBy, optional
+            Field used to sort the results of each query and the merged stream.
+        order : Order, optional
+            Order of the results.
+        lazy : bool, optional
+            If `True`, yield `LazyRelease` objects that parse each field on first access.
+        max_pages : int, optional
+            Stop after fetching this many result pages per query.
+        where : Callable[[SearchResult], bool], optional
+            Predicate evaluated against each result as listed on the results page.
+            Only results for which it returns `True` are fetched.
+        concurrency : int, optional
+            Maximum number of listing pages and releases the async client fetches at a time.
+        stats : SearchStats, optional
+            If given, updated with the number of pages fetched, results yielded,
+            and results skipped as duplicates or by `where` as the search runs.
+
+        Yields
+        ------
+        NyaaRelease or LazyRelease
+            Parsed release metadata for each search result.
+
+        """
+        queries = tuple(queries)
+        for query in queries:
+            assert_type(query, str, "queries")
         assert_type(category, (ParentCategory, Category), "category")
         assert_type(filter, Filter, "filter")
         assert_type(sort_by, SortBy, "sort_by")
         assert_type(order, Order, "order")
+        assert_positive(max_pages, "max_pages")
+        assert_positive(concurrency, "concurrency")
 
-        params: dict[str, Any] = {
-            "f": filter,
-            "c": category.id,
-            "q": query,
-            "s": sort_by,
-            "o": order,
-        }
-
-        # First page
-        first = self._client.get(self._base_url, params=params)
-        first.raise_for_status()
-        html = first.text
-        parsed = SearchPageParser(html)
-        for id in parsed.results():
-            yield self.get(id)
-
-        for page in parsed.pages():  # Second page onwards
-            params["p"] = page
-            other = self._client.get(self._base_url, params=params)
-            other.raise_for_status()
-            html = other.text
-            parsed = SearchPageParser(html)
-            for id in parsed.results():
-                yield self.get(id)
+        stats = SearchStats() if stats is None else stats
+        limiter = threading.Semaphore(concurrency)
+        field = _SORT_FIELDS[sort_by]
+        # Heap entries are (key, query index, row), so ties never compare the rows themselves.
+        sign = -1 if order is Order.DESCENDING else 1
+
+        def fetch(id: TorrentID) -> NyaaRelease | LazyRelease:
+            with limiter:
+                return self.get(id, lazy=lazy)
+
+        streams = [
+            self._search_rows(
+                _search_params(query, category=category, filter=filter, sort_by=sort_by, order=order),
+                stats,
+                max_pages=max_pages,
+                limiter=limiter,
+            )
+            for query in queries
+        ]
+        try:
+            heads = tuple(next(stream, None) for stream in streams)
+            heap = [(sign * field(row), index, row) for index, row in enumerate(heads) if row is not None]
+            heapq.heapify(heap)
+            seen: set[TorrentID] = set()
+            batch: list[TorrentID] = []
+            while heap:
+                _, index, row = heap[0]
+                following = next(streams[index], None)
+                if following is None:
+                    heapq.heappop(heap)
+                else:
+                    heapq.heapreplace(heap, (sign * field(following), index, following))
+
+                id = TorrentID(row.id)
+                if id in seen:
+                    stats.duplicates += 1
+                elif where is not None and not where(row):
+                    seen.add(id)
+                    stats.filtered += 1
+                else:
+                    seen.add(id)
+                    batch.append(id)
+
+                # Releases are fetched a batch at a time, and the batch is yielded in merged order.
+                if len(batch) == concurrency or (batch and not heap):
+                    for release in tuple(fetch(id) for id in batch):
+                        yield release
+                        stats.results += 1
+                    batch.clear()
+        finally:
+            for stream in streams:
+                stream.close()
+
+    def _search_rows(
+        self,
+        params: dict[str, Any],
+        stats: SearchStats,
+        *,
+        user: str | None = None,
+        max_pages: int | None,
+        limiter: threading.Semaphore,
+    ) -> Generator[SearchResult]:
+        with limiter:
+            first = self._search_page(params, stats, rows=True, user=user)
+        for row in first.rows():
+            yield row
+
+        pages = first.pages() if max_pages is None else islice(first.pages(), max_pages - 1)
+        for page in pages:  # Second page onwards
+            with limiter:
+                parsed = self._search_page({**params, "p": page}, stats, rows=True, user=user)
+            for row in parsed.rows():
+                yield row
+
+    @overload
+    def sweep(
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        lazy: Literal[False] = ...,
+        where: Callable[[SearchResult], bool] | None = ...,
+        concurrency: int = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease]: ...
+
+    @overload
+    def sweep(
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        lazy: Literal[True],
+        where: Callable[[SearchResult], bool] | None = ...,
+        concurrency: int = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[LazyRelease]: ...
+
+    @overload
+    def sweep(
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        lazy: bool,
+        where: Callable[[SearchResult], bool] | None = ...,
+        concurrency: int = ...,
+        stats: SearchStats | None = ...,
+    ) -> Generator[NyaaRelease | LazyRelease]: ...
+
+    def sweep(  # noqa: PLR0913
+        self,
+        query: str,
+        /,
+        *,
+        category: ParentCategory | Category = ParentCategory.ALL,
+        filter: Filter = Filter.NO_FILTER,
+        lazy: bool = False,
+        where: Callable[[SearchResult], bool] | None = None,
+        concurrency: int = 8,
+        stats: SearchStats | None = None,
+    ) -> Generator[NyaaRelease | LazyRelease]:
+        """
+        Find every release matching a query, working around Nyaa's cap on search results.
+
+        Nyaa stops paginating a query after 1,000 results, so a broad `search` silently misses the rest.
+        `sweep` splits such queries into disjoint partitions by category, and splits any partition
+        that still hits the cap again, down to subcategories. A subcategory that hits the cap is also
+        listed oldest first, which covers up to twice the cap; if that is still not enough, the
+        partition is counted in `SearchStats.truncated`. Whether a partition that spans 14 pages
+        hits the cap is read from its last page, which must be full up to the 1,000th result
+        or link to a next page, so results that merely fill 14 pages are not split.
+
+        Results are yielded one partition at a time, newest first within each partition, and never twice.
+        The async client probes partitions and fetches releases concurrently, with at most `concurrency`
+        listing pages and releases being fetched at a time across all partitions; the sync client
+        fetches them one at a time.
+
+        Parameters
+        ----------
+        query : str
+            Search query string.
+        category : ParentCategory | Category, optional
+            Category or subcategory to sweep.
+        filter : Filter, optional
+            Filter applied to the search results.
+        lazy : bool, optional
+            If `True`, yield `LazyRelease` objects that parse each field on first access.
+        where : Callable[[SearchResult], bool], optional
+            Predicate evaluated against each result as listed on the results page.
+            Only results for which it returns `True` are fetched.
+        concurrency : int, optional
+            Maximum number of listing pages and releases the async client fetches at a time.
+        stats : SearchStats, optional
+            If given, updated with the number of pages fetched, results yielded, results skipped,
+            and partitions truncated as the sweep runs.
+
+        Yields
+        ------
+        NyaaRelease or LazyRelease
+            Parsed release metadata for each search result.
+
+        """
+        assert_type(query, str, "query")
+        assert_type(category, (ParentCategory, Category), "category")
+        assert_type(filter, Filter, "filter")
+        assert_positive(concurrency, "concurrency")
+
+        stats = SearchStats() if stats is None else stats
+        # Shared by every partition, so splitting a query never multiplies the number of fetches in flight.
+        limiter = threading.Semaphore(concurrency)
+        seen: set[TorrentID] = set()
+        rows = where is not None
+
+        def listing(params: dict[str, Any]) -> SearchPageParser:
+            with limiter:
+                return self._search_page(params, stats, rows=rows)
+
+        def probe(partition: ParentCategory | Category) -> tuple[SearchPageParser, bool]:
+            # The first page, and whether the partition hit the cap, which only its last page can tell.
+            params = _search_params(query, category=partition, filter=filter)
+            first = listing(params)
+            if max(first.pages(), default=1) < MAX_RESULT_PAGES:
+                return first, False
+            params["p"] = MAX_RESULT_PAGES
+            return first, _capped(listing(params))
+
+        def fetch(id: TorrentID) -> NyaaRelease | LazyRelease:
+            with limiter:
+                return self.get(id, lazy=lazy)
+
+        def batches(
+            partition: ParentCategory | Category, first: SearchPageParser, *, capped: bool
+        ) -> Generator[Sequence[NyaaRelease | LazyRelease]]:
+            # Newest first, then, if the partition hit the cap, oldest first until the two passes meet.
+            newest: set[TorrentID] = set()
+            for order in (Order.DESCENDING, Order.ASCENDING) if capped else (Order.DESCENDING,):
+                params = _search_params(query, category=partition, filter=filter, order=order)
+                page = first if order is Order.DESCENDING else listing(params)
+                numbers = page.pages()
+                while True:
+                    met = order is Order.ASCENDING and not newest.isdisjoint(page.results())
+                    if order is Order.DESCENDING:
+                        newest.update(page.results())
+                    ids = list(_unique(_matching(page, where, stats), seen, stats))
+                    # Each page's releases are fetched together, within the shared limit.
+                    yield tuple(fetch(id) for id in ids)
+                    number = next(numbers, None)
+                    if met or number is None:
+                        break
+                    params["p"] = number
+                    page = listing(params)
+                if order is Order.ASCENDING and not met:
+                    stats.truncated += 1
+
+        partitions: tuple[ParentCategory | Category, ...] = (category,)
+        while partitions:
+            probes = tuple(probe(partition) for partition in partitions)
+            split: list[ParentCategory | Category] = []
+            for partition, (first, capped) in zip(partitions, probes, strict=True):
+                if capped and subcategories(partition):
+                    split.extend(subcategories(partition))
+                    continue
+                partition_batches = batches(partition, first, capped=capped)
+                with closing(partition_batches):
+                    for batch in partition_batches:
+                        for release in batch:
+                            yield release
+                            stats.results += 1
+            partitions = tuple(split)
+
+    @overload
+    def crawl(
+        self,
+        ids: range,
+        /,
+        *,
+        checkpoint: str | os.PathLike[str] | None = ...,
+        shard: int = ...,
+        shards: int = ...,
+        concurrency: int = ...,
+        lazy: Literal[False] = ...,
+    ) -> Generator[NyaaRelease]: ...
+
+    @overload
+    def crawl(
+        self,
+        ids: range,
+        /,
+        *,
+        checkpoint: str | os.PathLike[str] | None = ...,
+        shard: int = ...,
+        shards: int = ...,
+        concurrency: int = ...,
+        lazy: Literal[True],
+    ) -> Generator[LazyRelease]: ...
+
+    @overload
+    def crawl(
+        self,
+        ids: range,
+        /,
+        *,
+        checkpoint: str | os.PathLike[str] | None = ...,
+        shard: int = ...,
+        shards: int = ...,
+        concurrency: int = ...,
+        lazy: bool,
+    ) -> Generator[NyaaRelease | LazyRelease]: ...
+
+    def crawl(  # noqa: PLR0913
+        self,
+        ids: range,
+        /,
+        *,
+        checkpoint: str | os.PathLike[str] | None = None,
+        shard: int = 0,
+        shards: int = 1,
+        concurrency: int = 8,
+        lazy: bool = False,
+    ) -> Generator[NyaaRelease | LazyRelease]:
+        """
+        Fetch every release in a range of IDs, skipping the ones that do not exist.
+
+        The range can be split between several workers with `shard` and `shards`: each worker
+        takes every `shards`-th ID, starting at the `shard`-th one. With a `checkpoint` file, every
+        ID the worker is done with is recorded there, including IDs that do not exist (HTTP 404).
+        A crawl restarted with the same file, range and shard skips those IDs. An ID is recorded once
+        the next release is requested, so the release yielded last before a crash or an early exit
+        is fetched again on resume.
+
+        IDs are fetched in batches of `concurrency`. The async client fetches each batch concurrently;
+        the sync client fetches them one at a time.
+
+        Parameters
+        ----------
+        ids : range
+            IDs to crawl, e.g. `range(1, 2_000_000)`.
+        checkpoint : str or os.PathLike[str], optional
+            File in which progress is recorded, created if it does not exist.
+        shard : int, optional
+            Index of this worker's shard, from `0` to `shards - 1`.
+        shards : int, optional
+            Number of shards the range is split into.
+        concurrency : int, optional
+            Number of releases the async client fetches at once.
+        lazy : bool, optional
+            If `True`, yield `LazyRelease` objects that parse each field on first access.
+
+        Raises
+        ------
+        ValueError
+            If `shard` is out of bounds, or if `checkpoint` belongs to a different range or shard.
+
+        Yields
+        ------
+        NyaaRelease or LazyRelease
+            Parsed release metadata for each existing release, in ID order.
+
+        """
+        assert_type(ids, range, "ids")
+        assert_positive(shards, "shards")
+        assert_positive(concurrency, "concurrency")
+        assert_type(shard, int, "shard")
+        if not 0 <= shard < shards:
+            msg = f"Parameter 'shard' must be between 0 and {shards - 1}, but got {shard!r}."
+            raise ValueError(msg)
+
+        ids = ids[shard::shards]
+        progress = None if checkpoint is None else run_blocking(Checkpoint, checkpoint, ids)
+        pending = iter(ids) if progress is None else progress.pending()
+
+        def fetch(id: int) -> NyaaRelease | LazyRelease | None:
+            try:
+                return self.get(id, lazy=lazy)
+            except ReleaseNotFoundError:
+                return None  # A tombstone, recorded like any other finished ID
+
+        unsaved = 0
+        try:
+            while batch := tuple(islice(pending, concurrency)):
+                releases = tuple(fetch(id) for id in batch)
+                for id, release in zip(batch, releases, strict=True):
+                    if release is not None:
+                        yield release
+                    if progress is not None:
+                        progress.add(id, missing=release is None)
+                unsaved += len(batch)
+                if progress is not None and unsaved >= _CHECKPOINT_INTERVAL:
+                    run_blocking(progress.save)
+                    unsaved = 0
+        finally:
+            if progress is not None:
+                # The async client writes the checkpoint from a worker thread.
+                run_blocking(progress.save)
+
+
+# The listing row field each sort order is based on. Nyaa sorts by date using the release ID.
+_SORT_FIELDS: dict[SortBy, Callable[[SearchResult], int]] = {
+    SortBy.COMMENTS: attrgetter("comments"),
+    SortBy.SIZE: attrgetter("size"),
+    SortBy.DATETIME: attrgetter("id"),
+    SortBy.SEEDERS: attrgetter("seeders"),
+    SortBy.LEECHERS: attrgetter("leechers"),
+    SortBy.DOWNLOADS: attrgetter("completed"),
+}
+
+
+def _unavailable(response: httpx.Response) -> bool:
+    """Whether `response` means its mirror is down or overloaded, so another one should be tried."""
+    return response.is_server_error or response.status_code == httpx.codes.TOO_MANY_REQUESTS
+
+
+def _release_id(page: int | str) -> int:
+    """Return the release ID of `page`, given as an ID or a release URL."""
+    match page:
+        case int():
+            return page
+        case str():
+            try:
+                return int(page.rstrip("/").split("/")[-1])
+            except ValueError:
+                msg = f"Invalid format for 'page'. Expected a valid URL or numeric ID, but got {page!r}."
+                raise ValueError(msg) from None
+        case _:
+            msg = f"Parameter 'page' expected 'int' or 'str', but got {type(page).__name__!r}."
+            raise TypeError(msg)
+
+
+def _search_params(
+    query: str,
+    *,
+    category: ParentCategory | Category,
+    filter: Filter,
+    sort_by: SortBy = SortBy.DATETIME,
+    order: Order = Order.DESCENDING,
+) -> dict[str, Any]:
+    return {"f": filter, "c": category.id, "q": query, "s": sort_by, "o": order}
+
+
+def _checked_search_params(
+    query: str, *, category: ParentCategory | Category, filter: Filter, sort_by: SortBy, order: Order
+) -> dict[str, Any]:
+    """Check the types of a search's arguments, and return its query parameters."""
+    assert_type(query, str, "query")
+    assert_type(category, (ParentCategory, Category), "category")
+    assert_type(filter, Filter, "filter")
+    assert_type(sort_by, SortBy, "sort_by")
+    assert_type(order, Order, "order")
+    return _search_params(query, category=category, filter=filter, sort_by=sort_by, order=order)
+
+
+def _matching(
+    page: SearchPageParser, where: Callable[[SearchResult], bool] | None, stats: SearchStats
+) -> Iterator[TorrentID]:
+    """IDs of the results on `page` that match `where`."""
+    if where is None:
+        yield from page.results()
+        return
+    for row in page.rows():
+        if where(row):
+            yield TorrentID(row.id)
+        else:
+            stats.filtered += 1
+
+
+def _capped(last: SearchPageParser) -> bool:
+    """
+    Whether `last`, the last page Nyaa paginates to for a query, shows that its results were cut off.
+
+    A query cut off at `MAX_RESULTS` fills its last page up to the cap, or links past it. One whose
+    results merely span `MAX_RESULT_PAGES` pages has a shorter last page and no next link.
+    """
+    return last.has_next() or len(tuple(last.results())) >= MAX_RESULTS - (MAX_RESULT_PAGES - 1) * RESULTS_PER_PAGE
+
+
+def _unique(ids: Iterator[TorrentID], seen: set[TorrentID], stats: SearchStats) -> Iterator[TorrentID]:
+    """IDs that are not in `seen` yet, adding them to it."""
+    for id in ids:
+        if id in seen:
+            stats.duplicates += 1
+        else:
+            seen.add(id)
+            yield id
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import calendar
+from array import array
+from typing import TYPE_CHECKING, Any
+
+from ._models import CATEGORIES, CATEGORY_CODES
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+    import pyarrow as pa
+
+    from ._enums import Category
+    from ._models import NyaaRelease
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow  # noqa: PLC0415
+        import pyarrow.compute  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        msg = "Exporting to Arrow or Parquet requires 'pyarrow'. Install it with `pip install pynyaa[arrow]`."
+        raise ImportError(msg) from None
+    return pyarrow
+
+
+def _import_numpy() -> Any:
+    try:
+        import numpy  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        msg = "Exporting to NumPy requires 'numpy'. Install it with `pip install pynyaa[numpy]`."
+        raise ImportError(msg) from None
+    return numpy
+
+
+class ReleaseCollector:
+    """
+    Accumulates releases into compact, typed columns for analytics.
+
+    Numeric fields are appended to [`array.array`][array.array] buffers as they arrive, so
+    no per-release objects are kept around. Categories are stored as small integer codes
+    and submitters are dictionary-encoded, with `-1` standing in for anonymous uploads.
+
+    The collected columns can be exported to an Arrow table, a Parquet file, or NumPy arrays.
+    Arrow and Parquet require the `arrow` extra, NumPy requires the `numpy` extra.
+
+    Examples
+    --------
+    ```py
+    from pynyaa import Nyaa, ReleaseCollector
+
+    collector = ReleaseCollector()
+    with Nyaa() as nyaa:
+        collector.extend(nyaa.search("MTBB"))
+
+    table = collector.to_arrow()
+    ```
+
+    """
+
+    __slots__ = (
+        "_category",
+        "_completed",
+        "_datetime",
+        "_id",
+        "_infohash",
+        "_is_remake",
+        "_is_trusted",
+        "_leechers",
+        "_seeders",
+        "_size",
+        "_submitter",
+        "_submitter_codes",
+        "_submitters",
+        "_title",
+    )
+
+    def __init__(self) -> None:
+        self._id = array("q")
+        self._title: list[str] = []
+        self._category = array("b")
+        self._submitter = array("i")
+        self._submitters: list[str] = []
+        self._submitter_codes: dict[str, int] = {}
+        self._datetime = array("q")
+        self._size = array("q")
+        self._seeders = array("q")
+        self._leechers = array("q")
+        self._completed = array("q")
+        self._is_trusted = array("b")
+        self._is_remake = array("b")
+        self._infohash: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self._id)
+
+    @property
+    def categories(self) -> tuple[Category, ...]:
+        """Lookup table for the category codes returned by `to_numpy()`."""
+        return CATEGORIES
+
+    @property
+    def submitters(self) -> tuple[str, ...]:
+        """Lookup table for the submitter codes returned by `to_numpy()`."""
+        return tuple(self._submitters)
+
+    def append(self, release: NyaaRelease) -> None:
+        """
+        Add a single release.
+
+        The release is added to every column or to none: if a column cannot grow because
+        an exported view of it is still alive, the columns already extended are rolled back
+        before the `BufferError` propagates.
+        """
+        name = None if release.submitter is None else release.submitter.name
+        submitter = -1 if name is None else self._submitter_codes.get(name, len(self._submitters))
+
+        row: tuple[tuple[array[Any] | list[Any], Any], ...] = (
+            (self._id, release.id),
+            (self._title, release.title),
+            (self._category, CATEGORY_CODES[release.category]),
+            (self._submitter, submitter),
+            (self._datetime, calendar.timegm(release.datetime.utctimetuple())),
+            (self._size, release.torrent.size),
+            (self._seeders, release.seeders),
+            (self._leechers, release.leechers),
+            (self._completed, release.completed),
+            (self._is_trusted, release.is_trusted),
+            (self._is_remake, release.is_remake),
+            (self._infohash, release.torrent.infohash),
+        )
+        appended = 0
+        try:
+            for column, value in row:
+                column.append(value)
+                appended += 1
+        except BaseException:
+            # A column that grew has no exported views, so it can shrink back as well.
+            for column, _ in row[:appended]:
+                column.pop()
+            raise
+
+        if name is not None and submitter == len(self._submitters):
+            self._submitter_codes[name] = submitter
+            self._submitters.append(name)
+
+    def extend(self, releases: Iterable[NyaaRelease]) -> None:
+        """Add every release from an iterable, such as the iterator returned by `Nyaa.search`."""
+        for release in releases:
+            self.append(release)
+
+    def to_numpy(self) -> dict[str, npt.NDArray[Any]]:
+        """
+        Export the columns as NumPy arrays.
+
+        Numeric columns are zero-copy views of the collector's buffers; while they are alive,
+        adding more releases raises `BufferError`. `category` and `submitter` hold integer
+        codes into `categories` and `submitters`, with `-1` for anonymous submitters.
+        """
+        np = _import_numpy()
+        return {
+            "id": np.frombuffer(self._id, dtype=np.int64),
+            "title": np.array(self._title, dtype=object),
+            "category": np.frombuffer(self._category, dtype=np.int8),
+            "submitter": np.frombuffer(self._submitter, dtype=np.int32),
+            "datetime": np.frombuffer(self._datetime, dtype=np.int64).view("datetime64[s]"),
+            "size": np.frombuffer(self._size, dtype=np.int64),
+            "seeders": np.frombuffer(self._seeders, dtype=np.int64),
+            "leechers": np.frombuffer(self._leechers, dtype=np.int64),
+            "completed": np.frombuffer(self._completed, dtype=np.int64),
+            "is_trusted": np.frombuffer(self._is_trusted, dtype=np.bool_),
+            "is_remake": np.frombuffer(self._is_remake, dtype=np.bool_),
+            "infohash": np.array(self._infohash, dtype=object),
+        }
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Export the columns as a [`pyarrow.Table`](https://arrow.apache.org/docs/python/generated/pyarrow.Table.html).
+
+        Numeric columns share memory with the collector's buffers; while the table is alive,
+        adding more releases raises `BufferError`. `category` and `submitter` are
+        dictionary-encoded, with nulls for anonymous submitters.
+        """
+        pyarrow = _import_pyarrow()
+        pc = pyarrow.compute
+        length = len(self)
+
+        def column(buffer: array[int], type: pa.DataType) -> pa.Array:
+            # Zero-copy: the Arrow array references the collector's buffer directly.
+            return pyarrow.Array.from_buffers(type, length, [None, pyarrow.py_buffer(buffer)])
+
+        submitter_codes = column(self._submitter, pyarrow.int32())
+        null_code = pyarrow.scalar(None, pyarrow.int32())
+        submitter_codes = pc.if_else(pc.equal(submitter_codes, -1), null_code, submitter_codes)
+
+        return pyarrow.table(
+            {
+                "id": column(self._id, pyarrow.int64()),
+                "title": pyarrow.array(self._title, type=pyarrow.string()),
+                "category": pyarrow.DictionaryArray.from_arrays(
+                    column(self._category, pyarrow.int8()), pyarrow.array([category.value for category in CATEGORIES])
+                ),
+                "submitter": pyarrow.DictionaryArray.from_arrays(
+                    submitter_codes, pyarrow.array(self._submitters, type=pyarrow.string())
+                ),
+                "datetime": column(self._datetime, pyarrow.int64()).cast(pyarrow.timestamp("s", tz="UTC")),
+                "size": column(self._size, pyarrow.int64()),
+                "seeders": column(self._seeders, pyarrow.int64()),
+                "leechers": column(self._leechers, pyarrow.int64()),
+                "completed": column(self._completed, pyarrow.int64()),
+                "is_trusted": column(self._is_trusted, pyarrow.int8()).cast(pyarrow.bool_()),
+                "is_remake": column(self._is_remake, pyarrow.int8()).cast(pyarrow.bool_()),
+                "infohash": pyarrow.array(self._infohash, type=pyarrow.string()),
+            }
+        )
+
+    def write_parquet(self, path: str | os.PathLike[str], **kwargs: Any) -> None:
+        """
+        Write the columns to a Parquet file.
+        Extra keyword arguments are forwarded to
+        [`pyarrow.parquet.write_table`](https://arrow.apache.org/docs/python/generated/pyarrow.parquet.write_table.html).
+        """
+        _import_pyarrow()
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        pq.write_table(self.to_arrow(), path, **kwargs)
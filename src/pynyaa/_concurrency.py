@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterable
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+_P = ParamSpec("_P")
+
+
+async def arun_blocking(function: Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+    """Run a blocking call, such as file I/O, in a worker thread so that it does not stall the event loop."""
+    return await asyncio.to_thread(function, *args, **kwargs)
+
+
+def run_blocking(function: Callable[_P, _R], /, *args: _P.args, **kwargs: _P.kwargs) -> _R:
+    """Run a blocking call in the current thread. The sync client's counterpart of `arun_blocking`."""
+    return function(*args, **kwargs)
+
+
+async def agather(*awaitables: Awaitable[_T]) -> list[_T]:
+    """
+    Like `asyncio.gather`, but if any awaitable fails, the others are cancelled and awaited before the error
+    propagates, so that no task outlives the call. The sync client runs the same calls one after another.
+    """
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def amap_ordered(
+    function: Callable[[_T], Awaitable[_R]], items: Iterable[_T], concurrency: int
+) -> AsyncGenerator[_R]:
+    """
+    Yield `function(item)` for each item, in order, running up to `concurrency` calls at once on the event loop.
+    A new call starts as soon as the oldest one has been yielded, rather than waiting for a whole batch.
+    """
+    pending: deque[asyncio.Future[_R]] = deque()
+    try:
+        for item in items:
+            pending.append(asyncio.ensure_future(function(item)))
+            if len(pending) == concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def map_ordered(function: Callable[[_T], _R], items: Iterable[_T], concurrency: int) -> Generator[_R]:
+    """
+    Yield `function(item)` for each item, in order, running up to `concurrency` calls at once in a thread pool.
+
+    The pool lives as long as the generator. On free-threaded builds of CPython, the calls run in parallel
+    across cores; with the GIL, only their I/O overlaps.
+    """
+    pending: deque[Future[_R]] = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pynyaa")
+    try:
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) == concurrency:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -13,7 +13,7 @@ class PyNyaaError(Exception):
 
 
 class ParsingError(PyNyaaError):
-    """Raised when there is an error parsing the HTML."""
+    """Raised when there is an error parsing the HTML or the torrent file."""
 
 
 class ReleaseNotFoundError(PyNyaaError):
@@ -23,3 +23,10 @@ class ReleaseNotFoundError(PyNyaaError):
         super().__init__(
             f"Release not found at {url!r}\nIt may have been removed, never existed, or the ID/URL is incorrect."
         )
+
+
+class UserNotFoundError(PyNyaaError):
+    """Raised when the requested user cannot be found on Nyaa."""
+
+    def __init__(self, url: str):
+        super().__init__(f"User not found at {url!r}\nThe account may have been removed, or the name is incorrect.")
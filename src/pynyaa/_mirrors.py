@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+# Weight of the newest latency sample in a mirror's moving average.
+_ALPHA = 0.3
+# A failed mirror is avoided for this long, doubling with each consecutive failure up to the maximum.
+_COOLDOWN = 5.0
+_MAX_COOLDOWN = 300.0
+
+
+class MirrorPool:
+    """
+    Health and latency of a set of interchangeable base URLs, used to route each request.
+
+    Each mirror tracks an exponentially weighted moving average (EWMA) of its response time
+    and the number of requests currently in flight. Mirrors are ranked by their average
+    scaled by their load, so concurrent requests spread out instead of piling onto the fastest one.
+    A mirror that has not answered yet ranks first, so every mirror gets measured.
+    A mirror that fails is ranked last until its cooldown expires, but is still tried if every other mirror fails too.
+    Mirrors are given a trailing slash if they lack one, so that relative paths resolve below them.
+    It can be shared between threads.
+    """
+
+    __slots__ = ("_clock", "_down_until", "_failures", "_in_flight", "_latency", "_lock", "_mirrors")
+
+    def __init__(self, mirrors: Sequence[str], *, clock: Callable[[], float] = time.monotonic) -> None:
+        # Without the slash, urljoin("https://host/nyaa", "view/1") would drop "nyaa".
+        self._mirrors = tuple(dict.fromkeys(mirror if mirror.endswith("/") else f"{mirror}/" for mirror in mirrors))
+        self._clock = clock
+        self._latency = dict.fromkeys(self._mirrors, 0.0)
+        self._in_flight = dict.fromkeys(self._mirrors, 0)
+        self._failures = dict.fromkeys(self._mirrors, 0)
+        self._down_until = dict.fromkeys(self._mirrors, 0.0)
+        self._lock = threading.Lock()
+
+    @property
+    def mirrors(self) -> tuple[str, ...]:
+        """Every mirror, in the order given."""
+        return self._mirrors
+
+    def ranked(self) -> list[str]:
+        """Mirrors in the order they should be tried, best first."""
+        if len(self._mirrors) == 1:
+            return list(self._mirrors)
+        now = self._clock()
+        with self._lock:
+            return sorted(
+                self._mirrors,
+                key=lambda mirror: (
+                    self._down_until[mirror] > now,
+                    self._latency[mirror] * (self._in_flight[mirror] + 1),
+                ),
+            )
+
+    def begin(self, mirror: str) -> None:
+        """Record that a request to `mirror` was sent."""
+        with self._lock:
+            self._in_flight[mirror] += 1
+
+    def end(self, mirror: str, elapsed: float | None) -> None:
+        """
+        Record that a request to `mirror` completed after `elapsed` seconds,
+        or failed if `elapsed` is `None`.
+        """
+        with self._lock:
+            self._in_flight[mirror] -= 1
+            if elapsed is None:
+                self._failures[mirror] += 1
+                cooldown = min(_COOLDOWN * 2 ** (self._failures[mirror] - 1), _MAX_COOLDOWN)
+                self._down_until[mirror] = self._clock() + cooldown
+                return
+            self._failures[mirror] = 0
+            self._down_until[mirror] = 0.0
+            latency = self._latency[mirror]
+            self._latency[mirror] = elapsed if latency == 0.0 else latency + _ALPHA * (elapsed - latency)
+
+    def abandon(self, mirror: str) -> None:
+        """
+        Record that a request to `mirror` ended without an outcome, such as when it was cancelled,
+        so that it counts neither for nor against the mirror.
+        """
+        with self._lock:
+            self._in_flight[mirror] -= 1
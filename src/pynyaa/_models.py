@@ -1,12 +1,44 @@
 from __future__ import annotations
 
+import base64
+import datetime as dt
+import functools
+import hashlib
+import io
+import mmap
+import sys
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal, TypeAlias, TypeVar, cast
+from urllib.parse import parse_qs, urljoin
+
+from ._bencode import bdecode_torrent
+from ._enums import Category
+from ._errors import ParsingError
+from ._utils import make_magnet
 
 if TYPE_CHECKING:
-    import datetime as dt
+    from collections.abc import Callable, Iterator, Mapping
+
+    from typing_extensions import Self
+
+    from ._bencode import BencodeValue, Buffer
+    from ._parser import FileListParser, TorrentFragmentParser
+
+_T = TypeVar("_T")
 
-    from ._enums import Category
+TorrentDataFormat: TypeAlias = Literal["include", "base64", "exclude"]
+"""
+How `TorrentFile.data` is represented by `to_dict()`:
+as raw `bytes` (`"include"`), as a base64 encoded `str` (`"base64"`), or as `None` (`"exclude"`).
+"""
+
+CATEGORY_BY_ID: dict[str, Category] = {category.id: category for category in Category}
+"""Every category, keyed by its ID (e.g. `"1_2"`)."""
+
+CATEGORIES: tuple[Category, ...] = tuple(Category)
+"""Every category, in definition order. A category's index in this tuple is its compact integer code."""
+CATEGORY_CODES: dict[Category, int] = {category: code for code, category in enumerate(CATEGORIES)}
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -25,6 +57,145 @@ class Submitter:
     def __str__(self) -> str:
         return self.name
 
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-compatible dictionary representation of this submitter."""
+        return {"name": self.name, "url": self.url, "is_trusted": self.is_trusted, "is_banned": self.is_banned}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], /) -> Self:
+        """Create a submitter from the output of `to_dict()`."""
+        return cls(name=data["name"], url=data["url"], is_trusted=data["is_trusted"], is_banned=data["is_banned"])
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class FileEntry:
+    """Represents a single file contained in a torrent."""
+
+    path: str
+    """
+    The `/`-separated path of the file, relative to the download directory.
+    For multi-file torrents this includes the torrent's root folder.
+    """
+    size: int
+    """
+    The size of the file in bytes.
+    This is exact when decoded from the `.torrent` file, and rounded when parsed from the release page.
+    """
+
+    def __str__(self) -> str:
+        return self.path
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class Folder:
+    """Represents a folder in a torrent's file tree."""
+
+    path: str
+    """The `/`-separated path of the folder, relative to the download directory."""
+    children: tuple[Folder | FileEntry, ...]
+    """The files and subfolders directly inside this folder."""
+
+    @property
+    def size(self) -> int:
+        """The combined size of everything inside this folder, in bytes."""
+        return sum(child.size for child in self.children)
+
+    def walk(self) -> Iterator[FileEntry]:
+        """Recursively yield every file inside this folder."""
+        for child in self.children:
+            if isinstance(child, Folder):
+                yield from child.walk()
+            else:
+                yield child
+
+    def __str__(self) -> str:
+        return self.path
+
+
+def _text(value: BencodeValue | None, key: str) -> str:
+    if not isinstance(value, memoryview):
+        msg = f"Expected a string for {key!r} in torrent metainfo."
+        raise ParsingError(msg)
+    return str(value, "utf-8", "replace")
+
+
+def _integer(value: BencodeValue | None, key: str) -> int:
+    if not isinstance(value, int):
+        msg = f"Expected an integer for {key!r} in torrent metainfo."
+        raise ParsingError(msg)
+    return value
+
+
+def _files(info: dict[bytes, BencodeValue], name: str) -> tuple[FileEntry, ...]:
+    if b"files" not in info:  # Single-file torrent
+        return (FileEntry(path=name, size=_integer(info.get(b"length"), "length")),)
+
+    entries = info[b"files"]
+    if not isinstance(entries, list):  # pragma: no cover
+        msg = "Expected a list for 'files' in torrent metainfo."
+        raise ParsingError(msg)
+
+    files: list[FileEntry] = []
+    for entry in entries:
+        if not isinstance(entry, dict):  # pragma: no cover
+            msg = "Expected a dictionary for each entry in 'files'."
+            raise ParsingError(msg)
+        attr = entry.get(b"attr")
+        if isinstance(attr, memoryview) and b"p" in attr.tobytes():
+            continue  # BEP 47 padding file
+        parts = entry.get(b"path.utf-8", entry.get(b"path"))
+        if not isinstance(parts, list):  # pragma: no cover
+            msg = "Expected a list for 'path' in torrent metainfo."
+            raise ParsingError(msg)
+        path = "/".join((name, *(_text(part, "path") for part in parts)))
+        files.append(FileEntry(path=path, size=_integer(entry.get(b"length"), "length")))
+    return tuple(files)
+
+
+def _trackers(metainfo: dict[bytes, BencodeValue]) -> tuple[str, ...]:
+    trackers: dict[str, None] = {}  # Ordered set
+    tiers = metainfo.get(b"announce-list")
+    if isinstance(tiers, list):
+        for tier in tiers:
+            if isinstance(tier, list):
+                for url in tier:
+                    trackers[_text(url, "announce-list")] = None
+    if not trackers and (announce := metainfo.get(b"announce")) is not None:
+        trackers[_text(announce, "announce")] = None
+    return tuple(trackers)
+
+
+@dataclass(frozen=True, slots=True)
+class _Metainfo:
+    """Structured view of a decoded `.torrent` file."""
+
+    files: tuple[FileEntry, ...]
+    piece_length: int
+    piece_count: int
+    trackers: tuple[str, ...]
+    is_private: bool
+    infohash: str
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> _Metainfo:
+        metainfo, raw_info = bdecode_torrent(data)
+        info = metainfo[b"info"]
+        if not isinstance(info, dict):  # pragma: no cover
+            msg = "Expected a dictionary for 'info' in torrent metainfo."
+            raise ParsingError(msg)
+
+        name = _text(info.get(b"name.utf-8", info.get(b"name")), "name")
+        pieces = info.get(b"pieces")
+
+        return cls(
+            files=_files(info, name),
+            piece_length=_integer(info.get(b"piece length"), "piece length"),
+            piece_count=len(pieces) // 20 if isinstance(pieces, memoryview) else 0,
+            trackers=_trackers(metainfo),
+            is_private=info.get(b"private") == 1,
+            infohash=hashlib.sha1(raw_info).hexdigest(),
+        )
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class TorrentFile:
@@ -32,8 +203,16 @@ class TorrentFile:
 
     name: str
     """The name of the torrent."""
-    data: bytes
-    """The raw data of the torrent file."""
+    data: bytes | None
+    """
+    The raw data of the torrent file.
+    This is `None` if the torrent was streamed to disk, in which case `path` is set instead.
+
+    Note
+    ----
+    In pynyaa 3.0.0 and earlier, this was always `bytes`. Use `read()` or `open()` to get the contents
+    regardless of where the torrent is kept.
+    """
     size: int
     """The size of the torrent in bytes."""
     infohash: str
@@ -42,10 +221,188 @@ class TorrentFile:
     """The URL to the torrent file."""
     magnet: str
     """The magnet link for the torrent."""
+    path: Path | None = None
+    """
+    Location of the torrent file on disk, if it was saved to a `TorrentStore`.
+    The contents are only read from disk when accessed through `open()`, `read()`, or the metainfo properties.
+    """
+    _metainfo: _Metainfo | None = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         return self.name
 
+    def to_dict(self, *, data: TorrentDataFormat = "include") -> dict[str, Any]:
+        """
+        Return a dictionary representation of this torrent file.
+
+        Parameters
+        ----------
+        data : {"include", "base64", "exclude"}, optional
+            How to represent the raw torrent data. Use `"base64"` or `"exclude"` for JSON.
+
+        """
+        match data:
+            case "include":
+                raw: bytes | str | None = self.data
+            case "base64":
+                raw = None if self.data is None else base64.b64encode(self.data).decode("ascii")
+            case "exclude":
+                raw = None
+            case _:  # pragma: no cover
+                msg = f"Parameter 'data' expected 'include', 'base64', or 'exclude', but got {data!r}."
+                raise ValueError(msg)
+
+        return {
+            "name": self.name,
+            "data": raw,
+            "size": self.size,
+            "infohash": self.infohash,
+            "url": self.url,
+            "magnet": self.magnet,
+            "path": None if self.path is None else str(self.path),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], /) -> Self:
+        """
+        Create a torrent file from the output of `to_dict()`.
+        Base64 encoded data is decoded back to `bytes`.
+
+        If the data was dumped with `data="exclude"` and the torrent was not saved to a `TorrentStore`,
+        both `data` and `path` are `None`. The other fields are kept, but `open()`, `read()`
+        and the metainfo properties such as `files` raise `ValueError`.
+        """
+        raw = data.get("data")
+        path = data.get("path")
+        return cls(
+            name=data["name"],
+            data=base64.b64decode(raw) if isinstance(raw, str) else raw,
+            size=data["size"],
+            infohash=data["infohash"],
+            url=data["url"],
+            magnet=data["magnet"],
+            path=None if path is None else Path(path),
+        )
+
+    def open(self) -> IO[bytes]:
+        """
+        Open the torrent file for reading, whether it is held in memory or on disk.
+
+        Raises
+        ------
+        ValueError
+            If the contents are unavailable, because the torrent was serialized
+            with `data="exclude"` or expanded from a `CompactRelease`.
+
+        """
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        if self.path is not None:
+            return self.path.open("rb")
+        msg = (
+            f"The contents of {self.name!r} are unavailable: it has neither 'data' nor 'path'. "
+            "This happens when it was serialized with data='exclude' or expanded from a CompactRelease; "
+            "download it again from its 'url' instead."
+        )
+        raise ValueError(msg)
+
+    def read(self) -> bytes:
+        """
+        Return the raw contents of the torrent file, reading it from disk if necessary.
+        """
+        if self.data is not None:
+            return self.data
+        with self.open() as file:
+            return file.read()
+
+    def _decode(self) -> _Metainfo:
+        # Decoded on first access and memoized, since most callers never need it.
+        metainfo = self._metainfo
+        if metainfo is None:
+            if self.data is None and self.path is not None:
+                with self.path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    try:
+                        metainfo = _Metainfo.from_bytes(mapped)
+                    except ParsingError as error:
+                        # The traceback holds views into the map, which would keep it from being closed.
+                        raise error.with_traceback(None) from None
+            else:
+                metainfo = _Metainfo.from_bytes(self.read())
+            object.__setattr__(self, "_metainfo", metainfo)
+        return metainfo
+
+    @property
+    def files(self) -> tuple[FileEntry, ...]:
+        """
+        The files contained in the torrent, in the order they appear in the metainfo.
+
+        Raises
+        ------
+        ParsingError
+            If the torrent data is malformed.
+        ValueError
+            If the contents are unavailable. See `open()`.
+
+        """
+        return self._decode().files
+
+    @property
+    def total_size(self) -> int:
+        """
+        The exact total size of the torrent's content in bytes.
+
+        Unlike `size`, which is parsed from the rounded value shown on Nyaa,
+        this is computed from the file lengths in the metainfo.
+        """
+        return sum(file.size for file in self._decode().files)
+
+    @property
+    def piece_length(self) -> int:
+        """The number of bytes in each piece."""
+        return self._decode().piece_length
+
+    @property
+    def piece_count(self) -> int:
+        """The number of pieces."""
+        return self._decode().piece_count
+
+    @property
+    def trackers(self) -> tuple[str, ...]:
+        """
+        The tracker URLs listed in the torrent, with duplicates removed.
+        Falls back to `announce` if there's no `announce-list`.
+        """
+        return self._decode().trackers
+
+    @property
+    def is_private(self) -> bool:
+        """Indicates whether the torrent is marked as private (BEP 27)."""
+        return self._decode().is_private
+
+    @property
+    def computed_infohash(self) -> str:
+        """
+        The v1 infohash computed from the raw `info` dictionary in `data`.
+        This should always match `infohash`, which is parsed from the release page.
+        """
+        return self._decode().infohash
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class TorrentSource:
+    """The parts of a `TorrentFile` known from its download, before the release page is parsed."""
+
+    name: str
+    data: bytes | None
+    url: str
+    path: Path | None = None
+
+    def to_file(self, *, size: int, infohash: str, magnet: str) -> TorrentFile:
+        """Complete the torrent file with the fields read from the release page."""
+        return TorrentFile(
+            name=self.name, data=self.data, size=size, infohash=infohash, url=self.url, magnet=magnet, path=self.path
+        )
+
 
 @dataclass(frozen=True, kw_only=True, slots=True)
 class NyaaRelease:
@@ -110,5 +467,562 @@ class NyaaRelease:
     description: str | None
     """The release's description."""
 
+    _file_list: FileListParser | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def file_tree(self) -> tuple[Folder | FileEntry, ...]:
+        """
+        The file tree shown on the release page, without downloading the `.torrent` file.
+
+        The tree is parsed on first access and memoized. File sizes are rounded,
+        as displayed by Nyaa; use `torrent.files` for exact sizes.
+        This is empty if the release was not created by a client.
+        """
+        if self._file_list is None:
+            return ()
+        return self._file_list.tree()
+
+    def to_dict(self, *, torrent_data: TorrentDataFormat = "include") -> dict[str, Any]:
+        """
+        Return a dictionary representation of this release.
+
+        This is much faster than [`dataclasses.asdict`][dataclasses.asdict], since it never deep-copies.
+        `category` is stored by its ID and `datetime` as an ISO 8601 string.
+        The file tree from the release page is not included.
+
+        Parameters
+        ----------
+        torrent_data : {"include", "base64", "exclude"}, optional
+            How to represent the raw torrent data. Use `"base64"` or `"exclude"` for JSON.
+
+        """
+        return {
+            "id": self.id,
+            "url": self.url,
+            "title": self.title,
+            "category": self.category.id,
+            "submitter": None if self.submitter is None else self.submitter.to_dict(),
+            "datetime": self.datetime.isoformat(),
+            "information": self.information,
+            "seeders": self.seeders,
+            "leechers": self.leechers,
+            "completed": self.completed,
+            "is_trusted": self.is_trusted,
+            "is_remake": self.is_remake,
+            "torrent": self.torrent.to_dict(data=torrent_data),
+            "description": self.description,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], /) -> Self:
+        """Create a release from the output of `to_dict()`."""
+        submitter = data["submitter"]
+        return cls(
+            id=data["id"],
+            url=data["url"],
+            title=data["title"],
+            category=CATEGORY_BY_ID[data["category"]],
+            submitter=None if submitter is None else Submitter.from_dict(submitter),
+            datetime=dt.datetime.fromisoformat(data["datetime"]),
+            information=data["information"],
+            seeders=data["seeders"],
+            leechers=data["leechers"],
+            completed=data["completed"],
+            is_trusted=data["is_trusted"],
+            is_remake=data["is_remake"],
+            torrent=TorrentFile.from_dict(data["torrent"]),
+            description=data["description"],
+        )
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ReleaseMagnet:
+    """The infohash and magnet link of a release, as returned by `Nyaa.get_magnet`."""
+
+    id: int
+    """The Nyaa ID of the release."""
+    infohash: str
+    """The infohash of the torrent."""
+    magnet: str
+    """The magnet link for the torrent."""
+
+    def __str__(self) -> str:
+        return self.magnet
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ReleaseStats:
+    """The counters of a release that change over time, as returned by `Nyaa.get_stats`."""
+
+    id: int
+    """The Nyaa ID of the release."""
+    seeders: int
+    """The number of seeders."""
+    leechers: int
+    """The number of leechers."""
+    completed: int
+    """The number of completed downloads."""
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class SearchResult:
+    """
+    A release as listed on a search results page.
+
+    Everything here is read from the listing row itself, so it is available without fetching
+    the release page or its `.torrent` file. The submitter, information, description and file
+    list only appear on the release page and require `Nyaa.get`.
+    """
+
+    id: int
+    """The Nyaa ID of the release."""
+    url: str
+    """The URL to the Nyaa release page."""
+    title: str
+    """The title of the release."""
+    category: Category
+    """The release's category."""
+    datetime: dt.datetime
+    """The date and time at which the release was submitted."""
+    size: int
+    """The size of the torrent in bytes."""
+    seeders: int
+    """The number of seeders."""
+    leechers: int
+    """The number of leechers."""
+    completed: int
+    """The number of completed downloads."""
+    comments: int
+    """The number of comments."""
+    is_trusted: bool
+    """Indicates whether the upload is trusted (green) or not."""
+    is_remake: bool
+    """Indicates whether the upload is a remake (red) or not."""
+    torrent_url: str
+    """The URL to the `.torrent` file."""
+    infohash: str
+    """The infohash of the torrent."""
+    magnet: str
+    """The magnet link for the torrent."""
+
+    def __str__(self) -> str:
+        return self.title
+
+
+@dataclass(kw_only=True, slots=True)
+class SearchStats:
+    """
+    Counters updated by `Nyaa.search` and `Nyaa.sweep` as they run.
+
+    Pass an instance as `search(..., stats=...)` and read it during or after the iteration.
+
+    Examples
+    --------
+    ```py
+    stats = SearchStats()
+    releases = list(nyaa.search("MTBB", stats=stats))
+    print(f"Skipped {stats.duplicates} duplicates across {stats.pages} pages")
+    ```
+
+    """
+
+    pages: int = 0
+    """The number of result pages fetched."""
+    results: int = 0
+    """The number of releases yielded."""
+    duplicates: int = 0
+    """
+    The number of results skipped because an earlier page already listed them.
+    This happens when new releases are uploaded during a search and shift the results between pages.
+    """
+    filtered: int = 0
+    """The number of listed results skipped because they did not match `where`."""
+    truncated: int = 0
+    """
+    The number of `Nyaa.sweep` partitions that hit Nyaa's result cap and could not be split any further.
+    Some of their results may be missing.
+    """
+
+
+@dataclass(kw_only=True, slots=True)
+class TransferStats:
+    """
+    Counters of the response bodies a client has received, updated as it runs.
+
+    Read it from `Nyaa.transfer_stats` to see how much bandwidth compression saves.
+    `received_bytes` is what went over the network, while `decoded_bytes` is the size after decompression.
+
+    Examples
+    --------
+    ```py
+    with Nyaa() as nyaa:
+        releases = list(nyaa.search("MTBB", limit=75))
+        stats = nyaa.transfer_stats
+        print(f"{stats.compressed} of {stats.responses} responses compressed")
+        print(f"Received {stats.received_bytes:,} bytes for {stats.decoded_bytes:,} bytes of content")
+    ```
+
+    """
+
+    responses: int = 0
+    """The number of responses received."""
+    compressed: int = 0
+    """The number of responses that were sent compressed, with a `Content-Encoding` other than `identity`."""
+    received_bytes: int = 0
+    """The number of body bytes received over the network, before decompression."""
+    decoded_bytes: int = 0
+    """The number of body bytes after decompression."""
+
+
+@functools.lru_cache(maxsize=64)
+def _trackers_from_tail(tail: str) -> tuple[str, ...]:
+    # Memoized on the raw "&tr=..." tail of a magnet link, so every release with the same
+    # tracker list shares a single tuple. Nyaa uses very few distinct lists; the bound keeps
+    # arbitrary ones from piling up over a long crawl.
+    return tuple(parse_qs(tail.lstrip("&")).get("tr", ()))
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CompactRelease:
+    """
+    Memory-compact representation of a `NyaaRelease`, meant for caching releases in bulk.
+
+    URLs and the magnet link are derived on access instead of stored, the category is a
+    small integer code, and the date is a Unix timestamp. The base URL and tracker list are
+    shared between all instances, and submitters are shared as long as the releases came
+    from the same client. The raw torrent data and file tree are not kept.
+
+    Examples
+    --------
+    ```py
+    cache = {
+        release.id: CompactRelease.from_release(release, base_url=nyaa.base_url)
+        for release in nyaa.search("MTBB")
+    }
+    ```
+
+    """
+
+    id: int
+    """The Nyaa ID of the release."""
+    base_url: str
+    """Base URL of the Nyaa instance the release came from."""
+    title: str
+    """The title of the release."""
+    category_code: int
+    """Index of the release's category in `pynyaa.Category`."""
+    submitter: Submitter | None
+    """The user who submitted the release, or `None` if anonymous."""
+    timestamp: int
+    """Unix timestamp at which the release was submitted."""
+    information: str | None
+    """Additional information about the release."""
+    seeders: int = field(compare=False)
+    """The number of seeders."""
+    leechers: int = field(compare=False)
+    """The number of leechers."""
+    completed: int = field(compare=False)
+    """The number of completed downloads."""
+    is_trusted: bool
+    """Indicates whether the upload is trusted (green) or not."""
+    is_remake: bool
+    """Indicates whether the upload is a remake (red) or not."""
+    torrent_name: str
+    """The name of the `.torrent` file."""
+    size: int
+    """The size of the torrent in bytes."""
+    infohash: str
+    """The infohash of the torrent."""
+    trackers: tuple[str, ...]
+    """The trackers included in the magnet link."""
+    description: str | None
+    """The release's description."""
+
+    def __str__(self) -> str:
+        return self.title
+
+    @property
+    def url(self) -> str:
+        """The URL to the Nyaa release page."""
+        return urljoin(self.base_url, f"/view/{self.id}")
+
+    @property
+    def torrent_url(self) -> str:
+        """The URL to the `.torrent` file."""
+        return urljoin(self.base_url, f"/download/{self.id}.torrent")
+
+    @property
+    def magnet(self) -> str:
+        """The magnet link for the torrent."""
+        return make_magnet(self.infohash, self.title, self.trackers)
+
+    @property
+    def category(self) -> Category:
+        """The release's category."""
+        return CATEGORIES[self.category_code]
+
+    @property
+    def datetime(self) -> dt.datetime:
+        """The date and time at which the release was submitted."""
+        return dt.datetime.fromtimestamp(self.timestamp, tz=dt.timezone.utc)
+
+    @classmethod
+    def from_release(cls, release: NyaaRelease, /, *, base_url: str) -> Self:
+        """
+        Create a compact copy of `release`.
+
+        Parameters
+        ----------
+        release : NyaaRelease
+            The release to compact.
+        base_url : str
+            Base URL of the client that fetched `release`, i.e. its `base_url` property.
+            The release's URLs are derived from it on access.
+
+        """
+        magnet = release.torrent.magnet
+        tail = magnet[magnet.find("&tr=") :] if "&tr=" in magnet else ""
+        return cls(
+            id=release.id,
+            base_url=sys.intern(base_url),
+            title=release.title,
+            category_code=CATEGORY_CODES[release.category],
+            submitter=release.submitter,
+            timestamp=int(release.datetime.timestamp()),
+            information=release.information,
+            seeders=release.seeders,
+            leechers=release.leechers,
+            completed=release.completed,
+            is_trusted=release.is_trusted,
+            is_remake=release.is_remake,
+            torrent_name=release.torrent.name,
+            size=release.torrent.size,
+            infohash=release.torrent.infohash,
+            trackers=_trackers_from_tail(tail),
+            description=release.description,
+        )
+
+    def to_release(self) -> NyaaRelease:
+        """
+        Expand back into a full `NyaaRelease`.
+        The torrent's `data` is `None`, since it is not kept.
+        """
+        return NyaaRelease(
+            id=self.id,
+            url=self.url,
+            title=self.title,
+            category=self.category,
+            submitter=self.submitter,
+            datetime=self.datetime,
+            information=self.information,
+            seeders=self.seeders,
+            leechers=self.leechers,
+            completed=self.completed,
+            is_trusted=self.is_trusted,
+            is_remake=self.is_remake,
+            torrent=TorrentFile(
+                name=self.torrent_name,
+                data=None,
+                size=self.size,
+                infohash=self.infohash,
+                url=self.torrent_url,
+                magnet=self.magnet,
+            ),
+            description=self.description,
+        )
+
+
+_LAZY_FIELDS = frozenset(
+    {
+        "title",
+        "category",
+        "submitter",
+        "datetime",
+        "information",
+        "seeders",
+        "leechers",
+        "completed",
+        "is_trusted",
+        "is_remake",
+        "torrent",
+        "description",
+        "file_list",
+    }
+)
+
+
+class LazyRelease:
+    """
+    A `NyaaRelease` whose fields are parsed from the release page on first access.
+
+    Returned by `Nyaa.get` and `Nyaa.search` when called with `lazy=True`. It has the same
+    attributes as `NyaaRelease`, but only the metadata panel, description, and file list are kept
+    from the page, each is parsed only when one of its fields is read, and every field is
+    memoized. Once all fields have been read, the retained page fragments are released.
+    It can be shared between threads: a field read by several threads at once may be parsed
+    more than once, but they all get the same value.
+
+    This makes workflows that only need a few fields (such as the title and magnet link)
+    much cheaper. Use `to_release()` to materialize a regular `NyaaRelease`.
+    """
+
+    __slots__ = (
+        "_cache",
+        "_page",
+        "_submitters",
+        "_torrent",
+        "id",
+        "url",
+    )
+
+    def __init__(
+        self,
+        *,
+        id: int,
+        url: str,
+        page: TorrentFragmentParser,
+        torrent: TorrentSource,
+        submitters: dict[Submitter, Submitter] | None = None,
+    ) -> None:
+        self.id = id
+        """The Nyaa ID of the release."""
+        self.url = url
+        """The URL to the Nyaa release page."""
+        self._page: TorrentFragmentParser | None = page
+        self._cache: dict[str, Any] = {}
+        self._torrent = torrent
+        self._submitters = {} if submitters is None else submitters
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r}, url={self.url!r})"
+
     def __str__(self) -> str:
         return self.title
+
+    @property
+    def is_materialized(self) -> bool:
+        """Whether every field has been parsed and the page fragments have been released."""
+        return self._page is None
+
+    def _field(self, name: str, compute: Callable[[TorrentFragmentParser], _T]) -> _T:
+        cache = self._cache
+        if name in cache:
+            return cast("_T", cache[name])
+        page = self._page
+        if page is None:  # Another thread cached the last field in the meantime
+            return cast("_T", cache[name])
+        # If threads race to compute a field, they all return the first value cached.
+        value = cache.setdefault(name, compute(page))
+        if len(cache) == len(_LAZY_FIELDS):
+            self._page = None
+        return cast("_T", value)
+
+    @property
+    def title(self) -> str:
+        """The title of the release."""
+        return self._field("title", lambda page: page.panel.title())
+
+    @property
+    def category(self) -> Category:
+        """The release's category."""
+        return self._field("category", lambda page: page.panel.category())
+
+    @property
+    def submitter(self) -> Submitter | None:
+        """The user who submitted the release, or `None` if anonymous."""
+
+        def compute(page: TorrentFragmentParser) -> Submitter | None:
+            submitter = page.panel.submitter()
+            return None if submitter is None else self._submitters.setdefault(submitter, submitter)
+
+        return self._field("submitter", compute)
+
+    @property
+    def datetime(self) -> dt.datetime:
+        """The date and time at which the release was submitted."""
+        return self._field("datetime", lambda page: page.panel.datetime())
+
+    @property
+    def information(self) -> str | None:
+        """Additional information about the release."""
+        return self._field("information", lambda page: page.panel.information())
+
+    @property
+    def seeders(self) -> int:
+        """The number of seeders."""
+        return self._field("seeders", lambda page: page.panel.seeders())
+
+    @property
+    def leechers(self) -> int:
+        """The number of leechers."""
+        return self._field("leechers", lambda page: page.panel.leechers())
+
+    @property
+    def completed(self) -> int:
+        """The number of completed downloads."""
+        return self._field("completed", lambda page: page.panel.completed())
+
+    @property
+    def is_trusted(self) -> bool:
+        """Indicates whether the upload is trusted (green) or not."""
+        return self._field("is_trusted", lambda page: page.is_trusted())
+
+    @property
+    def is_remake(self) -> bool:
+        """Indicates whether the upload is a remake (red) or not."""
+        return self._field("is_remake", lambda page: page.is_remake())
+
+    @property
+    def torrent(self) -> TorrentFile:
+        """The `.torrent` file associated with this release."""
+
+        def compute(page: TorrentFragmentParser) -> TorrentFile:
+            panel = page.panel
+            return self._torrent.to_file(size=panel.size(), infohash=panel.infohash(), magnet=panel.magnet())
+
+        return self._field("torrent", compute)
+
+    @property
+    def description(self) -> str | None:
+        """The release's description."""
+        return self._field("description", lambda page: page.description())
+
+    @property
+    def file_tree(self) -> tuple[Folder | FileEntry, ...]:
+        """The file tree shown on the release page. See `NyaaRelease.file_tree`."""
+        return self._file_list().tree()
+
+    def _file_list(self) -> FileListParser:
+        # The file list parser is itself lazy, so it is cached rather than its tree.
+        return self._field("file_list", lambda page: page.file_list())
+
+    def to_release(self) -> NyaaRelease:
+        """Parse every remaining field and return the equivalent `NyaaRelease`."""
+        release = NyaaRelease(
+            id=self.id,
+            url=self.url,
+            title=self.title,
+            category=self.category,
+            submitter=self.submitter,
+            datetime=self.datetime,
+            information=self.information,
+            seeders=self.seeders,
+            leechers=self.leechers,
+            completed=self.completed,
+            is_trusted=self.is_trusted,
+            is_remake=self.is_remake,
+            torrent=self.torrent,
+            description=self.description,
+        )
+        object.__setattr__(release, "_file_list", self._file_list())
+        return release
+
+    def to_dict(self, *, torrent_data: TorrentDataFormat = "include") -> dict[str, Any]:
+        """
+        Parse every remaining field and return a dictionary representation of the release.
+        See `NyaaRelease.to_dict`.
+        """
+        return self.to_release().to_dict(torrent_data=torrent_data)
@@ -3,14 +3,15 @@ from __future__ import annotations
 import datetime as dt
 import math
 import re
-from typing import TYPE_CHECKING, NewType
+from html import unescape
+from typing import TYPE_CHECKING, Any, AnyStr, NewType, TypeAlias, TypedDict, cast
 from urllib.parse import unquote, urljoin
 
 import bs4
 
 from ._enums import Category
 from ._errors import ParsingError
-from ._models import Submitter
+from ._models import CATEGORY_BY_ID, FileEntry, Folder, ReleaseMagnet, ReleaseStats, SearchResult, Submitter
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -18,6 +19,58 @@ if TYPE_CHECKING:
 TorrentID = NewType("TorrentID", int)
 PageNumber = NewType("PageNumber", int)
 
+# Nyaa stops paginating a query after 1,000 results, which is 14 pages of 75.
+MAX_RESULTS = 1000
+RESULTS_PER_PAGE = 75
+MAX_RESULT_PAGES = 14
+
+PANEL_SELECTOR = "div:is(.panel.panel-default, .panel.panel-success, .panel.panel-danger)"
+
+# A release's title link is the only link in the results table that ends right after the ID.
+# The comment link (`/view/{id}#comments`) does not, and there is nothing here to backtrack over.
+# The pattern starts at "view/" rather than "<a href=", since the engine scans for the first byte
+# of a pattern, and "v" is much rarer than "<" in the table.
+_RESULT_ID = re.compile(rb'view/(\d+)"')
+
+# One result row. Rows never nest, so the row ends at the first closing tag.
+_RESULT_ROW = re.compile(rb'<tr class="([a-z]+)">(.*?)</tr>', re.DOTALL)
+_RESULT_ROW_FIELDS = re.compile(
+    rb'<a href="/\?c=(\d_\d)".*?'
+    rb'(?:class="comments"[^>]*>(?:\s*<i[^>]*></i>)?\s*(\d+).*?)?'
+    rb'<a href="/view/(\d+)" title="([^"]*)".*?'
+    rb'<a href="(magnet:\?xt=urn:btih:([0-9a-fA-F]+)[^"]*)".*?'
+    rb'<td class="text-center">([^<]*)</td>\s*'
+    rb'<td class="text-center" data-timestamp="(\d+)">[^<]*</td>\s*'
+    rb'<td class="text-center">(\d+)</td>\s*'
+    rb'<td class="text-center">(\d+)</td>\s*'
+    rb'<td class="text-center">(\d+)</td>',
+    re.DOTALL,
+)
+
+# The counters in a release page's panel, which are rendered without any nested markup around the number
+# apart from an optional colored span.
+_RELEASE_STAT = re.compile(
+    rb'<div class="col-md-1">(Seeders|Leechers|Completed):</div>\s*<div class="col-md-5">(?:<span[^>]*>)?(\d+)'
+)
+
+_RELEASE_INFOHASH = re.compile(rb'Info hash:</div>\s*<div class="col-md-5"><kbd>([0-9a-fA-F]{40})</kbd>')
+# The panel footer's magnet link comes before the description and comments, which are rendered client-side anyway.
+_RELEASE_MAGNET = re.compile(rb'<a href="(magnet:\?[^"]*)"')
+
+# Everything parsed from a release page comes before its comments. The file list is the last of it,
+# and its panel is closed right before the comments start.
+_PAGE_MARKERS = (b'<div class="torrent-file-list', b"<!--/.panel -->")
+# `parse_release_stats` and `parse_release_magnet` only read the metadata panel, which comes first.
+_PANEL_MARKERS = (b'<div class="panel panel-', b"<!--/.panel -->")
+
+Markup: TypeAlias = str | bytes | bytearray | memoryview
+"""
+HTML as decoded text or as the raw response body.
+
+Nyaa always serves UTF-8, so raw bodies are decoded without charset detection,
+and only the parts that are actually parsed are decoded.
+"""
+
 
 class SafeTag:
     """Wrapper around a `bs4.Tag` that guarantees non-None selector results."""
@@ -34,9 +87,17 @@ class SafeTag:
             raise ParsingError(msg)
         return SafeTag(tag)
 
+    def select(self, selector: str) -> Iterator[SafeTag]:
+        for tag in self._tag.select(selector):
+            yield SafeTag(tag)
+
     def get_text(self) -> str:
         return self._tag.get_text().strip()
 
+    def get_own_text(self) -> str:
+        """Text of this element's direct children only, excluding nested elements."""
+        return "".join(self._tag.find_all(string=True, recursive=False)).strip()
+
     @property
     def attrs(self) -> dict[str, str]:
         return self._tag.attrs  # type: ignore[return-value]
@@ -61,6 +122,10 @@ class SafeSoup:
         for tag in self._soup.select(selector):
             yield SafeTag(tag)
 
+    def decompose(self) -> None:
+        """Destroy the tree, breaking its reference cycles so that it is freed immediately."""
+        self._soup.decompose()
+
 
 class TorrentPanelParser:
     """Parser for a torrent's metadata panel (title, category, size, etc.)."""
@@ -115,26 +180,7 @@ class TorrentPanelParser:
         return information
 
     def size(self) -> int:
-        value, unit = self.select_field("File size:").get_text().split(" ", maxsplit=1)
-
-        match unit:  # pragma: no cover
-            case "Bytes":
-                multiplier = 1
-            case "KiB":
-                multiplier = 1024
-            case "MiB":
-                multiplier = 1024**2
-            case "GiB":
-                multiplier = 1024**3
-            case "TiB":
-                multiplier = 1024**4
-            case "PiB":
-                multiplier = 1024**5
-            case _ as unreachable:
-                msg = f"Unsupported file size unit: {unreachable!r}"
-                raise ParsingError(msg)
-
-        return math.ceil(float(value) * multiplier)
+        return parse_size(self.select_field("File size:").get_text())
 
     def infohash(self) -> str:
         selector = '.panel-body > .row > .col-md-offset-6.col-md-1:-soup-contains-own("Info hash:") + .col-md-5'
@@ -144,15 +190,52 @@ class TorrentPanelParser:
         return self._body.select_one('.panel-footer.clearfix > a[href^="magnet:"]').attrs["href"]
 
 
+class FileListParser:
+    """
+    Parser for the file list on a torrent details page.
+
+    Holds only the file list's HTML fragment and defers parsing until `tree()` is first called.
+    """
+
+    __slots__ = ("_html", "_tree")
+
+    def __init__(self, html: str) -> None:
+        # The HTML is dropped once the tree has been parsed.
+        self._html: str | None = html
+        self._tree: tuple[Folder | FileEntry, ...] = ()
+
+    def _children(self, parent: SafeTag, path: str) -> tuple[Folder | FileEntry, ...]:
+        children: list[Folder | FileEntry] = []
+        for item in parent.select(":scope > ul > li"):
+            for folder in item.select(":scope > a.folder"):
+                folder_path = f"{path}{folder.get_text()}"
+                children.append(Folder(path=folder_path, children=self._children(item, f"{folder_path}/")))
+                break
+            else:
+                size = item.select_one(":scope > .file-size").get_text().strip("()")
+                children.append(FileEntry(path=f"{path}{item.get_own_text()}", size=parse_size(size)))
+        return tuple(children)
+
+    def tree(self) -> tuple[Folder | FileEntry, ...]:
+        html = self._html
+        if html is not None:  # Otherwise the tree is parsed already, possibly by another thread
+            soup = bs4.BeautifulSoup(html, "html.parser")
+            self._tree = () if soup.div is None else self._children(SafeTag(soup.div), "")
+            soup.decompose()
+            self._html = None  # No longer needed once parsed
+        return self._tree
+
+
 class TorrentPageParser:
     """Parser for a full torrent details page, including description and status."""
 
-    __slots__ = ("_base_url", "_body", "_soup")
+    __slots__ = ("_base_url", "_body", "_html", "_soup")
 
-    def __init__(self, *, html: str, base_url: str) -> None:
-        self._soup = SafeSoup(html)
+    def __init__(self, *, html: Markup, base_url: str) -> None:
+        self._html = decode(html)
+        self._soup = SafeSoup(self._html)
         self._base_url = base_url
-        self._body = self._soup.select_one("div:is(.panel.panel-default, .panel.panel-success, .panel.panel-danger)")
+        self._body = self._soup.select_one(PANEL_SELECTOR)
 
     @property
     def panel(self) -> TorrentPanelParser:
@@ -165,29 +248,365 @@ class TorrentPageParser:
         return "panel-danger" in self._body.attrs["class"]
 
     def description(self) -> str | None:
-        description = self._soup.select_one("#torrent-description").get_text()
-        if description == "#### No description.":
-            return None
-        return description
+        return parse_description(self._soup.select_one("#torrent-description"))
+
+    def file_list(self) -> FileListParser:
+        return FileListParser(slice_element(self._html, '<div class="torrent-file-list'))
+
+    def decompose(self) -> None:
+        """Destroy the page tree once every field has been read."""
+        self._soup.decompose()
+
+
+class TorrentFragmentParser:
+    """
+    Parser for a torrent details page that never builds a tree for the whole page.
+
+    The metadata panel, description, and file list are sliced out of the raw HTML up front,
+    and each fragment is parsed only when one of its fields is first requested.
+    Exposes the same interface as `TorrentPageParser`.
+    """
+
+    __slots__ = ("_base_url", "_body", "_description", "_file_list", "_panel")
+
+    def __init__(self, *, html: Markup, base_url: str) -> None:
+        raw = encode(html)
+        self._base_url = base_url
+        self._body: SafeTag | None = None
+        self._panel = decode(slice_panel(raw))
+        # The description is escaped text, so it never contains a nested <div>.
+        start = raw.find(b'id="torrent-description"')
+        self._description = decode(slice_element(raw, "<div", raw.rfind(b"<div", 0, start))) if start != -1 else ""
+        self._file_list = decode(slice_element(raw, '<div class="torrent-file-list'))
+
+    def _panel_body(self) -> SafeTag:
+        body = self._body
+        if body is None:
+            panel = self._panel
+            if not panel:  # Parsed by another thread in the meantime
+                return cast("SafeTag", self._body)
+            body = self._body = SafeSoup(panel).select_one(PANEL_SELECTOR)
+            self._panel = ""  # No longer needed once parsed
+        return body
+
+    @property
+    def panel(self) -> TorrentPanelParser:
+        return TorrentPanelParser(body=self._panel_body(), base_url=self._base_url)
+
+    def is_trusted(self) -> bool:
+        return "panel-success" in self._panel_body().attrs["class"]
+
+    def is_remake(self) -> bool:
+        return "panel-danger" in self._panel_body().attrs["class"]
+
+    def description(self) -> str | None:
+        return parse_description(SafeSoup(self._description).select_one("#torrent-description"))
+
+    def file_list(self) -> FileListParser:
+        return FileListParser(self._file_list)
+
+
+class PageFields(TypedDict):
+    """
+    Every field parsed from a torrent details page, as plain picklable values.
+
+    The submitter is kept as its `Submitter.to_dict()` form so that the client can share
+    a single `Submitter` instance between releases. The file list is its raw HTML fragment.
+    """
+
+    title: str
+    category: Category
+    submitter: dict[str, Any] | None
+    datetime: dt.datetime
+    information: str | None
+    seeders: int
+    leechers: int
+    completed: int
+    is_trusted: bool
+    is_remake: bool
+    size: int
+    infohash: str
+    magnet: str
+    description: str | None
+    file_list: str
+
+
+def parse_torrent_page(html: Markup, base_url: str) -> PageFields:
+    """
+    Parse a torrent details page into a `PageFields` dictionary.
+
+    This is a module-level function taking and returning only picklable values,
+    so that it can be run in a `concurrent.futures.ProcessPoolExecutor`.
+    """
+    html = decode(html)
+    parsed = TorrentPageParser(html=html, base_url=base_url)
+    panel = parsed.panel
+    submitter = panel.submitter()
+    fields: PageFields = {
+        "title": panel.title(),
+        "category": panel.category(),
+        "submitter": None if submitter is None else submitter.to_dict(),
+        "datetime": panel.datetime(),
+        "information": panel.information(),
+        "seeders": panel.seeders(),
+        "leechers": panel.leechers(),
+        "completed": panel.completed(),
+        "is_trusted": parsed.is_trusted(),
+        "is_remake": parsed.is_remake(),
+        "size": panel.size(),
+        "infohash": panel.infohash(),
+        "magnet": panel.magnet(),
+        "description": parsed.description(),
+        "file_list": slice_element(html, '<div class="torrent-file-list'),
+    }
+    parsed.decompose()
+    return fields
+
+
+def parse_release_magnet(html: Markup, id: int) -> ReleaseMagnet:
+    """
+    Read only the infohash and magnet link from a torrent details page.
+    They are matched in the raw page, without decoding it or building a tree.
+    """
+    html = encode(html)
+    infohash = _RELEASE_INFOHASH.search(html)
+    magnet = _RELEASE_MAGNET.search(html)
+    if infohash is None or magnet is None:  # pragma: no cover
+        msg = f"Missing expected field: {'Info hash' if infohash is None else 'Magnet'!r}"
+        raise ParsingError(msg)
+    return ReleaseMagnet(id=id, infohash=infohash[1].decode().lower(), magnet=unescape(magnet[1].decode()))
+
+
+def parse_release_stats(html: Markup, id: int) -> ReleaseStats:
+    """
+    Read only the seeders, leechers and completed counters from a torrent details page.
+    They are matched in the raw page, without decoding it or building a tree.
+    """
+    stats = {label: int(value) for label, value in _RELEASE_STAT.findall(encode(html))}
+    try:
+        return ReleaseStats(
+            id=id, seeders=stats[b"Seeders"], leechers=stats[b"Leechers"], completed=stats[b"Completed"]
+        )
+    except KeyError as error:  # pragma: no cover
+        msg = f"Missing expected field: {error.args[0].decode()!r}"
+        raise ParsingError(msg) from None
+
+
+class ReleasePageReader:
+    """
+    Accumulate a torrent details page as it is received, until every part of it that is parsed is complete.
+
+    This lets the rest of the page, comments included, be skipped without being downloaded.
+    Each chunk is only scanned once, so reading a page takes time linear in the part that is read.
+    """
+
+    __slots__ = ("_found", "_html", "_markers", "_scanned")
+
+    def __init__(self, *, panel_only: bool = False) -> None:
+        self._html = bytearray()
+        # Markers that complete the page once all of them have been found, in order.
+        self._markers = _PANEL_MARKERS if panel_only else _PAGE_MARKERS
+        self._found = 0
+        self._scanned = 0
+
+    def feed(self, chunk: bytes) -> bool:
+        """Add the next chunk of the page, and return whether every part that is parsed is complete."""
+        html = self._html
+        html += chunk
+        while self._found < len(self._markers):
+            marker = self._markers[self._found]
+            index = html.find(marker, self._scanned)
+            if index == -1:
+                # The marker may be split between this chunk and the next one.
+                self._scanned = max(self._scanned, len(html) - len(marker) + 1)
+                return False
+            self._scanned = index + len(marker)
+            self._found += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self._html)
+
+    def html(self) -> bytes:
+        """Return the page received so far."""
+        return bytes(self._html)
 
 
 class SearchPageParser:
-    """Parser for search result pages, yielding torrent IDs and pagination info."""
+    """
+    Parser for search result pages, yielding torrent IDs and pagination info.
 
-    __slots__ = ("_html", "_soup")
+    Both are extracted up front into compact tuples, so neither the page nor a tree
+    for it is kept alive while the caller works through the results.
+    If `base_url` is given, every result row is also read into a `SearchResult`.
+    """
 
-    def __init__(self, html: str) -> None:
-        self._html = html
-        self._soup = SafeSoup(html)
+    __slots__ = ("_has_next", "_pages", "_results", "_rows")
+
+    def __init__(self, html: Markup, *, base_url: str | None = None) -> None:
+        raw = encode(html)
+        if base_url is None:
+            self._rows: tuple[SearchResult, ...] = ()
+            self._results = _result_ids(raw)
+        else:
+            self._rows = _result_rows(raw, base_url)
+            self._results = tuple(TorrentID(row.id) for row in self._rows)
+        self._pages, self._has_next = _pagination(raw)
 
     def pages(self) -> Iterator[PageNumber]:
-        pages = self._soup.select("ul.pagination > li:not(.next) > a[href]")
-        for page in pages:
-            yield PageNumber(int(page.get_text()))
+        return iter(self._pages)
+
+    def has_next(self) -> bool:
+        return self._has_next
 
     def results(self) -> Iterator[TorrentID]:
-        for id in re.findall(r"<a href=\"(?:/view/(\d+))\" title=\".*\">.*</a>", self._html):
-            yield TorrentID(int(id))
+        return iter(self._results)
+
+    def rows(self) -> Iterator[SearchResult]:
+        return iter(self._rows)
+
+
+def _results_table(html: bytes) -> memoryview:
+    start = html.find(b"torrent-list")
+    if start == -1:  # No results
+        return memoryview(b"")
+    # The results table is the last table on the page. Searching backwards for its end
+    # is much cheaper than scanning the whole table for a "</table>" full of common bytes.
+    end = html.rfind(b"</table>", start)
+    return memoryview(html)[start : len(html) if end == -1 else end]
+
+
+def _result_ids(html: bytes) -> tuple[TorrentID, ...]:
+    # Matched against the raw body, so the page never has to be decoded just to find the IDs.
+    return tuple(TorrentID(int(id)) for id in _RESULT_ID.findall(_results_table(html)))
+
+
+def _result_rows(html: bytes, base_url: str) -> tuple[SearchResult, ...]:
+    # Like the IDs, rows are read with regular expressions straight from the raw body.
+    # Only the matched fields are decoded, and no tree is built for the table.
+    rows = []
+    for row in _RESULT_ROW.finditer(_results_table(html)):
+        status, body = row.groups()
+        fields = _RESULT_ROW_FIELDS.search(body)
+        if fields is None:  # pragma: no cover
+            msg = f"Unexpected search result row: {decode(row[0])!r}"
+            raise ParsingError(msg)
+        category, comments, id, title, magnet, infohash, size, timestamp, seeders, leechers, completed = fields.groups()
+        rows.append(
+            SearchResult(
+                id=int(id),
+                url=urljoin(base_url, f"/view/{int(id)}"),
+                title=unescape(decode(title)),
+                category=CATEGORY_BY_ID[category.decode()],
+                datetime=dt.datetime.fromtimestamp(int(timestamp), tz=dt.timezone.utc),
+                size=parse_size(size.decode().strip()),
+                seeders=int(seeders),
+                leechers=int(leechers),
+                completed=int(completed),
+                comments=int(comments or 0),
+                is_trusted=status == b"success",
+                is_remake=status == b"danger",
+                torrent_url=urljoin(base_url, f"/download/{int(id)}.torrent"),
+                infohash=infohash.decode().lower(),
+                magnet=unescape(decode(magnet)),
+            )
+        )
+    return tuple(rows)
+
+
+def _pagination(html: bytes) -> tuple[tuple[PageNumber, ...], bool]:
+    """Return the page numbers linked from the pagination list, and whether it links to a next page."""
+    # Only the pagination list is parsed, and its tree is destroyed as soon as the numbers are read.
+    fragment = slice_element(html, '<ul class="pagination')
+    if not fragment:
+        return (), False
+    soup = SafeSoup(decode(fragment))
+    pages = tuple(PageNumber(int(page.get_text())) for page in soup.select("ul.pagination > li:not(.next) > a[href]"))
+    has_next = next(soup.select("ul.pagination > li.next:not(.disabled) > a[href]"), None) is not None
+    soup.decompose()
+    return pages, has_next
+
+
+def decode(html: Markup) -> str:
+    """Return `html` as text, decoding raw bodies as UTF-8."""
+    if isinstance(html, str):
+        return html
+    return str(html, "utf-8", errors="replace")
+
+
+def encode(html: Markup) -> bytes:
+    """Return `html` as `bytes`, without copying if it already is."""
+    return html.encode() if isinstance(html, str) else bytes(html)
+
+
+def like(html: AnyStr, text: str) -> AnyStr:
+    """Return `text` as the same type as `html`, so that it can be searched for in it."""
+    return text if isinstance(html, str) else text.encode()
+
+
+def slice_element(html: AnyStr, marker: str, start: int = 0) -> AnyStr:
+    """
+    Return the raw HTML of the first element opened by `marker` at or after `start`,
+    or an empty string if there is none.
+
+    Only valid for elements that contain no nested element of the same tag, since the
+    slice ends at the first matching closing tag. Slicing the raw HTML isolates an element
+    without building a tree for the rest of the page.
+    """
+    start = html.find(like(html, marker), start)
+    if start == -1:  # pragma: no cover
+        return html[:0]
+    tag = marker[1:].split(maxsplit=1)[0]
+    closing = like(html, f"</{tag}>")
+    end = html.find(closing, start)
+    if end == -1:  # pragma: no cover
+        return html[:0]
+    return html[start : end + len(closing)]
+
+
+def slice_panel(html: AnyStr) -> AnyStr:
+    """
+    Return the raw HTML of a torrent page's metadata panel.
+    Falls back to the whole page if the panel cannot be located.
+    """
+    # Unlike the description or file list, the panel contains nested <div>s,
+    # but Nyaa marks its end with a comment.
+    start = html.find(like(html, '<div class="panel panel-'))
+    end = html.find(like(html, "<!--/.panel -->"), start)
+    if start == -1 or end == -1:  # pragma: no cover
+        return html
+    return html[start:end]
+
+
+def parse_description(tag: SafeTag) -> str | None:
+    description = tag.get_text()
+    if description == "#### No description.":
+        return None
+    return description
+
+
+def parse_size(text: str) -> int:
+    """Convert a human-readable size as displayed by Nyaa (e.g. `1.4 GiB`) to bytes."""
+    value, unit = text.split(" ", maxsplit=1)
+
+    match unit:  # pragma: no cover
+        case "Bytes":
+            multiplier = 1
+        case "KiB":
+            multiplier = 1024
+        case "MiB":
+            multiplier = 1024**2
+        case "GiB":
+            multiplier = 1024**3
+        case "TiB":
+            multiplier = 1024**4
+        case "PiB":
+            multiplier = 1024**5
+        case _ as unreachable:
+            msg = f"Unsupported file size unit: {unreachable!r}"
+            raise ParsingError(msg)
+
+    return math.ceil(float(value) * multiplier)
 
 
 def parse_torrent_filename(content_disposition: str) -> str:
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+from typing import IO, TYPE_CHECKING, Any
+
+from ._models import NyaaRelease
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from ._models import LazyRelease, TorrentDataFormat
+
+
+def _import_msgpack() -> Any:
+    try:
+        import msgpack  # noqa: PLC0415
+    except ImportError:  # pragma: no cover
+        msg = "msgpack serialization requires 'msgpack'. Install it with `pip install pynyaa[msgpack]`."
+        raise ImportError(msg) from None
+    return msgpack
+
+
+def dump_jsonl(
+    releases: Iterable[NyaaRelease | LazyRelease], file: IO[str], /, *, torrent_data: TorrentDataFormat = "base64"
+) -> int:
+    """
+    Write releases to a text file as [JSON Lines](https://jsonlines.org/), one release per line.
+
+    Parameters
+    ----------
+    releases : Iterable[NyaaRelease | LazyRelease]
+        Releases to write. Consumed lazily, so this works with `Nyaa.search`.
+        A `LazyRelease` has every field parsed before it is written.
+    file : IO[str]
+        Text file opened for writing.
+    torrent_data : {"base64", "exclude"}, optional
+        How to represent the raw torrent data.
+
+    Returns
+    -------
+    int
+        Number of releases written.
+
+    """
+    if torrent_data == "include":
+        msg = "JSON cannot represent raw bytes, use torrent_data='base64' or torrent_data='exclude'."
+        raise ValueError(msg)
+
+    encode = json.JSONEncoder(check_circular=False, separators=(",", ":")).encode
+    write = file.write
+    count = 0
+    for release in releases:
+        write(encode(release.to_dict(torrent_data=torrent_data)))
+        write("\n")
+        count += 1
+    return count
+
+
+def load_jsonl(file: IO[str] | IO[bytes], /) -> Iterator[NyaaRelease]:
+    """
+    Lazily read releases written by `dump_jsonl`. Blank lines are skipped.
+    """
+    decode = json.loads
+    from_dict = NyaaRelease.from_dict
+    for line in file:
+        if line.strip():
+            yield from_dict(decode(line))
+
+
+def dump_msgpack(
+    releases: Iterable[NyaaRelease | LazyRelease], file: IO[bytes], /, *, torrent_data: TorrentDataFormat = "include"
+) -> int:
+    """
+    Write releases to a binary file as a stream of [msgpack](https://msgpack.org/) objects.
+    Requires the `msgpack` extra.
+
+    Parameters
+    ----------
+    releases : Iterable[NyaaRelease | LazyRelease]
+        Releases to write. Consumed lazily, so this works with `Nyaa.search`.
+        A `LazyRelease` has every field parsed before it is written.
+    file : IO[bytes]
+        Binary file opened for writing.
+    torrent_data : {"include", "base64", "exclude"}, optional
+        How to represent the raw torrent data. msgpack stores `bytes` natively.
+
+    Returns
+    -------
+    int
+        Number of releases written.
+
+    """
+    pack = _import_msgpack().Packer().pack
+    write = file.write
+    count = 0
+    for release in releases:
+        write(pack(release.to_dict(torrent_data=torrent_data)))
+        count += 1
+    return count
+
+
+def load_msgpack(file: IO[bytes], /) -> Iterator[NyaaRelease]:
+    """
+    Lazily read releases written by `dump_msgpack`. Requires the `msgpack` extra.
+    """
+    from_dict = NyaaRelease.from_dict
+    for data in _import_msgpack().Unpacker(file, raw=False):
+        yield from_dict(data)
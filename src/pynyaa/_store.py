@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import mmap
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from ._bencode import bdecode_torrent
+from ._errors import ParsingError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ._bencode import Buffer
+
+_INFOHASH_RE = re.compile(r"[0-9a-f]{40}")
+
+
+def _infohash(data: Buffer) -> str:
+    # Kept in its own frame, so the views into `data` are released as soon as it returns.
+    _, info = bdecode_torrent(data)
+    return hashlib.sha1(info).hexdigest()
+
+
+def _verify(path: Path, infohash: str) -> None:
+    with path.open("rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            msg = f"Torrent {infohash} is empty."
+            raise ParsingError(msg)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            try:
+                actual = _infohash(mapped)
+            except ParsingError as error:
+                # The traceback holds views into the map, which would keep it from being closed.
+                raise error.with_traceback(None) from None
+    if actual != infohash:
+        msg = f"Torrent data does not match its infohash: expected {infohash}, got {actual}."
+        raise ParsingError(msg)
+
+
+class PendingTorrent:
+    """
+    A torrent being written into a `TorrentStore`.
+
+    The data goes to a temporary file next to its destination, and is only moved into place by `commit()`.
+    """
+
+    __slots__ = ("_destination", "_file", "_infohash", "_temporary")
+
+    def __init__(self, store: TorrentStore, infohash: str) -> None:
+        self._destination = store.path(infohash)
+        self._infohash = infohash.lower()
+        self._destination.parent.mkdir(exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=self._destination.parent, suffix=".part")
+        self._temporary = Path(temporary)
+        self._file = os.fdopen(fd, "wb")
+
+    @property
+    def file(self) -> IO[bytes]:
+        """The temporary file to write the torrent into."""
+        return self._file
+
+    def write(self, chunk: bytes) -> None:
+        """Append `chunk` to the torrent."""
+        self._file.write(chunk)
+
+    def commit(self) -> None:
+        """
+        Flush the torrent to disk, check it against its infohash and move it into the store.
+        If the torrent is already stored, the existing copy is kept.
+
+        Raises
+        ------
+        ParsingError
+            If the data is not a valid torrent, or its infohash does not match. Nothing is stored.
+
+        """
+        try:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+            _verify(self._temporary, self._infohash)
+            if self._destination.is_file():
+                self._temporary.unlink()
+            else:
+                os.replace(self._temporary, self._destination)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        """Delete the temporary file without storing anything."""
+        self._file.close()
+        with contextlib.suppress(FileNotFoundError):
+            self._temporary.unlink()
+
+
+class TorrentStore:
+    """
+    Content-addressed, on-disk store for `.torrent` files, keyed by infohash.
+
+    Each torrent is written exactly once to `{directory}/{infohash[:2]}/{infohash}.torrent`.
+    Writes go to a temporary file first, are checked against the infohash, and are moved into place atomically,
+    so neither a crash nor a truncated or mismatched download leaves a bad torrent behind.
+
+    Examples
+    --------
+    ```py
+    from pynyaa import Nyaa, TorrentStore
+
+    store = TorrentStore("torrents")
+    with Nyaa(torrent_store=store) as nyaa:
+        release = nyaa.get(1755409)
+        with release.torrent.open() as file:
+            ...
+    ```
+
+    """
+
+    __slots__ = ("_directory",)
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """
+        Parameters
+        ----------
+        directory : str or os.PathLike[str]
+            Directory in which torrents are stored. Created if it does not exist.
+
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def directory(self) -> Path:
+        """The directory in which torrents are stored."""
+        return self._directory
+
+    def path(self, infohash: str) -> Path:
+        """
+        Return the path at which the torrent with the given infohash is (or would be) stored.
+
+        Raises
+        ------
+        ValueError
+            If `infohash` is not a 40 character hexadecimal string.
+
+        """
+        key = infohash.lower()
+        if not _INFOHASH_RE.fullmatch(key):
+            msg = f"Invalid infohash: {infohash!r}"
+            raise ValueError(msg)
+        return self._directory / key[:2] / f"{key}.torrent"
+
+    def __contains__(self, infohash: object) -> bool:
+        if not isinstance(infohash, str):
+            return False
+        try:
+            path = self.path(infohash)
+        except ValueError:  # Not an infohash, so never stored
+            return False
+        return path.is_file()
+
+    @contextlib.contextmanager
+    def writer(self, infohash: str) -> Iterator[IO[bytes]]:
+        """
+        Context manager yielding a binary file to write a torrent into.
+
+        The file is moved into the store only if the block exits without an exception,
+        and the data is a valid torrent whose infohash matches `infohash`.
+        If the torrent is already stored, the existing copy is kept.
+
+        Raises
+        ------
+        ParsingError
+            If the written data is not a valid torrent, or its infohash does not match.
+
+        """
+        pending = PendingTorrent(self, infohash)
+        try:
+            yield pending.file
+        except BaseException:
+            pending.discard()
+            raise
+        pending.commit()
+
+    def open(self, infohash: str) -> IO[bytes]:
+        """
+        Open the stored torrent for reading.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the torrent is not in the store.
+
+        """
+        return self.path(infohash).open("rb")
+
+    def mmap(self, infohash: str) -> mmap.mmap:
+        """
+        Memory-map the stored torrent as read-only.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the torrent is not in the store.
+
+        """
+        with self.open(infohash) as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
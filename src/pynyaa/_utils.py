@@ -1,5 +1,16 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+import httpx
+
+from ._enums import Category, ParentCategory
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 
 def assert_type(obj: object, typ: type[object] | tuple[type[object], ...], param: str, /) -> None:  # pragma: no cover
     """Shortcut for `isinstance(obj, type)` with a nice error message."""
@@ -19,3 +30,97 @@ def assert_type(obj: object, typ: type[object] | tuple[type[object], ...], param
         msg = f"Parameter '{param}' expected {expected}, but got {type(obj).__name__!r}."
 
         raise TypeError(msg)
+
+
+def assert_positive(obj: int | None, param: str, /) -> None:
+    """Ensure that an optional count is a positive `int`."""
+    if obj is None:
+        return
+    assert_type(obj, int, param)
+    if obj < 1:
+        msg = f"Parameter '{param}' must be a positive integer, but got {obj!r}."
+        raise ValueError(msg)
+
+
+def accept_encoding() -> str:
+    """
+    Value of the `Accept-Encoding` header listing every encoding `httpx` can decode here.
+    zstd and brotli are only listed when their decoders, from the `compression` extra, are installed.
+    """
+    encodings = []
+    if find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return ", ".join(encodings)
+
+
+def client_options(
+    *, max_connections: int, keepalive_expiry: float | None, http2: bool, timeout: float | httpx.Timeout | None
+) -> dict[str, Any]:
+    """
+    Keyword arguments for the `httpx` client built when none is passed in.
+
+    Every connection in the pool is kept alive, so concurrent batches of up to `max_connections`
+    requests reuse their connections instead of reopening most of them.
+    A bare number applies to every timeout but the pool one: concurrency is bounded by the caller,
+    so a request waiting for a free connection is queued rather than failed.
+    """
+    assert_positive(max_connections, "max_connections")
+    if http2 and find_spec("h2") is None:
+        msg = "HTTP/2 requires 'h2'. Install it with `pip install pynyaa[http2]`."
+        raise ImportError(msg)
+    return {
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        "http2": http2,
+        "timeout": timeout if isinstance(timeout, httpx.Timeout) else httpx.Timeout(timeout, pool=None),
+    }
+
+
+def subcategories(category: ParentCategory | Category, /) -> tuple[ParentCategory | Category, ...]:
+    """
+    Split `category` into the disjoint categories it is made of.
+    `ParentCategory.ALL` splits into the top-level categories, those into their subcategories,
+    and subcategories cannot be split any further.
+    """
+    if category is ParentCategory.ALL:
+        return tuple(parent for parent in ParentCategory if parent is not ParentCategory.ALL)
+    if isinstance(category, ParentCategory):
+        return tuple(child for child in Category if child.parent is category)
+    return ()
+
+
+def make_magnet(infohash: str, title: str, trackers: Iterable[str] = ()) -> str:
+    """
+    Build a magnet link locally, the same way Nyaa does, with every component percent-encoded.
+
+    Parameters
+    ----------
+    infohash : str
+        The infohash of the torrent.
+    title : str
+        The display name of the torrent, usually the release title.
+    trackers : Iterable[str], optional
+        Tracker announce URLs to include, in order.
+
+    Returns
+    -------
+    str
+        The magnet link.
+
+    Examples
+    --------
+    ```py
+    >>> make_magnet("ad596c24e64424aa6fe02c04c20eb25e57dbb042", "Shelter", ["udp://open.stealth.si:80/announce"])
+    'magnet:?xt=urn:btih:ad596c24e64424aa6fe02c04c20eb25e57dbb042&dn=Shelter&tr=udp%3A%2F%2Fopen.stealth.si%3A80%2Fannounce'
+    ```
+
+    """
+    parts = [f"magnet:?xt=urn:btih:{infohash}&dn={quote(title, safe='')}"]
+    parts.extend(f"&tr={quote(tracker, safe='')}" for tracker in trackers)
+    return "".join(parts)
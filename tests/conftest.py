@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import dataclasses
+import datetime as dt
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
+import httpx
 import pytest
 from httpx import AsyncClient, Client
 
-from pynyaa import AsyncNyaa, Nyaa
+from pynyaa import AsyncNyaa, Category, Nyaa, NyaaRelease, Submitter, TorrentFile
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Iterator
+    from collections.abc import AsyncIterator, Callable, Collection, Iterator
 
 headers = {
     "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0.0.0 Safari/537.36"
@@ -25,3 +29,136 @@ def nyaa_client() -> Iterator[Nyaa]:
 async def async_nyaa_client() -> AsyncIterator[AsyncNyaa]:
     async with AsyncNyaa(client=AsyncClient(headers=headers)) as nyaa:
         yield nyaa
+
+
+def make_release(id: int = 1755409, *, submitter: str | None = "smol", **changes: Any) -> NyaaRelease:
+    """Build a `NyaaRelease` without hitting the network."""
+    title = f"[smol] Release {id}"
+    release = NyaaRelease(
+        id=id,
+        url=f"https://nyaa.si/view/{id}",
+        title=title,
+        category=Category.ANIME_ENGLISH_TRANSLATED,
+        submitter=None
+        if submitter is None
+        else Submitter(name=submitter, url=f"https://nyaa.si/user/{submitter}", is_trusted=False, is_banned=False),
+        datetime=dt.datetime(2023, 12, 14, 9, 6, 18, tzinfo=dt.timezone.utc),
+        information=None,
+        seeders=10,
+        leechers=2,
+        completed=100,
+        is_trusted=False,
+        is_remake=False,
+        torrent=TorrentFile(
+            name=f"{id}.torrent",
+            data=b"d4:infod4:name1:aee",
+            size=619603559,
+            infohash=f"{id:040x}",
+            url=f"https://nyaa.si/download/{id}.torrent",
+            magnet=f"magnet:?xt=urn:btih:{id:040x}&dn={quote(title, safe='')}",
+        ),
+        description=None,
+    )
+    return dataclasses.replace(release, **changes)
+
+
+def search_page(ids: list[int], *, page: int = 1, pages: int = 1) -> bytes:
+    """
+    Build a minimal search result page in Nyaa's markup.
+    Each listed release has `id` seeders and a size of `id` MiB, and is trusted if `id` is even.
+    """
+    rows = "".join(
+        f'<tr class="{"success" if id % 2 == 0 else "default"}">'
+        f'<td><a href="/?c=1_2" title="Anime - English-translated"></a></td>'
+        f'<td colspan="2"><a href="/view/{id}#comments" class="comments">1</a>'
+        f'<a href="/view/{id}" title="Release {id} &amp; co">Release {id} &amp; co</a></td>'
+        f'<td class="text-center"><a href="/download/{id}.torrent"></a>'
+        f'<a href="magnet:?xt=urn:btih:{id:040x}&amp;dn=Release"></a></td>'
+        f'<td class="text-center">{id} MiB</td>'
+        f'<td class="text-center" data-timestamp="{1_700_000_000 + id}">2023-11-14 22:13</td>'
+        f'<td class="text-center">{id}</td><td class="text-center">0</td><td class="text-center">0</td></tr>\n'
+        for id in ids
+    )
+    pagination = "".join(
+        f'<li class="active"><a>{number}</a></li>'
+        if number == page
+        else f'<li><a href="/?p={number}">{number}</a></li>'
+        for number in range(1, pages + 1)
+    )
+    if page < pages:
+        pagination += f'<li class="next"><a href="/?p={page + 1}">&raquo;</a></li>'
+    else:
+        pagination += '<li class="next disabled"><a>&raquo;</a></li>'
+    return (
+        f'<table class="table torrent-list"><tbody>\n{rows}</tbody></table>\n<ul class="pagination">{pagination}</ul>'
+    ).encode()
+
+
+class SearchTransport(httpx.MockTransport):
+    """
+    Serve a search whose result pages list the given IDs, recording every requested URL.
+    Release pages are placeholders, so releases should be fetched with `lazy=True`.
+
+    `pages` is either the result pages of every query, or a function returning the result
+    pages for the query parameters of a request. Releases with an ID in `missing` do not exist.
+    The profile page of each user in `users` lists the same pages as a search.
+    """
+
+    def __init__(
+        self,
+        pages: list[list[int]] | Callable[[httpx.QueryParams], list[list[int]]],
+        *,
+        missing: Collection[int] = (),
+        users: Collection[str] = (),
+    ) -> None:
+        self.pages = pages
+        self.missing = missing
+        self.users = users
+        self.requests: list[httpx.URL] = []
+        super().__init__(self.respond)
+
+    def respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request.url)
+        path = request.url.path
+        if (
+            path.startswith(("/view/", "/download/"))
+            and int(path.split("/")[-1].removesuffix(".torrent")) in self.missing
+        ):
+            return httpx.Response(404)
+        if path.startswith("/view/"):
+            return httpx.Response(200, content=b"<html></html>")
+        if path.startswith("/download/"):
+            return httpx.Response(200, content=b"", headers={"Content-Disposition": "filename*=UTF-8''a.torrent"})
+        if path.startswith("/user/") and path.removeprefix("/user/") not in self.users:
+            return httpx.Response(404)
+        params = request.url.params
+        pages = self.pages(params) if callable(self.pages) else self.pages
+        page = int(params.get("p", 1))
+        return httpx.Response(200, content=search_page(pages[page - 1], page=page, pages=len(pages)))
+
+    def listed(self) -> list[int]:
+        """Numbers of the result pages requested so far."""
+        return [
+            int(url.params.get("p", 1)) for url in self.requests if url.path == "/" or url.path.startswith("/user/")
+        ]
+
+    def fetched(self) -> list[int]:
+        """IDs of the release pages requested so far."""
+        return [int(url.path.removeprefix("/view/")) for url in self.requests if url.path.startswith("/view/")]
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body served in chunks of `size` bytes, counting how many of them have been read."""
+
+    def __init__(self, body: bytes, *, size: int) -> None:
+        self.chunks = [body[start : start + size] for start in range(0, len(body), size)]
+        self.read = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
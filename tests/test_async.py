@@ -1,17 +1,54 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime as dt
+import gzip
+import io
 import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import aclosing
+from typing import TYPE_CHECKING
 
+import httpx
 import pytest
-
-from pynyaa import AsyncNyaa, Category, Order, ReleaseNotFoundError, Submitter
+from httpx import AsyncClient
+
+from pynyaa import (
+    AsyncNyaa,
+    Category,
+    CompactRelease,
+    FileEntry,
+    Folder,
+    LazyRelease,
+    NyaaRelease,
+    Order,
+    ReleaseMagnet,
+    ReleaseNotFoundError,
+    ReleaseStats,
+    SearchStats,
+    SortBy,
+    Submitter,
+    TorrentStore,
+    TransferStats,
+    UserNotFoundError,
+    dump_jsonl,
+    load_jsonl,
+)
+
+from .conftest import ChunkedStream, SearchTransport, headers, make_release, search_page
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def dedent(s: str) -> str:
     return textwrap.dedent(s).strip()
 
 
+def snapshot(directory: Path) -> dict[str, int]:
+    return {path.relative_to(directory).as_posix(): path.stat().st_mtime_ns for path in directory.rglob("*.*")}
+
+
 async def test_properties(async_nyaa_client: AsyncNyaa) -> None:
     assert async_nyaa_client.base_url == "https://nyaa.si/"
 
@@ -24,7 +61,7 @@ async def test_get_errors(async_nyaa_client: AsyncNyaa) -> None:
         await async_nyaa_client.get("None")
 
     with pytest.raises(TypeError, match=r"Parameter 'page' expected 'int' or 'str', but got 'NoneType'."):
-        await async_nyaa_client.get(None)  # type: ignore[arg-type]
+        await async_nyaa_client.get(None)  # type: ignore[call-overload]
 
     with pytest.raises(
         ReleaseNotFoundError,
@@ -73,10 +110,291 @@ async def test_nyaa_default(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 619603559
     assert nyaa.torrent.infohash == "ad596c24e64424aa6fe02c04c20eb25e57dbb042"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1755409.torrent"
+    assert nyaa.torrent.files == (
+        FileEntry(path="[smol] Shelter (2016) (BD 1080p HEVC FLAC) [2CCEB30C].mkv", size=619580447),
+    )
+    assert nyaa.torrent.total_size == 619580447
+    assert nyaa.torrent.piece_length == 1048576
+    assert nyaa.torrent.piece_count == 591
+    assert nyaa.torrent.trackers[0] == "http://nyaa.tracker.wf:7777/announce"
+    assert nyaa.torrent.is_private is False
+    assert nyaa.file_tree == (
+        FileEntry(path="[smol] Shelter (2016) (BD 1080p HEVC FLAC) [2CCEB30C].mkv", size=619603559),
+    )
+    assert "_file_list" not in {field.name for field in dataclasses.fields(nyaa) if field.init}
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:ad596c24e64424aa6fe02c04c20eb25e57dbb042")
 
 
+@pytest.mark.vcr("test_nyaa_default.yaml", allow_playback_repeats=True)
+async def test_torrent_store(tmp_path: Path) -> None:
+    store = TorrentStore(tmp_path)
+    infohash = "ad596c24e64424aa6fe02c04c20eb25e57dbb042"
+    assert infohash not in store
+
+    async with AsyncNyaa(client=AsyncClient(headers=headers), torrent_store=store) as nyaa:
+        first = await nyaa.get(1755409)
+        before = snapshot(tmp_path)
+        second = await nyaa.get(1755409)  # Already stored, not written again
+        assert snapshot(tmp_path) == before
+
+    assert infohash in store
+    assert store.path(infohash) == tmp_path / "ad" / f"{infohash}.torrent"
+    assert list(before) == [f"ad/{infohash}.torrent"]
+
+    for release in (first, second):
+        assert release.torrent.data is None
+        assert release.torrent.path == store.path(infohash)
+        assert release.torrent.name == "[smol] Shelter (2016) (BD 1080p HEVC FLAC) [2CCEB30C].mkv nyaa.torrent"
+        assert release.torrent.computed_infohash == infohash
+        assert release.torrent.total_size == 619580447
+
+    with first.torrent.open() as file:
+        assert file.read() == first.torrent.read()
+    with store.mmap(infohash) as mapped:
+        assert mapped[:] == first.torrent.read()
+
+    with pytest.raises(ValueError, match="Invalid infohash"):
+        store.path("../../etc/passwd")
+
+
+@pytest.mark.vcr("test_nyaa_default.yaml", allow_playback_repeats=True)
+async def test_submitter_interning(async_nyaa_client: AsyncNyaa) -> None:
+    first = await async_nyaa_client.get(1755409)
+    second = await async_nyaa_client.get(1755409)
+    assert first.submitter is second.submitter
+    expanded = CompactRelease.from_release(first, base_url=async_nyaa_client.base_url).to_release()
+    assert expanded == dataclasses.replace(first, torrent=dataclasses.replace(first.torrent, data=None))
+    assert expanded.torrent.magnet == first.torrent.magnet
+
+
+@pytest.mark.vcr("test_nyaa_default.yaml", allow_playback_repeats=True)
+async def test_parse_executor(async_nyaa_client: AsyncNyaa) -> None:
+    expected = await async_nyaa_client.get(1755409)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        async with AsyncNyaa(client=AsyncClient(headers=headers), parse_executor=executor) as nyaa:
+            release = await nyaa.get(1755409)
+            assert release == expected
+            assert release.file_tree == expected.file_tree
+            assert release.submitter is (await nyaa.get(1755409)).submitter
+
+
+@pytest.mark.vcr("test_nyaa_default.yaml", allow_playback_repeats=True)
+async def test_get_stats(async_nyaa_client: AsyncNyaa) -> None:
+    stats = await async_nyaa_client.get_stats("https://nyaa.si/view/1755409")
+    assert stats == ReleaseStats(id=1755409, seeders=15, leechers=0, completed=640)
+
+    stale = make_release(1755409, seeders=1, leechers=2, completed=3)
+    compact = CompactRelease.from_release(stale, base_url=async_nyaa_client.base_url)
+    releases: list[NyaaRelease | CompactRelease] = [stale, compact]
+    refreshed = [release async for release in async_nyaa_client.refresh(releases)]
+    assert refreshed == [stale, compact]  # The counters are not compared
+    assert [(release.seeders, release.leechers, release.completed) for release in refreshed] == [(15, 0, 640)] * 2
+    assert type(refreshed[1]) is CompactRelease
+    assert stale.seeders == 1
+
+    # Every other field is kept, including the file tree parsed from the release page.
+    fetched = await async_nyaa_client.get(1755409)
+    [updated] = [release async for release in async_nyaa_client.refresh([fetched])]
+    assert updated.file_tree == fetched.file_tree != ()
+    assert [getattr(updated, field.name) for field in dataclasses.fields(updated)] == [
+        getattr(fetched, field.name) for field in dataclasses.fields(fetched)
+    ]
+
+
+@pytest.mark.vcr("test_nyaa_default.yaml", allow_playback_repeats=True)
+async def test_get_magnet(async_nyaa_client: AsyncNyaa) -> None:
+    release = await async_nyaa_client.get(1755409)
+    magnet = await async_nyaa_client.get_magnet(1755409)
+    assert magnet == ReleaseMagnet(id=1755409, infohash=release.torrent.infohash, magnet=release.torrent.magnet)
+    assert str(magnet) == release.torrent.magnet
+
+
+async def test_search_listing() -> None:
+    transport = SearchTransport([[9, 8, 7], [7, 6, 5], [4]])
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        results = [result async for result in nyaa.search_listing("query", stats=stats)]
+        assert [result.id for result in results] == [9, 8, 7, 6, 5, 4]
+        assert results[0].infohash == f"{9:040x}"
+        assert results[0].magnet == f"magnet:?xt=urn:btih:{9:040x}&dn=Release"
+        assert stats == SearchStats(pages=3, results=6, duplicates=1)
+
+        results = [result async for result in nyaa.search_listing("query", limit=2, where=lambda r: r.is_trusted)]
+        assert [result.id for result in results] == [8, 6]
+    assert transport.fetched() == []  # Only the listing is requested
+    assert transport.listed() == [1, 2, 3, 1, 2]
+
+
+async def test_user_uploads() -> None:
+    transport = SearchTransport([[9, 8, 7], [7, 6]], users={"user name"})
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        releases = [release async for release in nyaa.user_uploads("user name", lazy=True, stats=stats)]
+        assert [release.id for release in releases] == [9, 8, 7, 6]
+        assert stats == SearchStats(pages=2, results=4, duplicates=1)
+
+        results = [result async for result in nyaa.user_listing("user name", query="query", limit=1)]
+        assert [result.id for result in results] == [9]
+    assert transport.requests[0].path == "/user/user name"
+    assert transport.requests[-1].params["q"] == "query"
+    assert transport.listed() == [1, 2, 1]
+    assert transport.fetched() == [9, 8, 7, 6]
+
+
+async def test_user_not_found() -> None:
+    transport = SearchTransport([[1]])
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        with pytest.raises(UserNotFoundError, match=r"User not found at 'https://nyaa\.si/user/nobody'"):
+            await anext(nyaa.user_uploads("nobody"))
+        with pytest.raises(UserNotFoundError):
+            await anext(nyaa.user_listing("nobody"))
+
+
+async def test_mirror_failover() -> None:
+    search = SearchTransport([[3, 2, 1]])
+    requested: list[str] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        url = request.url
+        requested.append(f"{url.host}{url.path}")
+        if url.host == "nyaa.si":
+            msg = "down"
+            raise httpx.ConnectError(msg, request=request)
+        if url.host == "busy.example":
+            return httpx.Response(503)
+        return search.respond(httpx.Request("GET", url.copy_with(path=url.path.removeprefix("/nyaa"))))
+
+    transport = httpx.MockTransport(respond)
+    mirrors = ["https://busy.example/", "https://mirror.example/nyaa"]
+    async with AsyncNyaa(mirrors=mirrors, client=AsyncClient(transport=transport)) as nyaa:
+        # A mirror at a subpath keeps its path with or without the trailing slash.
+        assert nyaa.mirrors == ("https://nyaa.si/", "https://busy.example/", "https://mirror.example/nyaa/")
+        results = [result async for result in nyaa.search_listing("query")]
+        assert [result.url for result in results] == [f"https://nyaa.si/view/{id}" for id in (3, 2, 1)]
+        release = await nyaa.get(3, lazy=True)
+        assert release.url == "https://nyaa.si/view/3"
+    # Failed mirrors are only tried again once their cooldown is over.
+    assert requested == [
+        "nyaa.si/",
+        "busy.example/",
+        "mirror.example/nyaa/",
+        "mirror.example/nyaa/view/3",
+        "mirror.example/nyaa/download/3.torrent",
+    ]
+
+
+async def test_transfer_stats() -> None:
+    page = search_page([3, 2, 1], page=1, pages=1)
+    compressed = gzip.compress(page)
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, stream=httpx.ByteStream(compressed), headers={"Content-Encoding": "gzip"})
+    )
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        assert [result.id async for result in nyaa.search_listing("query")] == [3, 2, 1]
+        assert nyaa.transfer_stats == TransferStats(
+            responses=1, compressed=1, received_bytes=len(compressed), decoded_bytes=len(page)
+        )
+
+
+async def test_get_many() -> None:
+    transport = SearchTransport([], missing={3})
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        pages: list[int | str] = [1, 2, 3, 4, "https://nyaa.si/view/5", 6]
+        releases = [release async for release in nyaa.get_many(pages, concurrency=2, lazy=True)]
+        assert [release.id for release in releases] == [1, 2, 4, 5, 6]
+
+        async with aclosing(nyaa.get_many(range(10, 100), concurrency=4, lazy=True)) as stream:
+            assert (await anext(stream)).id == 10
+    fetched = sorted(transport.fetched())
+    assert fetched[:6] == [1, 2, 3, 4, 5, 6]
+    assert fetched[6] == 10
+    assert set(fetched[6:]) <= {10, 11, 12, 13}  # Never more than `concurrency` ahead
+
+
+async def test_refresh_missing() -> None:
+    transport = SearchTransport([], missing={1})
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        assert [release async for release in nyaa.refresh([make_release(1)])] == []
+        with pytest.raises(ReleaseNotFoundError):
+            await nyaa.get_stats(1)
+
+
+RECORDED_RELEASES = [
+    pytest.param(id, marks=pytest.mark.vcr(f"{cassette}.yaml", allow_playback_repeats=True), id=cassette)
+    for cassette, id in (
+        ("test_nyaa_default", 1755409),
+        ("test_nyaa_anon", 1765655),
+        ("test_nyaa_banned", 1422797),
+        ("test_nyaa_trusted_and_remake", 1694824),
+        ("test_nyaa_description", 1992716),
+        ("test_nyaa_empty_desc_info", 1586776),
+    )
+]
+
+
+@pytest.mark.parametrize("id", RECORDED_RELEASES)
+async def test_lazy_release(async_nyaa_client: AsyncNyaa, id: int) -> None:
+    eager = await async_nyaa_client.get(id)
+    lazy = await async_nyaa_client.get(id, lazy=True)
+    assert isinstance(lazy, LazyRelease)
+    assert repr(lazy) == f"LazyRelease(id={id}, url='https://nyaa.si/view/{id}')"
+
+    assert str(lazy) == lazy.title == eager.title
+    assert lazy.torrent.magnet == eager.torrent.magnet
+    assert lazy.is_materialized is False
+
+    assert lazy.to_release() == eager
+    assert lazy.to_dict(torrent_data="base64") == eager.to_dict(torrent_data="base64")
+    file = io.StringIO()
+    assert dump_jsonl([lazy], file) == 1
+    file.seek(0)
+    assert list(load_jsonl(file)) == [eager]
+    assert lazy.file_tree == eager.file_tree
+    assert lazy.submitter is eager.submitter
+    assert lazy.is_materialized is True
+    assert lazy.title == eager.title  # Still served from the cache
+
+
+@pytest.mark.parametrize("id", RECORDED_RELEASES)
+async def test_stream_pages_recorded(async_nyaa_client: AsyncNyaa, id: int) -> None:
+    async with AsyncNyaa(client=AsyncClient(headers=headers), stream_pages=True) as streamed:
+        assert await streamed.get(id) == await async_nyaa_client.get(id)
+        assert await streamed.get_stats(id) == await async_nyaa_client.get_stats(id)
+        assert await streamed.get_magnet(id) == await async_nyaa_client.get_magnet(id)
+
+
+async def test_stream_pages() -> None:
+    page = (
+        b'<div class="panel panel-success"><h3 class="panel-title">Title</h3></div><!--/.panel -->\n'
+        b'<div class="panel panel-default"><div class="panel-body" id="torrent-description">Description</div>\n'
+        b'<div class="torrent-file-list panel-body"><ul><li>a.mkv <span class="file-size">(1.0 KiB)</span></li></ul>'
+        b"</div>\n</div><!--/.panel -->\n"
+        b'<div id="comments">' + b"<p>Comment</p>" * 1000 + b"</div>"
+    )
+    streams: list[ChunkedStream] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/download/"):
+            return httpx.Response(200, content=b"", headers={"Content-Disposition": "filename*=UTF-8''a.torrent"})
+        streams.append(ChunkedStream(page, size=64))
+        return httpx.Response(200, stream=streams[-1])
+
+    transport = httpx.MockTransport(respond)
+    async with AsyncNyaa(client=AsyncClient(transport=transport), stream_pages=True) as nyaa:
+        release = await nyaa.get(1, lazy=True)
+        assert release.description == "Description"
+        assert [entry.path for entry in release.file_tree] == ["a.mkv"]
+        read = streams[-1].read
+        assert read == page.index(b"<div id=") // 64 + 1  # Stopped right after the file list
+        assert nyaa.transfer_stats.decoded_bytes == read * 64
+
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        await nyaa.get(1, lazy=True)
+        assert streams[-1].read == len(streams[-1].chunks)
+
+
 @pytest.mark.vcr
 async def test_nyaa_trusted(async_nyaa_client: AsyncNyaa) -> None:
     nyaa = await async_nyaa_client.get("https://nyaa.si/view/1544043")
@@ -116,6 +434,7 @@ async def test_nyaa_trusted(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 2040109466
     assert nyaa.torrent.infohash == "78e51b8285dd611dc1728d9b38dc1b8607cd0994"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1544043.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:78e51b8285dd611dc1728d9b38dc1b8607cd0994")
 
@@ -156,6 +475,7 @@ async def test_nyaa_trusted_and_remake(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 1288490189
     assert nyaa.torrent.infohash == "19606f2e09b7013d9fcefbb67955766c19c32c5a"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1694824.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:19606f2e09b7013d9fcefbb67955766c19c32c5a")
 
@@ -208,6 +528,7 @@ async def test_nyaa_anon(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 1288490189
     assert nyaa.torrent.infohash == "8732a06d2087c71fddf5dc55d08512ebe146d445"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1765655.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:8732a06d2087c71fddf5dc55d08512ebe146d445")
 
@@ -260,7 +581,20 @@ async def test_nyaa_banned(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 18360985191
     assert nyaa.torrent.infohash == "5fecba4e64910a38c05d7566131a1318133bbc45"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1422797.torrent"
+    [root] = nyaa.file_tree
+    assert isinstance(root, Folder)
+    assert str(root) == "[succ_] Tsugumomo [BDRip 1920x1080 x264 FLAC]"
+    assert root.children[0] == Folder(
+        path="[succ_] Tsugumomo [BDRip 1920x1080 x264 FLAC]/Extras",
+        children=root.children[0].children,  # type: ignore[union-attr]
+    )
+    assert root.children[1] == FileEntry(
+        path="[succ_] Tsugumomo [BDRip 1920x1080 x264 FLAC]/[succ_] Tsugumomo 01 [BDRip 1920x1080 x264 FLAC][7928B7C4].mkv",
+        size=1503238554,
+    )
+    assert {file.path for file in root.walk()} == {file.path for file in nyaa.torrent.files}
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:5fecba4e64910a38c05d7566131a1318133bbc45")
 
 
@@ -293,7 +627,12 @@ async def test_nyaa_banned_and_trusted(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 20293720474
     assert nyaa.torrent.infohash == "2959e97cb7796f029d2196fb63bb5c70b56d4206"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/884488.torrent"
+    assert len(nyaa.torrent.files) == 51
+    assert all(file.path.startswith("[FMA1394] Fullmetal Alchemist (2003)/") for file in nyaa.torrent.files)
+    assert nyaa.torrent.total_size == sum(file.size for file in nyaa.torrent.files) == 20261666332
+    assert nyaa.torrent.piece_count == 4831
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:2959e97cb7796f029d2196fb63bb5c70b56d4206")
 
 
@@ -339,6 +678,7 @@ async def test_nyaa_description(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 44667659879
     assert nyaa.torrent.infohash == "489cb384b126a87e26afc0dfe96ef20216a2fc39"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1992716.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:489cb384b126a87e26afc0dfe96ef20216a2fc39")
 
@@ -366,6 +706,7 @@ async def test_nyaa_empty_info(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 192728269
     assert nyaa.torrent.infohash == "ad35645d31cf4110440a79b062f775bcab717af3"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/5819.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:ad35645d31cf4110440a79b062f775bcab717af3")
 
@@ -396,6 +737,7 @@ async def test_nyaa_empty_desc(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 178887066
     assert nyaa.torrent.infohash == "88cbf145c04d79e103a4620543098848544283ad"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/76777.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:88cbf145c04d79e103a4620543098848544283ad")
 
@@ -426,6 +768,7 @@ async def test_nyaa_empty_desc_info(async_nyaa_client: AsyncNyaa) -> None:
     assert nyaa.torrent.data
     assert nyaa.torrent.size == 2576980378
     assert nyaa.torrent.infohash == "79f9947ec567f1d5edb6ea472818588881094b2f"
+    assert nyaa.torrent.computed_infohash == nyaa.torrent.infohash
     assert nyaa.torrent.url == "https://nyaa.si/download/1586776.torrent"
     assert nyaa.torrent.magnet.startswith("magnet:?xt=urn:btih:79f9947ec567f1d5edb6ea472818588881094b2f")
 
@@ -462,3 +805,178 @@ async def test_nyaa_search(async_nyaa_client: AsyncNyaa) -> None:
 async def test_nyaa_search_no_results(async_nyaa_client: AsyncNyaa) -> None:
     results = async_nyaa_client.search("akldlaskdjsaljdksd")  # 0 results
     assert [i async for i in results] == []
+
+
+async def test_search_skips_duplicates() -> None:
+    # Two new uploads shifted results 3 and 4 from page 1 onto page 2.
+    transport = SearchTransport([[6, 5, 4, 3], [4, 3, 2, 1], [1, 0]])
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        ids = [release.id async for release in nyaa.search("query", lazy=True, stats=stats)]
+
+    assert ids == [6, 5, 4, 3, 2, 1, 0]
+    assert transport.fetched() == ids  # Duplicates are skipped before their details are fetched
+    assert stats == SearchStats(pages=3, results=7, duplicates=3)
+
+
+async def test_search_limits() -> None:
+    pages = [[9, 8, 7], [6, 5, 4], [3, 2, 1]]
+
+    transport = SearchTransport(pages)
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        ids = [release.id async for release in nyaa.search("query", lazy=True, limit=3)]
+    assert ids == [9, 8, 7]
+    assert transport.listed() == [1]  # The second page is never requested
+
+    transport = SearchTransport(pages)
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        ids = [release.id async for release in nyaa.search("query", lazy=True, max_pages=2)]
+    assert ids == [9, 8, 7, 6, 5, 4]
+    assert transport.listed() == [1, 2]
+
+    transport = SearchTransport(pages)
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        ids = [release.id async for release in nyaa.search("query", lazy=True, limit=4, max_pages=1)]
+    assert ids == [9, 8, 7]
+
+    with pytest.raises(ValueError, match=r"Parameter 'limit' must be a positive integer, but got 0."):
+        await anext(nyaa.search("query", limit=0))
+    with pytest.raises(TypeError, match=r"Parameter 'max_pages' expected 'int', but got 'str'."):
+        await anext(nyaa.search("query", max_pages="1"))  # type: ignore[call-overload]
+
+
+async def test_search_close() -> None:
+    transport = SearchTransport([[9, 8, 7], [6, 5, 4]])
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        results = nyaa.search("query", lazy=True)
+        assert (await anext(results)).id == 9
+        await results.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await anext(results)
+    assert transport.listed() == [1]
+    assert transport.fetched() == [9]
+
+
+async def test_search_where() -> None:
+    transport = SearchTransport([[9, 8, 7, 6], [5, 4, 3, 2], [8, 1]])
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        results = nyaa.search(
+            "query", lazy=True, stats=stats, where=lambda result: result.is_trusted and result.seeders > 2
+        )
+        ids = [release.id async for release in results]
+    assert ids == [8, 6, 4]
+    # Rejected rows never have their release page fetched.
+    assert transport.fetched() == [8, 6, 4]
+    assert stats == SearchStats(pages=3, results=3, duplicates=1, filtered=6)
+
+
+async def test_sweep() -> None:
+    # The last page of a query cut off at 1,000 results holds the remaining 25.
+    capped = [[0]] * 13 + [[0] * 25]
+    partitions = {
+        # Both split into their subcategories.
+        ("0_0", "desc"): capped,
+        ("1_0", "desc"): capped,
+        # Capped, but the oldest results meet the newest ones on the third page.
+        ("1_1", "desc"): [*([id] for id in range(30, 17, -1)), [17] * 25],
+        ("1_1", "asc"): [[10], [12], [17], [18]],
+        # Capped, and the oldest results never meet the newest ones.
+        ("1_2", "desc"): [*([id] for id in range(60, 47, -1)), [47] * 25],
+        ("1_2", "asc"): [[id] for id in range(101, 115)],
+        # Not capped.
+        ("2_0", "desc"): [[70, 69], [68]],
+    }
+    transport = SearchTransport(lambda params: partitions.get((params["c"], params["o"]), [[]]))
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        ids = [release.id async for release in nyaa.sweep("query", lazy=True, concurrency=3, stats=stats)]
+
+    # Partitions that are not split are swept before the subcategories of those that are.
+    assert ids == [70, 69, 68, *range(30, 16, -1), 10, 12, *range(60, 46, -1), *range(101, 115)]
+    assert sorted(transport.fetched()) == sorted(ids)
+    # Each capped partition's last page is also read once to tell that it is capped.
+    assert stats == SearchStats(pages=59, results=47, duplicates=49, truncated=1)
+
+    with pytest.raises(ValueError, match=r"Parameter 'concurrency' must be a positive integer, but got 0."):
+        await anext(nyaa.sweep("query", concurrency=0))
+
+
+async def test_sweep_exactly_max_pages() -> None:
+    # Results that merely fill 14 pages have a short last page and no next link, so they are not split.
+    pages = [[id] for id in range(14, 0, -1)]
+    transport = SearchTransport(lambda params: pages if params["c"] == "0_0" else [[]])
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        ids = [release.id async for release in nyaa.sweep("query", lazy=True, stats=stats)]
+    assert ids == list(range(14, 0, -1))
+    assert {url.params["c"] for url in transport.requests if url.path == "/"} == {"0_0"}
+    assert transport.listed() == [1, 14, *range(2, 15)]
+    assert stats == SearchStats(pages=15, results=14)
+
+
+async def test_sweep_where() -> None:
+    transport = SearchTransport([[9, 8, 7, 6], [5, 4]])
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        results = nyaa.sweep(
+            "query", category=Category.ANIME_ENGLISH_TRANSLATED, lazy=True, where=lambda r: r.is_trusted, stats=stats
+        )
+        ids = [release.id async for release in results]
+    assert ids == [8, 6, 4]
+    assert transport.fetched() == [8, 6, 4]
+    assert stats == SearchStats(pages=2, results=3, filtered=3)
+
+
+async def test_crawl(tmp_path: Path) -> None:
+    checkpoint = tmp_path / "crawl.checkpoint"
+    transport = SearchTransport([], missing={3, 6})
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        # The second of two shards over 1-10 is 2, 4, 6, 8, 10; stop after two releases.
+        crawl = nyaa.crawl(range(1, 11), checkpoint=checkpoint, shard=1, shards=2, concurrency=2, lazy=True)
+        async with aclosing(crawl) as releases:
+            assert [(await anext(releases)).id, (await anext(releases)).id] == [2, 4]
+        assert transport.fetched() == [2, 4]
+
+        # Resumes after the last release that was done with, and records 6 as missing.
+        ids = [
+            release.id
+            async for release in nyaa.crawl(range(1, 11), checkpoint=checkpoint, shard=1, shards=2, lazy=True)
+        ]
+        assert ids == [4, 8, 10]
+        assert transport.fetched() == [2, 4, 4, 6, 8, 10]
+
+        # Nothing is left to fetch, not even the missing release.
+        ids = [
+            release.id
+            async for release in nyaa.crawl(range(1, 11), checkpoint=checkpoint, shard=1, shards=2, lazy=True)
+        ]
+        assert ids == []
+        assert transport.fetched() == [2, 4, 4, 6, 8, 10]
+
+        # Without a checkpoint, every ID of the range is fetched.
+        ids = [release.id async for release in nyaa.crawl(range(1, 7), lazy=True, concurrency=4)]
+        assert ids == [1, 2, 4, 5]
+
+        with pytest.raises(ValueError, match=r"is a checkpoint for range\(2, 11, 2\), not range\(1, 11, 2\)"):
+            await anext(nyaa.crawl(range(1, 11), checkpoint=checkpoint, shard=0, shards=2))
+        with pytest.raises(ValueError, match=r"Parameter 'shard' must be between 0 and 1, but got 2."):
+            await anext(nyaa.crawl(range(1, 11), shard=2, shards=2))
+
+
+async def test_search_many() -> None:
+    # Listed releases have as many seeders as their ID.
+    queries: dict[str, list[list[int]]] = {"a": [[9, 7], [4]], "b": [[8, 7, 5], [1]], "c": [[]]}
+    transport = SearchTransport(lambda params: queries[params["q"]])
+    stats = SearchStats()
+    async with AsyncNyaa(client=AsyncClient(transport=transport)) as nyaa:
+        results = nyaa.search_many(queries, sort_by=SortBy.SEEDERS, lazy=True, concurrency=2, stats=stats)
+        ids = [release.id async for release in results]
+        assert ids == [9, 8, 7, 5, 4, 1]
+        assert sorted(transport.fetched()) == [1, 4, 5, 7, 8, 9]
+        assert stats == SearchStats(pages=5, results=6, duplicates=1)
+
+        queries = {"a": [[1, 3, 6]], "b": [[2, 4, 5]]}
+        results = nyaa.search_many(queries, order=Order.ASCENDING, lazy=True, where=lambda result: result.is_trusted)
+        ids = [release.id async for release in results]
+        assert ids == [2, 4, 6]
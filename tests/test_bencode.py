@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from pynyaa import ParsingError, TorrentFile
+from pynyaa._bencode import bdecode, bdecode_torrent
+
+
+def test_bdecode() -> None:
+    value = bdecode(b"d3:cow3:moo4:spaml1:ai-42eee")
+    assert isinstance(value, dict)
+    cow, spam = value[b"cow"], value[b"spam"]
+    assert isinstance(cow, memoryview)
+    assert cow.tobytes() == b"moo"
+    assert isinstance(spam, list)
+    assert len(spam) == 2
+    assert spam[1] == -42
+    assert bdecode(b"i-42e") == -42
+    assert bdecode(b"i0e") == 0
+    assert bdecode(b"le") == []
+    assert bdecode(b"de") == {}
+
+
+def test_bdecode_is_zero_copy() -> None:
+    data = b"d6:pieces40:" + bytes(40) + b"e"
+    value = bdecode(data)
+    assert isinstance(value, dict)
+    pieces = value[b"pieces"]
+    assert isinstance(pieces, memoryview)
+    assert pieces.obj is data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"i42",
+        b"i-0e",
+        b"i03e",
+        b"ie",
+        b"5:abc",
+        b"l",
+        b"d1:a",
+        b"di1ei2ee",
+        b"x",
+        b"i1ei2e",
+        pytest.param(b"l" * 100_000 + b"e" * 100_000, id="too-deep"),
+    ],
+)
+def test_bdecode_errors(data: bytes) -> None:
+    with pytest.raises(ParsingError, match="Invalid bencode data"):
+        bdecode(data)
+
+
+def test_bdecode_torrent() -> None:
+    info = b"d6:lengthi5e4:name5:a.txt12:piece lengthi16384e6:pieces20:" + bytes(20) + b"7:privatei1ee"
+    data = b"d8:announce14:http://tracker4:info" + info + b"e"
+    metainfo, raw_info = bdecode_torrent(data)
+    assert metainfo.keys() == {b"announce", b"info"}
+    assert raw_info.tobytes() == info
+
+    with pytest.raises(ParsingError, match="missing the 'info' dictionary"):
+        bdecode_torrent(b"d8:announce14:http://trackere")
+
+
+def test_torrent_file_metainfo() -> None:
+    info = (
+        b"d5:filesl"
+        b"d6:lengthi3e4:pathl3:sub5:a.txtee"
+        b"d4:attr1:p6:lengthi13e4:pathl4:.pad2:13ee"
+        b"d6:lengthi4e4:pathl5:b.txtee"
+        b"e4:name4:root12:piece lengthi16e6:pieces20:" + bytes(20) + b"e"
+    )
+    data = b"d8:announce3:foo13:announce-listll3:fooel3:bar3:fooee4:info" + info + b"e"
+    torrent = TorrentFile(name="root.torrent", data=data, size=7, infohash="", url="", magnet="")
+
+    assert torrent.files[0].path == "root/sub/a.txt"
+    assert [str(file) for file in torrent.files] == ["root/sub/a.txt", "root/b.txt"]
+    assert torrent.total_size == 7
+    assert torrent.piece_length == 16
+    assert torrent.piece_count == 1
+    assert torrent.trackers == ("foo", "bar")
+    assert torrent.is_private is False
+    assert torrent.computed_infohash == hashlib.sha1(info).hexdigest()
+
+
+def test_torrent_file_metainfo_errors() -> None:
+    torrent = TorrentFile(name="bad.torrent", data=b"not a torrent", size=0, infohash="", url="", magnet="")
+    with pytest.raises(ParsingError):
+        _ = torrent.files
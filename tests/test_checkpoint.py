@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pynyaa._checkpoint import Checkpoint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "crawl.checkpoint"
+    ids = range(100, 1_000_100, 3)
+    checkpoint = Checkpoint(path, ids)
+    checkpoint.add(100)
+    checkpoint.add(103, missing=True)
+    checkpoint.add(1_000_099)
+    checkpoint.save()
+
+    assert path.stat().st_size == 32 + 2 * 41_667
+    loaded = Checkpoint(path, ids)
+    assert 100 in loaded
+    assert 103 in loaded
+    assert 106 not in loaded
+    assert 101 not in loaded  # Not in the range
+    assert "100" not in loaded
+    assert list(loaded.missing()) == [103]
+    pending = loaded.pending()
+    assert [next(pending), next(pending)] == [106, 109]
+    assert sum(1 for _ in pending) == len(ids) - 5
+
+
+def test_checkpoint_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "crawl.checkpoint"
+    path.write_bytes(b"not a checkpoint")
+    with pytest.raises(ValueError, match="is not a crawl checkpoint"):
+        Checkpoint(path, range(10))
+
+    path.unlink()
+    Checkpoint(path, range(10)).save()
+    with pytest.raises(ValueError, match=r"is a checkpoint for range\(0, 10\), not range\(0, 20\)"):
+        Checkpoint(path, range(20))
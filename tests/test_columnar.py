@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pynyaa import Category, ReleaseCollector
+
+from .conftest import make_release
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def collector() -> ReleaseCollector:
+    collector = ReleaseCollector()
+    collector.extend(
+        [
+            make_release(1, submitter="smol"),
+            make_release(2, submitter=None, category=Category.AUDIO_LOSSLESS, is_remake=True),
+            make_release(3, submitter="motbob", seeders=99),
+            make_release(4, submitter="smol", datetime=dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)),
+        ]
+    )
+    return collector
+
+
+def test_collector(collector: ReleaseCollector) -> None:
+    assert len(collector) == 4
+    assert collector.submitters == ("smol", "motbob")
+    assert collector.categories == tuple(Category)
+
+
+def test_to_numpy(collector: ReleaseCollector) -> None:
+    np = pytest.importorskip("numpy")
+    columns = collector.to_numpy()
+    assert columns["id"].tolist() == [1, 2, 3, 4]
+    assert columns["seeders"].tolist() == [10, 10, 99, 10]
+    assert columns["submitter"].tolist() == [0, -1, 1, 0]
+    assert [collector.categories[code] for code in columns["category"]] == [
+        Category.ANIME_ENGLISH_TRANSLATED,
+        Category.AUDIO_LOSSLESS,
+        Category.ANIME_ENGLISH_TRANSLATED,
+        Category.ANIME_ENGLISH_TRANSLATED,
+    ]
+    assert columns["is_remake"].tolist() == [False, True, False, False]
+    assert columns["datetime"][3] == np.datetime64("2024-01-01T00:00:00")
+    assert columns["title"][0] == "[smol] Release 1"
+
+
+def test_to_arrow(collector: ReleaseCollector, tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    table = collector.to_arrow()
+    assert table.num_rows == 4
+    assert table.column("id").to_pylist() == [1, 2, 3, 4]
+    assert table.column("submitter").to_pylist() == ["smol", None, "motbob", "smol"]
+    assert table.column("category").to_pylist()[1] == "Audio - Lossless"
+    assert table.column("datetime").to_pylist()[3] == dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    assert table.column("is_trusted").to_pylist() == [False] * 4
+    del table
+
+    collector.append(make_release(5))  # Buffers can grow again once exports are released
+    path = tmp_path / "releases.parquet"
+    collector.write_parquet(path)
+    assert pq.read_table(path).column("id").to_pylist() == [1, 2, 3, 4, 5]
+
+
+def test_append_while_exported(collector: ReleaseCollector) -> None:
+    pytest.importorskip("numpy")
+    seeders = collector.to_numpy()["seeders"]  # Only this column still has an exported view
+    with pytest.raises(BufferError):
+        collector.append(make_release(5, submitter="new"))
+    # Nothing was added, not even to the columns before the exported one.
+    assert len(collector) == 4
+    assert "new" not in collector.submitters
+    assert {len(column) for column in collector.to_numpy().values()} == {4}
+    del seeders
+
+    collector.append(make_release(5, submitter="new"))
+    columns = collector.to_numpy()
+    assert {len(column) for column in columns.values()} == {5}
+    assert columns["submitter"].tolist() == [0, -1, 1, 0, 2]
+    assert collector.submitters == ("smol", "motbob", "new")
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime as dt
+
+from pynyaa import Category, CompactRelease
+
+from .conftest import make_release
+
+
+def test_compact_release() -> None:
+    release = make_release(1755409, category=Category.AUDIO_LOSSY)
+    compact = CompactRelease.from_release(release, base_url="https://nyaa.si/")
+
+    assert str(compact) == release.title
+    assert compact.base_url == "https://nyaa.si/"
+    assert compact.url == release.url == "https://nyaa.si/view/1755409"
+    assert compact.torrent_url == release.torrent.url
+    assert CompactRelease.from_release(release, base_url="https://mirror.example/").url == (
+        "https://mirror.example/view/1755409"
+    )
+    assert compact.category is Category.AUDIO_LOSSY
+    assert compact.datetime == release.datetime == dt.datetime(2023, 12, 14, 9, 6, 18, tzinfo=dt.timezone.utc)
+    assert compact.submitter is release.submitter
+
+    expanded = compact.to_release()
+    assert expanded.torrent.data is None
+    assert expanded == dataclasses.replace(release, torrent=dataclasses.replace(release.torrent, data=None))
+
+
+def test_compact_release_magnet() -> None:
+    magnet = (
+        "magnet:?xt=urn:btih:ad596c24e64424aa6fe02c04c20eb25e57dbb042"
+        "&dn=%5Bsmol%5D%20Shelter%20%282016%29"
+        "&tr=http%3A%2F%2Fnyaa.tracker.wf%3A7777%2Fannounce"
+        "&tr=udp%3A%2F%2Fopen.stealth.si%3A80%2Fannounce"
+    )
+    torrent = make_release().torrent
+    first, second = (
+        CompactRelease.from_release(
+            make_release(
+                id,
+                title="[smol] Shelter (2016)",
+                torrent=dataclasses.replace(
+                    torrent, infohash="ad596c24e64424aa6fe02c04c20eb25e57dbb042", magnet=magnet
+                ),
+            ),
+            base_url="https://nyaa.si/",
+        )
+        for id in (1, 2)
+    )
+    assert first.trackers == ("http://nyaa.tracker.wf:7777/announce", "udp://open.stealth.si:80/announce")
+    assert first.trackers is second.trackers
+    assert first.magnet == magnet
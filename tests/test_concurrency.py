@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pynyaa._concurrency import agather
+
+
+async def test_agather() -> None:
+    async def identity(value: int) -> int:
+        await asyncio.sleep(0)
+        return value
+
+    assert await agather(*(identity(value) for value in range(3))) == [0, 1, 2]
+
+
+async def test_agather_cancels_siblings() -> None:
+    finished: list[str] = []
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(60)
+        finally:
+            finished.append("slow")
+
+    async def failing() -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await agather(slow(), failing())
+    # The sibling has already been cancelled and has run its cleanup.
+    assert finished == ["slow"]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from pynyaa._mirrors import MirrorPool
+
+
+def test_mirror_pool_latency() -> None:
+    pool = MirrorPool(["https://a/", "https://b/", "https://a/"])
+    assert pool.mirrors == ("https://a/", "https://b/")
+    assert pool.ranked() == ["https://a/", "https://b/"]
+
+    for mirror, elapsed in (("https://a/", 0.5), ("https://b/", 0.2)):
+        pool.begin(mirror)
+        pool.end(mirror, elapsed)
+    assert pool.ranked() == ["https://b/", "https://a/"]
+
+    # Load is spread out: a busy mirror ranks behind a slower idle one.
+    pool.begin("https://b/")
+    pool.begin("https://b/")
+    assert pool.ranked() == ["https://a/", "https://b/"]
+    pool.end("https://b/", 0.2)
+    pool.end("https://b/", 0.2)
+
+    # The average moves towards new samples without jumping to them.
+    pool.begin("https://b/")
+    pool.end("https://b/", 1.0)
+    assert pool.ranked() == ["https://b/", "https://a/"]
+
+
+def test_mirror_pool_failure() -> None:
+    now = 0.0
+    pool = MirrorPool(["https://a/", "https://b/"], clock=lambda: now)
+    pool.begin("https://a/")
+    pool.end("https://a/", None)
+    assert pool.ranked() == ["https://b/", "https://a/"]
+
+    now = 5.0  # Cooldown over
+    assert pool.ranked() == ["https://a/", "https://b/"]
+
+    pool.begin("https://a/")
+    pool.end("https://a/", None)
+    now = 14.0  # The second consecutive failure doubles the cooldown
+    assert pool.ranked() == ["https://b/", "https://a/"]
+    now = 15.0
+    assert pool.ranked() == ["https://a/", "https://b/"]
+
+
+def test_mirror_pool_normalizes_mirrors() -> None:
+    pool = MirrorPool(["https://a", "https://b/nyaa", "https://a/"])
+    assert pool.mirrors == ("https://a/", "https://b/nyaa/")
+
+
+def test_mirror_pool_abandon() -> None:
+    pool = MirrorPool(["https://a/", "https://b/"])
+    pool.begin("https://a/")
+    pool.end("https://a/", 0.2)
+    pool.begin("https://b/")
+    pool.end("https://b/", 0.5)
+
+    # An abandoned request frees its slot without counting as a failure.
+    pool.begin("https://a/")
+    pool.abandon("https://a/")
+    assert pool.ranked() == ["https://a/", "https://b/"]
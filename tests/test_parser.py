@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pynyaa import Category, SearchResult
+from pynyaa._parser import ReleasePageReader, SearchPageParser, TorrentFragmentParser, decode
+
+from .conftest import search_page
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pynyaa._parser import Markup
+
+SEARCH_PAGE = """
+<table class="table torrent-list"><tbody>
+<tr class="default"><td colspan="2">
+<a href="/view/1755409#comments" class="comments" title="1 comment">1</a>
+<a href="/view/1755409" title="[smol] Shelter (2016)">[smol] Shelter (2016)</a>
+</td></tr>
+<tr class="success"><td colspan="2">
+<a href="/view/1544043" title="[MTBB] Cowboy Bebop ★">[MTBB] Cowboy Bebop ★</a>
+</td></tr>
+</tbody></table>
+<ul class="pagination">
+<li class="active"><a href="#">1</a></li>
+<li><a href="/?p=2">2</a></li>
+<li class="next"><a href="/?p=2">&raquo;</a></li>
+</ul>
+"""
+
+TORRENT_PAGE = """
+<div class="panel panel-success">
+<div class="panel-heading"><h3 class="panel-title">Ünïcödé ★</h3></div>
+</div><!--/.panel -->
+<div class="panel panel-default">
+<div markdown-text class="panel-body" id="torrent-description">Déscription &amp; more</div>
+</div>
+"""
+
+CONVERSIONS: list[Callable[[str], Markup]] = [
+    str,
+    str.encode,
+    lambda html: bytearray(html.encode()),
+    lambda html: memoryview(html.encode()),
+]
+
+
+@pytest.mark.parametrize("convert", CONVERSIONS)
+def test_search_page_parser_markup(convert: Callable[[str], Markup]) -> None:
+    parsed = SearchPageParser(convert(SEARCH_PAGE))
+    assert list(parsed.results()) == [1755409, 1544043]
+    assert list(parsed.pages()) == [1, 2]
+    # Extracted up front, so they can be iterated again without the page.
+    assert list(parsed.results()) == [1755409, 1544043]
+    assert list(parsed.pages()) == [1, 2]
+    assert parsed.has_next() is True
+
+
+@pytest.mark.parametrize("convert", CONVERSIONS)
+def test_torrent_fragment_parser_markup(convert: Callable[[str], Markup]) -> None:
+    parsed = TorrentFragmentParser(html=convert(TORRENT_PAGE), base_url="https://nyaa.si/")
+    assert parsed.panel.title() == "Ünïcödé ★"
+    assert parsed.is_trusted() is True
+    assert parsed.description() == "Déscription & more"
+
+
+def test_search_page_parser_results_scope() -> None:
+    # Minified, with a release link outside the results table.
+    html = '<a href="/view/1" title="x">x</a>' + "".join(line.strip() for line in SEARCH_PAGE.splitlines())
+    assert list(SearchPageParser(html).results()) == [1755409, 1544043]
+    assert list(SearchPageParser("<h3>No results found</h3>").results()) == []
+
+
+def test_decode() -> None:
+    assert decode("★") == "★"
+    assert decode("★".encode()) == "★"
+    assert decode(memoryview("★".encode())) == "★"
+    assert decode(b"\xff") == "�"
+
+
+def test_search_page_parser_rows() -> None:
+    html = search_page([2, 3])
+    assert list(SearchPageParser(html).rows()) == []  # Only read when asked for
+
+    parsed = SearchPageParser(html, base_url="https://nyaa.si/")
+    assert list(parsed.results()) == [2, 3]
+    assert parsed.has_next() is False  # The next link of the last page is disabled
+    trusted, default = parsed.rows()
+    assert trusted == SearchResult(
+        id=2,
+        url="https://nyaa.si/view/2",
+        title="Release 2 & co",
+        category=Category.ANIME_ENGLISH_TRANSLATED,
+        datetime=dt.datetime.fromtimestamp(1_700_000_002, tz=dt.timezone.utc),
+        size=2 * 1024**2,
+        seeders=2,
+        leechers=0,
+        completed=0,
+        comments=1,
+        is_trusted=True,
+        is_remake=False,
+        torrent_url="https://nyaa.si/download/2.torrent",
+        infohash=f"{2:040x}",
+        magnet=f"magnet:?xt=urn:btih:{2:040x}&dn=Release",
+    )
+    assert str(trusted) == "Release 2 & co"
+    assert default.is_trusted is False
+
+
+@pytest.mark.parametrize("size", [1, 7, 1000])
+def test_release_page_reader(size: int) -> None:
+    page = (
+        TORRENT_PAGE.encode()
+        + b'<div class="torrent-file-list panel-body"><ul></ul></div>\n</div><!--/.panel -->\n'
+        + b'<div id="comments"></div>'
+    )
+    chunks = [page[start : start + size] for start in range(0, len(page), size)]
+    marker = b"<!--/.panel -->"
+    for panel_only, end in ((False, page.rindex(marker) + len(marker)), (True, page.index(marker) + len(marker))):
+        reader = ReleasePageReader(panel_only=panel_only)
+        fed = 0
+        while not reader.feed(chunks[fed]):
+            fed += 1
+        # Markers split between chunks are found too, and nothing past the chunk completing the page is read.
+        assert len(reader) == min(-(-end // size) * size, len(page))
+        assert reader.html() == page[: len(reader)]
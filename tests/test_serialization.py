@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from pynyaa import NyaaRelease, Submitter, TorrentFile, dump_jsonl, dump_msgpack, load_jsonl, load_msgpack
+
+from .conftest import make_release
+
+
+def test_to_dict_round_trip() -> None:
+    release = make_release(submitter="smol")
+    data = release.to_dict()
+    assert data["category"] == "1_2"
+    assert data["datetime"] == "2023-12-14T09:06:18+00:00"
+    assert data["submitter"] == {
+        "name": "smol",
+        "url": "https://nyaa.si/user/smol",
+        "is_trusted": False,
+        "is_banned": False,
+    }
+    assert data["torrent"]["data"] == release.torrent.data
+    assert NyaaRelease.from_dict(data) == release
+
+    anonymous = make_release(submitter=None)
+    assert NyaaRelease.from_dict(anonymous.to_dict()) == anonymous
+    assert Submitter.from_dict(release.submitter.to_dict()) == release.submitter  # type: ignore[union-attr]
+
+
+def test_torrent_data_formats() -> None:
+    torrent = make_release().torrent
+    assert torrent.to_dict(data="base64")["data"] == "ZDQ6aW5mb2Q0Om5hbWUxOmFlZQ=="
+    assert TorrentFile.from_dict(torrent.to_dict(data="base64")) == torrent
+    assert torrent.to_dict(data="exclude")["data"] is None
+    excluded = TorrentFile.from_dict(torrent.to_dict(data="exclude"))
+    assert excluded.data is None
+    assert excluded.path is None
+    with pytest.raises(ValueError, match="serialized with data='exclude'"):
+        excluded.files  # noqa: B018
+
+
+def test_jsonl() -> None:
+    releases = [make_release(1), make_release(2, submitter=None)]
+    file = io.StringIO()
+    assert dump_jsonl(releases, file) == 2
+
+    lines = file.getvalue().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["id"] == 1
+
+    file.seek(0)
+    assert list(load_jsonl(file)) == releases
+
+    file = io.StringIO()
+    dump_jsonl(releases, file, torrent_data="exclude")
+    file.seek(0)
+    assert [release.torrent.data for release in load_jsonl(file)] == [None, None]
+
+    with pytest.raises(ValueError, match="JSON cannot represent raw bytes"):
+        dump_jsonl(releases, io.StringIO(), torrent_data="include")
+
+
+def test_msgpack() -> None:
+    pytest.importorskip("msgpack")
+    releases = [make_release(1), make_release(2, submitter=None)]
+    file = io.BytesIO()
+    assert dump_msgpack(releases, file) == 2
+    file.seek(0)
+    assert list(load_msgpack(file)) == releases
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pynyaa import ParsingError, TorrentFile, TorrentStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+INFO = b"d6:lengthi5e4:name5:a.txt12:piece lengthi16384e6:pieces20:" + bytes(20) + b"e"
+TORRENT = b"d8:announce14:http://tracker4:info" + INFO + b"e"
+INFOHASH = hashlib.sha1(INFO).hexdigest()
+
+
+def test_torrent_store_writer(tmp_path: Path) -> None:
+    store = TorrentStore(tmp_path)
+    with store.writer(INFOHASH.upper()) as file:
+        file.write(TORRENT[:10])
+        file.write(TORRENT[10:])
+    assert INFOHASH in store
+    assert store.path(INFOHASH).read_bytes() == TORRENT
+    for other in ("foo", INFOHASH[:-1], 1):
+        assert other not in store
+    with pytest.raises(ValueError, match="Invalid infohash: 'foo'"):
+        store.path("foo")
+
+    with store.writer(INFOHASH) as file:  # Already stored, the existing copy is kept
+        file.write(TORRENT)
+    assert [path.name for path in tmp_path.rglob("*") if path.is_file()] == [f"{INFOHASH}.torrent"]
+
+
+@pytest.mark.parametrize(
+    ("data", "match"),
+    [
+        (TORRENT[:-1], "Invalid bencode data"),
+        (b"", "is empty"),
+        (TORRENT.replace(b"a.txt", b"b.txt"), f"expected {INFOHASH}"),
+    ],
+    ids=["truncated", "empty", "mismatched"],
+)
+def test_torrent_store_writer_rejects(tmp_path: Path, data: bytes, match: str) -> None:
+    store = TorrentStore(tmp_path)
+    with pytest.raises(ParsingError, match=match), store.writer(INFOHASH) as file:
+        file.write(data)
+    assert INFOHASH not in store
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+def test_torrent_store_writer_exception(tmp_path: Path) -> None:
+    store = TorrentStore(tmp_path)
+    with pytest.raises(RuntimeError), store.writer(INFOHASH) as file:
+        file.write(TORRENT)
+        raise RuntimeError
+    assert not any(path.is_file() for path in tmp_path.rglob("*"))
+
+
+def test_torrent_file_from_store(tmp_path: Path) -> None:
+    store = TorrentStore(tmp_path)
+    with store.writer(INFOHASH) as file:
+        file.write(TORRENT)
+    torrent = TorrentFile(
+        name="a.torrent", data=None, size=5, infohash=INFOHASH, url="", magnet="", path=store.path(INFOHASH)
+    )
+    assert torrent.computed_infohash == INFOHASH
+    assert torrent.total_size == 5
+
+    store.path(INFOHASH).write_bytes(TORRENT[:-1])  # Corrupted after it was stored
+    corrupted = dataclasses.replace(torrent)
+    with pytest.raises(ParsingError, match="Invalid bencode data"):
+        corrupted.files  # noqa: B018
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from pynyaa import LazyRelease, Nyaa
+
+from .conftest import SearchTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@pytest.fixture(scope="module")
+def vcr_cassette_dir() -> str:
+    return str(Path(__file__).parent / "cassettes" / "test_sync")
+
+
+@pytest.fixture
+def frequent_switches() -> Iterator[None]:
+    """Switch threads as often as possible, so that races show up even with the GIL."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_get_many_threads() -> None:
+    search = SearchTransport([])
+    # Only passed once two release pages are requested at the same time.
+    barrier = threading.Barrier(2, timeout=5)
+    threads: set[str] = set()
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        threads.add(threading.current_thread().name)
+        if request.url.path in {"/view/1", "/view/2"}:
+            barrier.wait()
+        return search.respond(request)
+
+    with Nyaa(mirrors=["https://mirror.example/"], client=httpx.Client(transport=httpx.MockTransport(respond))) as nyaa:
+        releases = list(nyaa.get_many(range(1, 51), concurrency=4, lazy=True))
+        assert [release.id for release in releases] == list(range(1, 51))
+        assert nyaa.transfer_stats.responses == 100
+    assert len(threads) > 1
+    assert all(name.startswith("pynyaa") for name in threads)
+
+
+@pytest.mark.vcr("test_nyaa_default.yaml", allow_playback_repeats=True)
+@pytest.mark.usefixtures("frequent_switches")
+def test_lazy_release_threads(nyaa_client: Nyaa) -> None:
+    eager = nyaa_client.get(1755409)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(20):
+            lazy = nyaa_client.get(1755409, lazy=True)
+            releases = list(executor.map(LazyRelease.to_release, [lazy] * 8))
+            assert releases == [eager] * 8
+            assert all(release.submitter is eager.submitter for release in releases)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from pynyaa import AsyncNyaa, Category, Nyaa, ParentCategory, make_magnet
+from pynyaa._utils import accept_encoding, client_options, subcategories
+
+
+def test_make_magnet() -> None:
+    assert make_magnet("ad596c24e64424aa6fe02c04c20eb25e57dbb042", "[smol] Shelter (2016)") == (
+        "magnet:?xt=urn:btih:ad596c24e64424aa6fe02c04c20eb25e57dbb042&dn=%5Bsmol%5D%20Shelter%20%282016%29"
+    )
+    assert make_magnet("ad596c24e64424aa6fe02c04c20eb25e57dbb042", "a&b", ["udp://open.stealth.si:80/announce"]) == (
+        "magnet:?xt=urn:btih:ad596c24e64424aa6fe02c04c20eb25e57dbb042&dn=a%26b&tr=udp%3A%2F%2Fopen.stealth.si%3A80%2Fannounce"
+    )
+
+
+def test_subcategories() -> None:
+    assert len(subcategories(ParentCategory.ALL)) == 6
+    assert subcategories(ParentCategory.AUDIO) == (Category.AUDIO_LOSSLESS, Category.AUDIO_LOSSY)
+    assert subcategories(Category.AUDIO_LOSSY) == ()
+
+
+def test_client_options() -> None:
+    options = client_options(max_connections=16, keepalive_expiry=None, http2=False, timeout=10.0)
+    assert options["limits"] == httpx.Limits(max_connections=16, max_keepalive_connections=16, keepalive_expiry=None)
+    assert options["timeout"] == httpx.Timeout(10.0, pool=None)
+
+    timeout = httpx.Timeout(10.0, connect=2.0)
+    assert client_options(max_connections=1, keepalive_expiry=5.0, http2=False, timeout=timeout)["timeout"] is timeout
+
+    with pytest.raises(ValueError, match="must be a positive integer"):
+        client_options(max_connections=0, keepalive_expiry=5.0, http2=False, timeout=None)
+
+
+def test_client_options_http2(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("pynyaa._utils.find_spec", lambda name: None)
+    with pytest.raises(ImportError, match=r"pip install pynyaa\[http2\]"):
+        Nyaa(http2=True)
+    with pytest.raises(ImportError, match=r"pip install pynyaa\[http2\]"):
+        AsyncNyaa(http2=True)
+
+
+def test_accept_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("pynyaa._utils.find_spec", lambda name: None)
+    assert accept_encoding() == "gzip"
+    monkeypatch.setattr("pynyaa._utils.find_spec", lambda name: name if name in {"zstandard", "brotlicffi"} else None)
+    assert accept_encoding() == "zstd, br, gzip"